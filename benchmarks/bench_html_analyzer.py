@@ -0,0 +1,164 @@
+"""
+Benchmark of HTMLAnalyzer's structure and issue checks on a large page
+
+Compares the single-pass DOM walker with the previous implementation,
+which ran one find()/find_all() traversal per heading level, landmark
+and ARIA attribute plus label and id lookups per form field, and checks that both
+produce the same analysis and issues. The legacy checks are quadratic in
+the number of labelled inputs and take minutes on the default page; pass
+--no-legacy to time the walker alone.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_html_analyzer.py [--elements 50000] [--repeat 3] [--no-legacy]
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from a11y.wcag.dom_walker import walk_dom
+from a11y.wcag.wcag_analyzers import HTMLAnalyzer
+
+
+def build_page(elements: int) -> str:
+    """A page of roughly `elements` elements with headings, landmarks, ARIA and forms"""
+    blocks = []
+    # Each block contributes 10 elements
+    for i in range(elements // 10):
+        blocks.append(
+            f'<section aria-label="s{i}">'
+            f'<h{i % 6 + 1}>Heading {i}</h{i % 6 + 1}>'
+            f'<nav role="navigation"><a href="/p{i}">Link</a></nav>'
+            f'<p aria-describedby="d{i}">Text <span id="d{i}">more</span></p>'
+            f'<label for="in{i}">Name</label><input id="in{i}" type="text">'
+            f'<input type="email" name="e{i}"><aside></aside>'
+            f'</section>'
+        )
+    return (
+        '<!DOCTYPE html><html lang="en"><head><title>Bench</title>'
+        '<meta charset="utf-8"><meta name="viewport" content="width=device-width"></head>'
+        f'<body><header></header><main>{"".join(blocks)}</main><footer></footer></body></html>'
+    )
+
+
+def legacy_selector(element) -> str:
+    """The parent walk HTMLAnalyzer used before the selector service"""
+    selector_parts = []
+    while element and element.name:
+        if element.get('id'):
+            selector_parts.append(f"#{element['id']}")
+            break
+        elif element.get('class'):
+            selector_parts.append(f"{element.name}.{'.'.join(element['class'])}")
+        else:
+            selector_parts.append(element.name)
+        element = element.parent
+    return ' '.join(reversed(selector_parts))
+
+
+def without_selectors(result):
+    analysis, issues = result
+    return analysis, [{k: v for k, v in issue.items() if k != "selector"} for issue in issues]
+
+
+class LegacyHTMLAnalyzer(HTMLAnalyzer):
+    """The find()/find_all() based checks the walker replaced"""
+
+    def run(self, soup):
+        analysis = {
+            "doctype": bool(soup.find('doctype')),
+            "lang_attribute": bool(soup.find('html', attrs={'lang': True})),
+            "head_elements": {
+                "title": bool(soup.find('title')),
+                "meta_viewport": bool(soup.find('meta', attrs={'name': 'viewport'})),
+                "meta_charset": bool(soup.find('meta', attrs={'charset': True}))
+            },
+            "headings": {f"h{i}": len(soup.find_all(f'h{i}')) for i in range(1, 7)},
+            "landmarks": {
+                tag: len(soup.find_all(tag))
+                for tag in ("header", "nav", "main", "footer", "article", "aside")
+            },
+            "aria": {
+                "role_attributes": len(soup.find_all(attrs={'role': True})),
+                "aria_labelledby": len(soup.find_all(attrs={'aria-labelledby': True})),
+                "aria_label": len(soup.find_all(attrs={'aria-label': True})),
+                "aria_describedby": len(soup.find_all(attrs={'aria-describedby': True}))
+            }
+        }
+        issues = [issue for issue in self._check_for_issues(walk_dom(BeautifulSoup("", "html.parser")), analysis)
+                  if issue["type"] != "form_labels"]
+        fields = [
+            field for field in soup.find_all(['input', 'select', 'textarea'])
+            if field.name != 'input'
+            or str(field.get('type', 'text')).lower() not in ('hidden', 'button', 'submit', 'reset', 'image')
+        ]
+        for input_field in fields:
+            label = input_field.find_parent('label')
+            labelled = (
+                (label is not None and label.get('for') in (None, input_field.get('id')))
+                or (input_field.get('id') and soup.find('label', {'for': input_field['id']}))
+                or (input_field.get('aria-label') or '').strip()
+                or any(soup.find(id=ref) for ref in (input_field.get('aria-labelledby') or '').split())
+            )
+            if not labelled:
+                issues.append({
+                    "type": "form_labels",
+                    "level": "error",
+                    "message": "Input field missing label or aria-label",
+                    "wcag": ["WCAG1.3.1", "WCAG3.3.2"],
+                    "context": str(input_field),
+                    "selector": legacy_selector(input_field)
+                })
+        return analysis, issues
+
+
+class WalkerHTMLAnalyzer(HTMLAnalyzer):
+    def run(self, soup):
+        stats = walk_dom(soup)
+        analysis = self._analyze_structure(stats)
+        return analysis, self._check_for_issues(stats, analysis)
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--elements", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-legacy", action="store_true", help="skip the find()/find_all() baseline")
+    args = parser.parse_args()
+
+    html = build_page(args.elements)
+    soup = BeautifulSoup(html, "html.parser")
+    logger = logging.getLogger("bench")
+    legacy = LegacyHTMLAnalyzer(Path("."), logger)
+    walker = WalkerHTMLAnalyzer(Path("."), logger)
+
+    elements = len(soup.find_all(True))
+    walker_time, walker_result = best_of(args.repeat, walker.run, soup)
+    print(f"elements:        {elements}")
+    print(f"form issues:     {len(walker_result[1])}")
+    print(f"single pass:     {walker_time * 1000:8.1f} ms")
+    if args.no_legacy:
+        return
+
+    legacy_time, legacy_result = best_of(args.repeat, legacy.run, soup)
+    # Selectors differ by design: the service emits unique ones
+    assert without_selectors(walker_result) == without_selectors(legacy_result), \
+        "walker output differs from the legacy checks"
+    print(f"find/find_all:   {legacy_time * 1000:8.1f} ms")
+    print(f"speedup:         {legacy_time / walker_time:8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Peak memory of tree-based versus streamed HTMLAnalyzer checks
+
+Analyses synthetic pages of growing size once with a BeautifulSoup tree
+and once with HTMLStream fed in chunks, and reports time and the
+tracemalloc peak of each. The source string itself is excluded from the
+peak, as a streamed response never holds it in full.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_html_stream.py [--elements 5000 50000 200000]
+"""
+
+import argparse
+import logging
+import time
+import tracemalloc
+from pathlib import Path
+
+from bench_html_analyzer import build_page
+
+from a11y.wcag.html_stream import HTMLStream
+from a11y.wcag.wcag_analyzers import HTMLAnalyzer
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--elements", type=int, nargs="+", default=[5000, 50000, 200000])
+    args = parser.parse_args()
+
+    analyzer = HTMLAnalyzer(Path("."), logging.getLogger("bench"))
+
+    def streamed(html):
+        stream = HTMLStream()
+        analyzer._feed_text(stream, html)
+        return analyzer._analyze_stream(stream)
+
+    print(f"{'elements':>10} {'size':>9} {'tree':>20} {'stream':>20}")
+    for elements in args.elements:
+        html = build_page(elements)
+        tree_time, tree_peak, (tree_analysis, _) = measure(analyzer._analyze_html, html)
+        stream_time, stream_peak, (stream_analysis, _) = measure(streamed, html)
+        assert tree_analysis == stream_analysis, "streamed analysis differs from the tree"
+        print(f"{elements:>10} {len(html) / 2**20:7.1f}MB "
+              f"{tree_time:7.2f}s {tree_peak / 2**20:8.1f}MB "
+              f"{stream_time:7.2f}s {stream_peak / 2**20:8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Parse and check throughput of HTMLAnalyzer per parser backend
+
+Runs the HTMLAnalyzer pipeline (parse, single-pass walk, checks) on a set
+of pages with every installed backend. It reports parse and check time,
+throughput, and whether the analysis matches the one from the stdlib
+parser. Synthetic pages of three sizes are used unless HTML files are
+given.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_parsers.py [page.html ...] [--repeat 3]
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from bench_html_analyzer import build_page
+
+from a11y.wcag.dom_walker import walk_dom
+from a11y.wcag.html_parsing import available_parsers, parse_html
+from a11y.wcag.wcag_analyzers import HTMLAnalyzer
+
+SYNTHETIC_PAGES = {"article (500)": 500, "cms (5k)": 5000, "large (50k)": 50000}
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pages", nargs="*", type=Path, help="HTML files (default: synthetic pages)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = {path.name: path.read_text(encoding="utf-8", errors="replace") for path in args.pages}
+    else:
+        pages = {name: build_page(size) for name, size in SYNTHETIC_PAGES.items()}
+
+    analyzer = HTMLAnalyzer(Path("."), logging.getLogger("bench"))
+    backends = available_parsers()
+    print(f"{'page':<16}{'backend':<13}{'parse ms':>10}{'check ms':>10}{'MB/s':>8}  same analysis")
+    for name, html in pages.items():
+        megabytes = len(html.encode("utf-8")) / 1e6
+        reference = None
+        for backend in ["html.parser"] + [b for b in backends if b != "html.parser"]:
+            parse_time, soup = best_of(args.repeat, parse_html, html, backend)
+            check_time, stats = best_of(args.repeat, walk_dom, soup)
+            analysis = analyzer._analyze_structure(stats)
+            issues = analyzer._check_for_issues(stats, analysis)
+            if reference is None:
+                reference = analysis, len(issues)
+            total = parse_time + check_time
+            print(
+                f"{name:<16}{backend:<13}{parse_time * 1000:>10.1f}{check_time * 1000:>10.1f}"
+                f"{megabytes / total:>8.2f}  {(analysis, len(issues)) == reference}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Time-to-analysis with DOM-stability readiness versus the previous fixed waits
+
+Loads every URL once per strategy in a fresh Playwright context and reports
+the median and maximum time until analysis could start:
+
+    networkidle  page.goto(wait_until="networkidle"), as the axe worker did
+    fixed-wait   page.goto(wait_until="load") plus 1000 ms, as pa11y did
+    stable       page.goto(wait_until="domcontentloaded") plus the stability probe
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_readiness.py URL [URL ...] [--rounds 3]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from playwright.async_api import async_playwright
+
+from a11y.wcag.page_readiness import probe_expression
+
+TIMEOUT_MS = 60000
+
+
+async def networkidle(page, url):
+    await page.goto(url, wait_until="networkidle", timeout=TIMEOUT_MS)
+
+
+async def fixed_wait(page, url):
+    await page.goto(url, wait_until="load", timeout=TIMEOUT_MS)
+    await page.wait_for_timeout(1000)
+
+
+async def stable(page, url):
+    await page.goto(url, wait_until="domcontentloaded", timeout=TIMEOUT_MS)
+    return await page.evaluate(probe_expression())
+
+
+STRATEGIES = {"networkidle": networkidle, "fixed-wait": fixed_wait, "stable": stable}
+
+
+async def measure(browser, strategy, url):
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        started = time.perf_counter()
+        try:
+            await strategy(page, url)
+        except Exception as e:
+            # A timeout is what the slow strategy costs on that page
+            print(f"  {url}: {type(e).__name__}")
+        return time.perf_counter() - started
+    finally:
+        await context.close()
+
+
+async def run(urls, rounds):
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(args=["--no-sandbox"])
+        try:
+            print(f"{'strategy':<12} {'median':>9} {'max':>9}")
+            for name, strategy in STRATEGIES.items():
+                times = [await measure(browser, strategy, url) for _ in range(rounds) for url in urls]
+                print(f"{name:<12} {statistics.median(times):>8.2f}s {max(times):>8.2f}s")
+        finally:
+            await browser.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("urls", nargs="+")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.urls, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
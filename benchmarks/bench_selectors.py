@@ -0,0 +1,75 @@
+"""
+Selector construction for many reported elements
+
+Times the old per-element parent walk against SelectorService on a page
+with thousands of findings, flat (the analyzer benchmark page) or nested
+inside deep component wrappers as CMS templates produce them. Both are checked with soup.select() on a
+sample to show how many of their selectors match exactly one element.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_selectors.py [--elements 50000] [--depth 0] [--sample 500]
+"""
+
+import argparse
+import random
+import time
+
+from bs4 import BeautifulSoup
+
+from bench_html_analyzer import build_page, legacy_selector
+
+from a11y.wcag.dom_walker import walk_dom
+from a11y.wcag.selector_service import SelectorService
+
+
+def build_deep_page(elements: int, depth: int) -> str:
+    """Form rows nested `depth` wrappers deep, wrappers sharing their classes"""
+    rows = "".join(
+        f'<div class="row"><label>Field</label><input type="text" class="field"></div>'
+        for _ in range(20)
+    )
+    blocks = []
+    for _ in range(max(1, elements // (20 * 3 + depth))):
+        opening = "".join(f'<div class="wrapper level-{level}">' for level in range(depth))
+        blocks.append(f"{opening}<form>{rows}</form>{'</div>' * depth}")
+    return f'<html lang="en"><body><main>{"".join(blocks)}</main></body></html>'
+
+
+def unique_ratio(soup, elements, selector_for, sample):
+    picked = random.Random(0).sample(elements, min(sample, len(elements)))
+    unique = sum(1 for element in picked if soup.select(selector_for(element)) == [element])
+    return unique / len(picked)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--elements", type=int, default=50000)
+    parser.add_argument("--depth", type=int, default=0, help="nesting depth of the findings (0: flat page)")
+    parser.add_argument("--sample", type=int, default=500)
+    args = parser.parse_args()
+
+    html = build_deep_page(args.elements, args.depth) if args.depth else build_page(args.elements)
+    soup = BeautifulSoup(html, "lxml")
+    stats = walk_dom(soup)
+    findings = [field.element for field in stats.form_fields]
+
+    started = time.perf_counter()
+    legacy = [legacy_selector(element) for element in findings]
+    legacy_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    service = SelectorService(stats)
+    selectors = [service.selector(element) for element in findings]
+    service_time = time.perf_counter() - started
+
+    print(f"findings:          {len(findings)}")
+    print(f"parent walk:       {legacy_time * 1000:8.1f} ms, "
+          f"{unique_ratio(soup, findings, legacy_selector, args.sample):.0%} unique, "
+          f"{sum(map(len, legacy)) / len(legacy):.0f} chars")
+    print(f"selector service:  {service_time * 1000:8.1f} ms, "
+          f"{unique_ratio(soup, findings, service.selector, args.sample):.0%} unique, "
+          f"{sum(map(len, selectors)) / len(selectors):.0f} chars")
+
+
+if __name__ == "__main__":
+    main()
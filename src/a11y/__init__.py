@@ -1,11 +1,29 @@
 # src/__init__.py
-from .crew import WCAGTestingCrew
-from .wcag import UnifiedResultProcessor, WCAGIntegrationManager
+#
+# Exporte werden erst beim ersten Zugriff importiert: die Crew zieht CrewAI,
+# crewai_tools, Selenium und Browserbase nach, die Nicht-LLM-Einstiegspunkte
+# nicht brauchen.
+
+import importlib
 
 __version__ = "0.1.0"
 
+_EXPORTS = {
+    'WCAGTestingCrew': '.crew',
+    'UnifiedResultProcessor': '.wcag.unified_result_processor',
+    'WCAGIntegrationManager': '.wcag.wcag_integration_manager',
+}
+
 __all__ = [
     'WCAGTestingCrew',
     'UnifiedResultProcessor',
     'WCAGIntegrationManager'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(module, __name__), name)
+    return value
@@ -10,4 +10,28 @@ class TemplateError(ReportGenerationError):
 
 class DataValidationError(ReportGenerationError):
     """Fehler bei der Datenvalidierung"""
-    pass
\ No newline at end of file
+    pass
+
+class ToolExecutionError(Exception):
+    """Basisklasse für Fehler bei der Ausführung externer Testwerkzeuge"""
+    pass
+
+class AxeWorkerError(ToolExecutionError):
+    """Fehler im langlebigen Node.js Axe Worker"""
+    pass
+
+class ToolchainError(ToolExecutionError):
+    """Fehler beim Einrichten der Node.js Werkzeugkette"""
+    pass
+
+class BrowserPoolError(ToolExecutionError):
+    """Fehler im gemeinsamen Playwright-Browserpool"""
+    pass
+
+class Pa11yWorkerError(ToolExecutionError):
+    """Fehler im langlebigen Node.js Pa11y Worker"""
+    pass
+
+class CDPError(ToolExecutionError):
+    """Fehler auf einer DevTools-Protokollverbindung"""
+    pass
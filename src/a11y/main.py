@@ -1,5 +1,6 @@
 # src/main.py
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -9,7 +10,7 @@ import aiofiles
 from typing import Dict, Any
 from dotenv import load_dotenv
 
-from .crew import WCAGTestingCrew
+from . import __version__
 from .logging_config import get_logger
 from .utils import (
     _get_user_input,
@@ -41,8 +42,10 @@ class WCAGTestingCLI:
             self.logger.error(f"Failed to create test-content directory: {e}")
             sys.exit(1)
         
-        # Initialize components
+        # Initialize components; the crew pulls in CrewAI and its tools,
+        # so it is only imported once the CLI actually runs
         try:
+            from .crew import WCAGTestingCrew
             self.crew = WCAGTestingCrew()
             self.logger.info("All components initialized successfully")
         except Exception as e:
@@ -124,6 +127,10 @@ class WCAGTestingCLI:
 
 def main():
     """Entry point for the command line interface"""
+    parser = argparse.ArgumentParser(description=WCAGTestingCLI.__doc__)
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+    parser.parse_args()
+
     cli = WCAGTestingCLI()
     asyncio.run(cli.main())
 
@@ -0,0 +1,93 @@
+# src/tools/axe_cache.py
+
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = "output/tool_results/axe_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class AxeResultCache:
+    """
+    Size-bounded on-disk store of NDJSON axe results, addressed by content
+
+    The key is computed by the axe worker once a page has rendered: a hash
+    of the serialized DOM, the axe-core version and the sorted rule tags.
+    Each entry is a single <key>.ndjson file, so the worker can check for a
+    hit with a plain existence test before running axe. Entries are evicted
+    least recently used first (by mtime, refreshed on every hit) once the
+    directory grows beyond max_bytes.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir).resolve()
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger('AxeResultCache')
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.ndjson"
+
+    def restore(self, key: str, output_path: str) -> bool:
+        """
+        Copy a cached result to output_path
+
+        Returns:
+            False if the entry vanished (evicted in the meantime)
+        """
+        entry = self.path_for(key)
+        try:
+            shutil.copyfile(entry, output_path)
+            os.utime(entry)
+        except FileNotFoundError:
+            return False
+        self.logger.debug(f"Axe cache hit {key[:12]}")
+        return True
+
+    def store(self, key: str, results_path: str) -> None:
+        """Add a fresh result to the cache and evict old entries if needed"""
+        entry = self.path_for(key)
+        partial = entry.with_suffix(f".{os.getpid()}.{threading.get_ident()}.part")
+        try:
+            shutil.copyfile(results_path, partial)
+            os.replace(partial, entry)
+        except OSError as e:
+            self.logger.warning(f"Could not store axe result in cache: {e}")
+            partial.unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Delete least recently used entries until the cache fits max_bytes
+
+        Returns:
+            Number of evicted entries
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob("*.ndjson"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            evicted = 0
+            for _, size, path in sorted(entries):
+                if total <= limit:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+
+        if evicted:
+            self.logger.debug(f"Evicted {evicted} axe cache entries")
+        return evicted
@@ -1,9 +1,18 @@
 from crewai.tools import BaseTool
-from typing import Optional
-import json
+from pydantic import Field
+from typing import Any, Dict, List, Optional
+import asyncio
+import hashlib
 import os
-import subprocess
 import datetime
+from .axe_cache import AxeResultCache
+from .axe_digest import build_digest, count_tokens
+from .axe_incremental import AxeSegmentStore
+from .axe_profile import AxeProfileStore, host_of
+from .axe_results import AxeResultSummary
+from .axe_worker import get_shared_worker
+from ..errors.exceptions import AxeWorkerError
+from ..wcag.conformance_profile import ConformanceProfile
 
 class AxeCoreTool(BaseTool):
     name: str = "Axe Core Accessibility Tester"
@@ -13,159 +22,202 @@ class AxeCoreTool(BaseTool):
     at levels A, AA, and AAA, as well as best practices.
     """
 
+    output_dir: str = "output/tool_results"
+    # Rules to run; the default (AA plus best practices) matches the classic tag set
+    conformance: ConformanceProfile = Field(default_factory=ConformanceProfile)
+    # Results are reused while the rendered DOM, axe version and tags are unchanged
+    use_cache: bool = True
+    cache_dir: str = "output/tool_results/axe_cache"
+    cache_max_mb: int = 256
+    # Collect axe performanceTimer data per rule and phase (adds overhead)
+    timing_profile: bool = False
+    # Rule ids to skip per host, e.g. slow rules found via AxeProfileStore.slow_rules()
+    disabled_rules: Dict[str, List[str]] = {}
+    # Re-audit only changed page segments and merge with the previous scan
+    incremental_rescans: bool = False
+    incremental_dir: str = "output/tool_results/axe_incremental"
+    # Approximate upper bound for the summary handed to the agent, in tokens
+    token_budget: int = 2000
+
     def _run(self, url: str) -> str:
         """Execute Axe Core accessibility tests."""
-        script_path = "run_axe.js"
         try:
             # Create output directory if it doesn't exist
-            output_dir = "output/tool_results"
-            os.makedirs(output_dir, exist_ok=True)
+            os.makedirs(self.output_dir, exist_ok=True)
             
             # Create output filename with timestamp
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = os.path.join(output_dir, f"axe_results_{timestamp}.json")
+            output_path = self._output_path(url, timestamp)
             
-            # Create Node.js script for running axe-core
-            script_content = f"""
-            const axeCore = require('@axe-core/puppeteer');
-            const puppeteer = require('puppeteer');
-
-            async function runAxe() {{
-                let browser;
-                try {{
-                    console.log('Launching browser...');
-                    browser = await puppeteer.launch({{
-                        headless: 'new',
-                        args: ['--no-sandbox', '--disable-setuid-sandbox']
-                    }});
-                    
-                    console.log('Creating new page...');
-                    const page = await browser.newPage();
-                    await page.setViewport({{ width: 1280, height: 1024 }});
-                    
-                    console.log('Navigating to {url}...');
-                    await page.goto('{url}', {{
-                        waitUntil: ['networkidle0', 'domcontentloaded'],
-                        timeout: 60000
-                    }});
-
-                    console.log('Running Axe analysis...');
-                    const results = await new axeCore.AxePuppeteer(page)
-                        .withTags(['wcag2a', 'wcag2aa', 'wcag21a', 'wcag21aa', 'wcag22aa', 'best-practice'])
-                        .analyze();
-
-                    // Ensure we're outputting valid JSON
-                    const jsonString = JSON.stringify(results, null, 2);
-                    console.log('AXERESULTS' + jsonString + 'ENDAXERESULTS');
-                    
-                }} catch (error) {{
-                    console.error('Error in runAxe:', error.message);
-                    process.exit(1);
-                }} finally {{
-                    if (browser) {{
-                        console.log('Closing browser...');
-                        await browser.close();
-                    }}
-                }}
-            }}
+            # Run the axe-core analysis in the warm worker; it streams the
+            # results straight into output_path
+            print(f"Running Axe Core tests on {url}")
+            try:
+                outcome = get_shared_worker().scan(
+                    url, output_path, cache=self._result_cache(),
+                    disable_rules=self._disabled_rules_for(url), profile=self.timing_profile,
+                    incremental=self._segment_store(), **self._rule_selection()
+                )
+            except AxeWorkerError as e:
+                return f"Error running Axe Core worker: {str(e)}"
             
-            runAxe().catch(error => {{
-                console.error('Unhandled error:', error);
-                process.exit(1);
-            }});
-            """
+            return self._summarize(url, timestamp, AxeResultSummary.from_file(output_path), output_path, outcome)
             
-            # Save the script
-            with open(script_path, "w") as f:
-                f.write(script_content)
+        except Exception as e:
+            return f"Error executing Axe Core test: {str(e)}"
+
+    async def _arun(self, url: str) -> str:
+        """Execute Axe Core accessibility tests without blocking the event loop."""
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
             
-            # Install required Node.js packages if not already installed
-            try:
-                print("Installing Node.js dependencies...")
-                subprocess.run(
-                    ['npm', 'install', '@axe-core/puppeteer', 'puppeteer'],
-                    check=True,
-                    capture_output=True
-                )
-            except subprocess.CalledProcessError as e:
-                return f"Error installing Node.js dependencies: {e.stderr.decode()}"
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = self._output_path(url, timestamp)
             
-            # Run the axe-core analysis
             print(f"Running Axe Core tests on {url}")
-            result = subprocess.run(
-                ['node', script_path],
-                capture_output=True,
-                text=True,
-                check=False  # Don't raise exception on non-zero exit
-            )
+            try:
+                outcome = await get_shared_worker().ascan(
+                    url, output_path, cache=self._result_cache(),
+                    disable_rules=self._disabled_rules_for(url), profile=self.timing_profile,
+                    incremental=self._segment_store(), **self._rule_selection()
+                )
+            except AxeWorkerError as e:
+                return f"Error running Axe Core worker: {str(e)}"
             
-            # Print debug information
-            if result.stderr:
-                print("Node.js stderr output:", result.stderr)
-                
-            if result.stdout:
-                print("Node.js stdout output:", result.stdout)
+            summary = await asyncio.to_thread(AxeResultSummary.from_file, output_path)
+            return await asyncio.to_thread(self._summarize, url, timestamp, summary, output_path, outcome)
             
-            # Extract the JSON results using the markers
-            stdout = result.stdout
-            try:
-                start_marker = 'AXERESULTS'
-                end_marker = 'ENDAXERESULTS'
-                start_idx = stdout.find(start_marker) + len(start_marker)
-                end_idx = stdout.find(end_marker)
-                
-                if start_idx == -1 or end_idx == -1:
-                    raise ValueError(f"Could not find JSON markers in output. Full output: {stdout}")
-                
-                json_str = stdout[start_idx:end_idx]
-                axe_results = json.loads(json_str)
-                
-                # Save the full results to file
-                with open(output_path, 'w') as f:
-                    json.dump(axe_results, f, indent=2)
-                
-                # Create a summary
-                violations = axe_results.get("violations", [])
-                passes = axe_results.get("passes", [])
-                incomplete = axe_results.get("incomplete", [])
-                inapplicable = axe_results.get("inapplicable", [])
-                
-                summary = f"""Axe Core Test Results Summary:
+        except Exception as e:
+            return f"Error executing Axe Core test: {str(e)}"
+
+    def run_batch(self, urls: List[str], concurrency: int = 4, page_timeout: float = 120.0) -> Dict[str, Any]:
+        """
+        Execute Axe Core tests for many URLs inside one browser.
+
+        Args:
+            urls: URLs to test
+            concurrency: Number of pages analysed in parallel
+            page_timeout: Seconds a single page may take
+
+        Returns:
+            {"results": {url: {"summary", "output_path", "cached"} or {"error"}},
+             "summary": combined summary text}
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        targets = {url: self._output_path(url, timestamp) for url in urls}
+
+        print(f"Running Axe Core tests on {len(targets)} URLs ({concurrency} concurrent pages)")
+        try:
+            outcomes = get_shared_worker().scan_batch(
+                targets, concurrency=concurrency, page_timeout=page_timeout,
+                cache=self._result_cache(),
+                disable_rules={url: self._disabled_rules_for(url) for url in targets},
+                profile=self.timing_profile,
+                incremental=self._segment_store(),
+                **self._rule_selection()
+            )
+        except AxeWorkerError as e:
+            return {"results": {}, "summary": f"Error running Axe Core worker: {str(e)}"}
+
+        results = {}
+        for url, outcome in outcomes.items():
+            if "error" in outcome:
+                results[url] = {"error": outcome["error"]}
+                continue
+            output_path = targets[url]
+            results[url] = {
+                "summary": self._summarize(url, timestamp, AxeResultSummary.from_file(output_path), output_path,
+                                           outcome),
+                "output_path": output_path,
+                "cached": outcome.get("cached", False)
+            }
+
+        summary = "\n\n".join(
+            entry.get("summary") or f"Axe Core test failed for {url}: {entry['error']}"
+            for url, entry in results.items()
+        )
+        return {"results": results, "summary": summary}
+
+    def _output_path(self, url: str, timestamp: str) -> str:
+        """Results file per URL; the hash keeps concurrent runs apart"""
+        url_hash = hashlib.sha1(url.encode()).hexdigest()[:8]
+        return os.path.join(self.output_dir, f"axe_results_{timestamp}_{url_hash}.ndjson")
+
+    def _result_cache(self) -> Optional[AxeResultCache]:
+        if not self.use_cache:
+            return None
+        return AxeResultCache(self.cache_dir, max_bytes=self.cache_max_mb * 1024 * 1024)
+
+    def _segment_store(self) -> Optional[AxeSegmentStore]:
+        if not self.incremental_rescans:
+            return None
+        return AxeSegmentStore(self.incremental_dir)
+
+    def _rule_selection(self) -> Dict[str, Any]:
+        """axe tags or rule allow-list and the resource profile of the conformance profile"""
+        return {
+            "tags": self.conformance.axe_tags(),
+            "rules": self.conformance.axe_allow_rules(),
+            "resources": self.conformance.resource_profile("axe").to_job()
+        }
+
+    def _disabled_rules_for(self, url: str) -> List[str]:
+        return self.conformance.axe_deny_rules() + self.disabled_rules.get(host_of(url), [])
+
+    def _summarize(self,
+                   url: str,
+                   timestamp: str,
+                   results: AxeResultSummary,
+                   output_path: str,
+                   outcome: Optional[Dict[str, Any]] = None) -> str:
+        """Create the textual summary handed to the agent"""
+        summary = f"""Axe Core Test Results Summary:
 URL Tested: {url}
 Timestamp: {timestamp}
 
 Results:
-- Violations: {len(violations)}
-- Passes: {len(passes)}
-- Incomplete: {len(incomplete)}
-- Inapplicable: {len(inapplicable)}
-
-Violations Summary:
+- Violations: {results.counts['violations']}
+- Passes: {results.counts['passes']}
+- Incomplete: {results.counts['incomplete']}
+- Inapplicable: {results.counts['inapplicable']}
 """
-                # Add details for each violation
-                for violation in violations:
-                    summary += f"""
-Impact: {violation.get('impact', 'unknown')}
-Rule: {violation.get('id')} - {violation.get('help')}
-WCAG: {', '.join(violation.get('tags', []))}
-Elements Affected: {len(violation.get('nodes', []))}
----"""
-                
-                summary += f"\n\nDetailed results saved to: {output_path}"
-                
-                return summary
-                
-            except ValueError as e:
-                return f"Error parsing Axe results: {str(e)}"
-            except json.JSONDecodeError as e:
-                return f"Error decoding JSON: {str(e)}. Raw output: {stdout}"
-            
-        except Exception as e:
-            return f"Error executing Axe Core test: {str(e)}"
-        finally:
-            # Clean up the temporary script
-            if os.path.exists(script_path):
-                os.remove(script_path)
+        outcome = outcome or {}
+        readiness = outcome.get("readiness")
+        if readiness:
+            state = "stable" if readiness.get("stable") else "still changing, analysed anyway"
+            summary += f"\nPage ready after {readiness.get('waited_ms', 0):.0f} ms ({state}).\n"
+        if outcome.get("cached"):
+            summary += "\nPage content unchanged since an earlier scan; cached result reused.\n"
+        incremental = outcome.get("incremental") or {}
+        if incremental.get("mode") == "partial":
+            summary += (
+                f"\nIncremental rescan: {len(incremental['changed'])} changed and "
+                f"{len(incremental['removed'])} removed page segments re-audited; "
+                f"results for unchanged segments carried over from the previous scan.\n"
+            )
+        if outcome.get("profile"):
+            summary += self._profile_summary(url, output_path, outcome["profile"]) + "\n"
+
+        # Violations are digested to a bounded size; the file has the rest
+        budget = max(0, self.token_budget - count_tokens(summary))
+        summary += "\n" + build_digest(results, output_path, token_budget=budget)
+        
+        return summary
+
+    def _profile_summary(self, url: str, output_path: str, profile: Dict[str, Any]) -> str:
+        """Store the timing profile and describe its slowest rules"""
+        profile_path = AxeProfileStore(self.output_dir).record(url, output_path, profile)
+        phases = profile.get("phases", {})
+        slowest = sorted(profile.get("rules", {}).items(), key=lambda item: item[1], reverse=True)[:5]
+
+        return f"""
+Timing Profile:
+- Navigation: {phases.get('navigation_ms', 0):.0f} ms
+- Injection: {phases.get('injection_ms', 0):.0f} ms
+- Analysis: {phases.get('analysis_ms', 0):.0f} ms
+Slowest rules: {', '.join(f'{rule} ({ms:.0f} ms)' for rule, ms in slowest) or 'n/a'}
+Timing profile saved to: {profile_path}"""
 
     def _execute(self, *args, **kwargs):
         """Wrapper for _run to maintain compatibility with both methods."""
@@ -0,0 +1,89 @@
+# src/tools/axe_digest.py
+
+from typing import Any, Dict, List
+
+from .axe_results import AxeResultSummary
+
+IMPACT_ORDER = {"critical": 0, "serious": 1, "moderate": 2, "minor": 3}
+
+# Selectors and markup tokenize densely; ~3.5 characters per token keeps
+# the estimate on the safe side for the models the crew uses
+CHARS_PER_TOKEN = 3.5
+
+
+def count_tokens(text: str) -> int:
+    """Approximate LLM token count of a text"""
+    return int(len(text) / CHARS_PER_TOKEN) + 1
+
+
+def rank_violations(violations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Most severe rules first, then those affecting the most elements"""
+    return sorted(
+        violations,
+        key=lambda v: (IMPACT_ORDER.get(v.get("impact") or "", len(IMPACT_ORDER)), -v.get("node_count", 0))
+    )
+
+
+def _rule_block(violation: Dict[str, Any], with_samples: bool) -> str:
+    block = f"""
+Impact: {violation.get('impact') or 'unknown'}
+Rule: {violation.get('id')} - {violation.get('help')}
+WCAG: {', '.join(violation.get('tags', []))}
+Elements Affected: {violation['node_count']}"""
+    if with_samples:
+        for sample in violation.get("samples", []):
+            block += f"\n  * {sample['target']}: {sample['html']}"
+            if sample.get("failure"):
+                block += f"\n    Failure: {sample['failure']}"
+    return block + "\n---"
+
+
+def build_digest(summary: AxeResultSummary, output_path: str, token_budget: int = 2000) -> str:
+    """
+    Violation digest for the agent, capped at roughly token_budget tokens
+
+    Rules are listed by impact and number of affected elements, each with a
+    few representative nodes. When the budget runs short, remaining rules
+    lose their samples and finally collapse into a list of ids; the
+    detailed NDJSON file is referenced for everything that was left out, so
+    the digest stays about the same size however large the page is.
+    """
+    footer = f"\n\nDetailed results saved to: {output_path}"
+    digest = "Violations Summary:\n"
+    used = count_tokens(digest) + count_tokens(footer)
+
+    ranked = rank_violations(summary.violations)
+    blocks: List[str] = []
+    shown = 0
+
+    for violation in ranked:
+        for with_samples in (True, False):
+            block = _rule_block(violation, with_samples)
+            cost = count_tokens(block)
+            if used + cost <= token_budget:
+                blocks.append(block)
+                used += cost
+                break
+        else:
+            break
+        shown += 1
+
+    # Make room for the note on elided rules by giving up the last blocks
+    note = _elided_note(ranked[shown:])
+    while note and shown and used + count_tokens(note) > token_budget:
+        shown -= 1
+        used -= count_tokens(blocks.pop())
+        note = _elided_note(ranked[shown:])
+
+    return digest + "".join(blocks) + note + footer
+
+
+def _elided_note(elided: List[Dict[str, Any]]) -> str:
+    if not elided:
+        return ""
+    ids = [str(v.get("id")) for v in elided]
+    shown = ", ".join(ids[:15]) + (", ..." if len(ids) > 15 else "")
+    return (
+        f"\n\n{len(elided)} more violated rules not shown ({shown}). "
+        f"Each rule is one line in the detailed results file; read it for their nodes."
+    )
@@ -0,0 +1,190 @@
+# src/tools/axe_incremental.py
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..errors.exceptions import AxeWorkerError
+from .axe_results import RESULT_GROUPS, iter_axe_results
+
+DEFAULT_STATE_DIR = "output/tool_results/axe_incremental"
+
+IMPACT_ORDER = ["minor", "moderate", "serious", "critical"]
+
+
+def merge_incremental(previous_path: str,
+                      partial_path: str,
+                      output_path: str,
+                      stale_segments: Iterable[str],
+                      page_rules: Iterable[str]) -> Dict[str, int]:
+    """
+    Merge a partial (changed segments only) axe run into the previous results
+
+    Page-level rules are taken from the partial run as they are. For every
+    other rule the nodes of unchanged segments are kept from the previous
+    run and the nodes of stale (changed or removed) segments are replaced
+    by what the partial run found there. A rule that ends up without nodes
+    in violations, passes and incomplete is reported as inapplicable.
+
+    Returns:
+        Number of rules per group in the merged results
+    """
+    stale = set(stale_segments)
+    page_rules = set(page_rules)
+
+    previous_meta, previous_rules = _load_rules(previous_path)
+    partial_meta, partial_rules = _load_rules(partial_path)
+
+    merged_rules: Dict[str, Dict[str, Any]] = {}
+    for rule_id in list(previous_rules) + [r for r in partial_rules if r not in previous_rules]:
+        old = previous_rules.get(rule_id)
+        new = partial_rules.get(rule_id)
+        if rule_id in page_rules:
+            if new is not None:
+                merged_rules[rule_id] = new
+            continue
+
+        base = new or old
+        groups = {group: [] for group in RESULT_GROUPS}
+        if old is not None:
+            for group, nodes in old["groups"].items():
+                groups[group].extend(node for node in nodes if node.get("segment") not in stale)
+        if new is not None:
+            for group, nodes in new["groups"].items():
+                groups[group].extend(nodes)
+        merged_rules[rule_id] = {"rule": base["rule"], "groups": groups}
+
+    meta = {**previous_meta, **partial_meta}
+    counts = {group: 0 for group in RESULT_GROUPS}
+    partial_output = f"{output_path}.part"
+    with open(partial_output, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"record": "meta", "meta": meta}) + "\n")
+        for group in RESULT_GROUPS:
+            for rule_id, entry in merged_rules.items():
+                nodes = entry["groups"][group]
+                if group == "inapplicable":
+                    if any(entry["groups"][g] for g in RESULT_GROUPS if g != "inapplicable"):
+                        continue
+                elif not nodes:
+                    continue
+                record = {"record": "rule", "group": group, **entry["rule"], "nodes": nodes}
+                if group == "violations":
+                    record["impact"] = _highest_impact(nodes) or record.get("impact")
+                f.write(json.dumps(record) + "\n")
+                counts[group] += 1
+    os.replace(partial_output, output_path)
+    return counts
+
+
+def _load_rules(path: str):
+    meta: Dict[str, Any] = {}
+    rules: Dict[str, Dict[str, Any]] = {}
+    for record in iter_axe_results(path):
+        if record.get("record") == "meta":
+            meta = record.get("meta", {})
+            continue
+        group = record.pop("group", None)
+        record.pop("record", None)
+        nodes = record.pop("nodes", [])
+        entry = rules.setdefault(record["id"], {"rule": record, "groups": {g: [] for g in RESULT_GROUPS}})
+        if group in entry["groups"]:
+            entry["groups"][group].extend(nodes)
+    return meta, rules
+
+
+def _highest_impact(nodes: List[Dict[str, Any]]) -> Optional[str]:
+    impacts = [node.get("impact") for node in nodes if node.get("impact") in IMPACT_ORDER]
+    return max(impacts, key=IMPACT_ORDER.index) if impacts else None
+
+
+class AxeSegmentStore:
+    """
+    Per-URL segment snapshots for element-level incremental rescans
+
+    For every URL and rule selection the store keeps the segment hashes the
+    worker reported on the last scan together with a copy of the results
+    they describe. job_payload() hands the snapshot to the worker, which
+    then only re-audits changed segments; finish() merges such partial
+    results into the previous ones and records the new snapshot.
+    """
+
+    def __init__(self, state_dir: str = DEFAULT_STATE_DIR, max_changed: float = 0.5):
+        self.state_dir = Path(state_dir).resolve()
+        self.max_changed = max_changed
+        self.logger = logging.getLogger('AxeSegmentStore')
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _key(job: Dict[str, Any]) -> str:
+        selection = {
+            "url": job["url"],
+            "tags": sorted(job.get("tags") or []),
+            "rules": sorted(job.get("rules") or []),
+            "disabled": sorted(job.get("disable_rules") or [])
+        }
+        # Snapshots taken under a reduced resource profile are not comparable
+        # with full loads; "full" keeps the existing keys
+        resources = (job.get("resources") or {}).get("name", "full")
+        if resources != "full":
+            selection["resources"] = resources
+        return hashlib.sha256(json.dumps(selection, sort_keys=True).encode()).hexdigest()
+
+    def _paths(self, job: Dict[str, Any]):
+        key = self._key(job)
+        return self.state_dir / f"{key}.json", self.state_dir / f"{key}.ndjson"
+
+    def job_payload(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """The "incremental" field of a scan job"""
+        state_path, results_path = self._paths(job)
+        previous = None
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+            if results_path.exists():
+                previous = {key: state[key] for key in ("segments", "shell", "axe_version")}
+        except (OSError, json.JSONDecodeError, KeyError):
+            pass
+        return {"previous": previous, "max_changed": self.max_changed}
+
+    def finish(self, job: Dict[str, Any], response: Dict[str, Any], output_path: str) -> Optional[Dict[str, int]]:
+        """
+        Complete an incremental scan and remember its snapshot
+
+        Returns:
+            Merged per-group counts if partial results were merged
+        """
+        info = response.get("incremental")
+        if not info:
+            return None
+
+        state_path, results_path = self._paths(job)
+        counts = None
+        if info.get("mode") == "partial":
+            if not results_path.exists():
+                raise AxeWorkerError("Previous results for incremental rescan are missing")
+            counts = merge_incremental(
+                str(results_path), output_path,
+                output_path,
+                stale_segments=info.get("changed", []) + info.get("removed", []),
+                page_rules=info.get("page_rules", [])
+            )
+            self.logger.debug(
+                f"Merged incremental rescan of {job['url']}: "
+                f"{len(info.get('changed', []))} of {len(info.get('segments', {}))} segments re-audited"
+            )
+
+        partial_results = results_path.with_suffix(".ndjson.part")
+        shutil.copyfile(output_path, partial_results)
+        os.replace(partial_results, results_path)
+        with open(state_path, "w") as f:
+            json.dump({
+                "url": job["url"],
+                "segments": info.get("segments", {}),
+                "shell": info.get("shell"),
+                "axe_version": info.get("axe_version")
+            }, f)
+        return counts
@@ -0,0 +1,99 @@
+# src/tools/axe_profile.py
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+
+def host_of(url: str) -> str:
+    """Host part of a URL as used for the per-site aggregates"""
+    return urlparse(url).netloc or "local"
+
+
+class AxeProfileStore:
+    """
+    Stores axe timing profiles next to the NDJSON results
+
+    Every profiled run gets a <results>.profile.json file with its phase
+    timings (navigation, injection, analysis) and per-rule times. The runs
+    of one host are also folded into axe_rule_timings_<host>.json, which
+    keeps count, total and maximum per rule and phase. slow_rules() reads
+    that aggregate to find rules worth disabling for a site.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, output_dir: str = "output/tool_results"):
+        self.output_dir = Path(output_dir)
+
+    @staticmethod
+    def profile_path(results_path: str) -> str:
+        base, _ = os.path.splitext(results_path)
+        return f"{base}.profile.json"
+
+    def aggregate_path(self, host: str) -> Path:
+        safe_host = "".join(c if c.isalnum() or c in ".-" else "_" for c in host)
+        return self.output_dir / f"axe_rule_timings_{safe_host}.json"
+
+    def record(self, url: str, results_path: str, profile: Dict[str, Any]) -> str:
+        """
+        Save the profile of one run and add it to the host aggregate
+
+        Returns:
+            Path of the per-run profile file
+        """
+        path = self.profile_path(results_path)
+        with open(path, "w") as f:
+            json.dump({"url": url, "results_path": results_path, **profile}, f, indent=2)
+
+        host = host_of(url)
+        with self._lock:
+            aggregate = self.load_aggregate(host) or {"host": host, "runs": 0, "phases": {}, "rules": {}}
+            aggregate["runs"] += 1
+            self._fold(aggregate["phases"], profile.get("phases", {}))
+            self._fold(aggregate["rules"], profile.get("rules", {}))
+            aggregate["updated"] = datetime.now(timezone.utc).isoformat()
+
+            aggregate_path = self.aggregate_path(host)
+            partial = aggregate_path.with_suffix(".part")
+            with open(partial, "w") as f:
+                json.dump(aggregate, f, indent=2)
+            os.replace(partial, aggregate_path)
+
+        return path
+
+    def load_aggregate(self, host: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.aggregate_path(host)) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def slow_rules(self, host: str, min_mean_ms: float = 250.0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Rules of a host whose mean execution time reaches min_mean_ms
+
+        Returns:
+            [{"rule", "runs", "mean_ms", "max_ms"}], slowest first
+        """
+        aggregate = self.load_aggregate(host) or {}
+        slow = [
+            {"rule": rule, "runs": stats["runs"], "mean_ms": stats["mean_ms"], "max_ms": stats["max_ms"]}
+            for rule, stats in aggregate.get("rules", {}).items()
+            if stats["mean_ms"] >= min_mean_ms
+        ]
+        slow.sort(key=lambda entry: entry["mean_ms"], reverse=True)
+        return slow[:limit] if limit else slow
+
+    @staticmethod
+    def _fold(totals: Dict[str, Dict[str, float]], timings: Dict[str, float]) -> None:
+        for name, ms in timings.items():
+            stats = totals.setdefault(name, {"runs": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stats["runs"] += 1
+            stats["total_ms"] = round(stats["total_ms"] + ms, 2)
+            stats["max_ms"] = max(stats["max_ms"], ms)
+            stats["mean_ms"] = round(stats["total_ms"] / stats["runs"], 2)
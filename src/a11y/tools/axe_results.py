@@ -0,0 +1,122 @@
+# src/tools/axe_results.py
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+RESULT_GROUPS = ("violations", "passes", "incomplete", "inapplicable")
+
+# Longest HTML snippet kept per sampled node
+SAMPLE_HTML_CHARS = 160
+
+
+def iter_axe_results(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the records of an NDJSON axe results file
+
+    The first record ("record": "meta") carries the run metadata, every
+    following record is one axe rule result with its "group" (violations,
+    passes, incomplete or inapplicable). Only one line is held in memory
+    at a time.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_axe_results(path: str) -> Dict[str, Any]:
+    """Reassemble the classic axe results object from an NDJSON file"""
+    results: Dict[str, Any] = {group: [] for group in RESULT_GROUPS}
+    for record in iter_axe_results(path):
+        if record.get("record") == "meta":
+            results.update(record.get("meta", {}))
+        else:
+            group = record.pop("group", None)
+            record.pop("record", None)
+            if group in results:
+                results[group].append(record)
+    return results
+
+
+@dataclass
+class AxeResultSummary:
+    """Compact view of an axe run, built without loading the whole result"""
+    url: Optional[str] = None
+    # Representative nodes kept per violation
+    sample_size: int = 3
+    counts: Dict[str, int] = field(default_factory=lambda: {group: 0 for group in RESULT_GROUPS})
+    violations: List[Dict[str, Any]] = field(default_factory=list)
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_file(cls, path: str, sample_size: int = 3) -> "AxeResultSummary":
+        summary = cls(sample_size=sample_size)
+        for record in iter_axe_results(path):
+            summary.add(record)
+        return summary
+
+    def add(self, record: Dict[str, Any]) -> None:
+        if record.get("record") == "meta":
+            self.meta = record.get("meta", {})
+            self.url = self.meta.get("url", self.url)
+            return
+
+        group = record.get("group")
+        if group not in self.counts:
+            return
+        self.counts[group] += 1
+        if group == "violations":
+            self.violations.append({
+                "id": record.get("id"),
+                "impact": record.get("impact"),
+                "help": record.get("help"),
+                "helpUrl": record.get("helpUrl"),
+                "tags": record.get("tags", []),
+                "node_count": len(record.get("nodes", [])),
+                "samples": self._sample_nodes(record.get("nodes", []))
+            })
+
+    def _sample_nodes(self, nodes: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        Pick up to sample_size nodes, preferring distinct failure reasons
+
+        Nodes of one rule usually fail for a handful of reasons; one example
+        per reason tells more than the first few nodes in document order.
+        """
+        picked: List[Dict[str, Any]] = []
+        seen = set()
+        for node in nodes:
+            reason = node.get("failureSummary")
+            if reason not in seen:
+                seen.add(reason)
+                picked.append(node)
+                if len(picked) == self.sample_size:
+                    break
+        for node in nodes:
+            if len(picked) >= self.sample_size:
+                break
+            if not any(node is chosen for chosen in picked):
+                picked.append(node)
+
+        return [{
+            "target": " ".join(str(part) for part in node.get("target", [])),
+            "html": _shorten(node.get("html", ""), SAMPLE_HTML_CHARS),
+            "failure": _failure_reason(node.get("failureSummary"))
+        } for node in picked]
+
+
+def _shorten(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def _failure_reason(failure_summary: Optional[str]) -> str:
+    """Drop axe's "Fix any/all of the following:" headings"""
+    if not failure_summary:
+        return ""
+    reasons = [
+        line.strip() for line in failure_summary.splitlines()
+        if line.strip() and not line.strip().endswith("of the following:")
+    ]
+    return _shorten("; ".join(reasons), 200)
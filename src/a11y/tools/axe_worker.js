@@ -0,0 +1,576 @@
+// src/tools/axe_worker.js
+//
+// Long-lived axe-core worker. Keeps Node.js and a single Puppeteer browser
+// warm and accepts scan jobs as newline-delimited JSON on stdin. Every job
+// is answered with exactly one JSON line on stdout; diagnostics go to stderr
+// so that stdout stays a clean protocol channel.
+//
+// Request:  {"id": 1, "cmd": "scan", "url": "https://...", "output": "/path/results.ndjson",
+//            "tags": [...], "rules": [...], "disable_rules": [...], "profile": false,
+//            "resources": {...}, "readiness": {"quiet_ms": 300, "timeout_ms": 10000},
+//            "timeout": 60000}
+// Response: {"id": 1, "ok": true, "results_path": "/path/results.ndjson", "counts": {...},
+//            "readiness": {...}}
+//           {"id": 1, "ok": false, "error": "..."}
+//
+// "rules" restricts the run to the listed rule ids (axe runOnly type
+// "rule") and takes precedence over "tags"; "disable_rules" switches rules
+// off within either selection.
+//
+// Results never travel over stdout. They are written to `output` as compact
+// NDJSON: one "meta" record with the run metadata followed by one record
+// per rule result, tagged with its group (violations, passes, ...).
+//
+// Pages are loaded up to DOMContentLoaded and analysed once the DOM has
+// been stable for "readiness.quiet_ms" (see stability_probe.js), at most
+// "readiness.timeout_ms" later. Every response that loaded the page
+// carries the probe's "readiness" record with the time it waited.
+//
+// "resources" is a resource profile (see resource_blocking.js) that stubs or
+// blocks images, media, fonts, stylesheets and tracker hosts while the page
+// loads; omitted or "full" loads everything.
+//
+// With "cache_dir" set, the worker hashes the rendered DOM and derives a
+// content address sha256({"dom","axe","tags","rules","disabled"}) from it,
+// the axe-core version and the sorted rule selection; reduced resource
+// profiles add their name as "resources". If <cache_dir>/<key>.ndjson exists axe is skipped and
+// the response carries "cached": true with that file as results_path; every
+// response to such a job includes the "cache_key". The Python side owns the
+// cache contents and their eviction.
+//
+// "profile": true runs axe with its performanceTimer and adds a "profile"
+// to the response: {"phases": {"navigation_ms", "injection_ms",
+// "analysis_ms"}, "rules": {<rule id>: ms}}. Rule times come from axe's
+// rule_<id> performance measures; navigation_ms includes the readiness
+// wait; injection_ms is the part of the AxePuppeteer call (script
+// injection, frame handling) not spent in axe.run.
+//
+// "incremental": {"previous": {"segments", "shell", "axe_version"} | null,
+// "max_changed": 0.5} enables element-level rescans. The page is split into
+// segments (<head> and every child element of <body>), each with a hash of
+// its markup. If the previous snapshot matches in axe version and in the
+// <html>/<body> shell and at most max_changed of the segments differ, axe
+// runs twice: page-level rules (PAGE_LEVEL_RULES) on the whole document, and
+// all other rules only inside the changed segments. Otherwise it does a full
+// run. Either way, result nodes are tagged with their "segment" and the
+// response carries "incremental": {"mode": "full"|"partial", "changed",
+// "removed", "page_rules", "segments", "shell", "axe_version"}. The Python
+// side merges partial results with the previous ones.
+//
+// Scan jobs may arrive while others are still running. They share a pool
+// of at most `maxPages` tabs inside the one browser; surplus jobs queue
+// until a tab is free. {"cmd": "configure", "max_pages": N} sets the
+// worker-wide pool size. Scan jobs of one batch carry
+// "batch": {"id": ..., "concurrency": N}; at most N of them run at once,
+// and while the batch is active the pool grows to at least N tabs. Batches
+// of concurrent callers therefore never resize each other's limit.
+// {"cmd": "cancel", "target": <id>} abandons a queued or running scan job;
+// it is not answered, the cancelled job itself fails with an error.
+// Protocol, browser and cancellation come from worker_protocol.js.
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+const { once } = require('events');
+const { AxePuppeteer } = require('@axe-core/puppeteer');
+const { applyResourceProfile, resourceProfileName } = require('./resource_blocking');
+const { loadAndSettle } = require('./page_readiness');
+const { Slots, createWorker } = require('./worker_protocol');
+
+const DEFAULT_TAGS = ['wcag2a', 'wcag2aa', 'wcag21a', 'wcag21aa', 'wcag22aa', 'best-practice'];
+const DEFAULT_TIMEOUT = 60000;
+const DEFAULT_MAX_PAGES = 4;
+const RESULT_GROUPS = ['violations', 'passes', 'incomplete', 'inapplicable'];
+const AXE_VERSION = require('axe-core/package.json').version;
+const DEFAULT_MAX_CHANGED = 0.5;
+
+// Rules that judge the document as a whole or rely on document-wide
+// uniqueness. Incremental rescans always run them on the full page.
+const PAGE_LEVEL_RULES = new Set([
+    'bypass', 'document-title', 'duplicate-id', 'duplicate-id-active', 'duplicate-id-aria',
+    'html-has-lang', 'html-lang-valid', 'html-xml-lang-mismatch', 'landmark-one-main',
+    'landmark-no-duplicate-banner', 'landmark-no-duplicate-contentinfo', 'landmark-no-duplicate-main',
+    'landmark-unique', 'meta-refresh', 'meta-refresh-no-exceptions', 'meta-viewport',
+    'meta-viewport-large', 'page-has-heading-one', 'region', 'skip-link', 'frame-tested'
+]);
+
+// Page pool: every open tab is in `pages`, idle ones additionally in `idlePages`
+let maxPages = DEFAULT_MAX_PAGES;
+const pages = new Set();
+const idlePages = [];
+let openingPages = 0;
+const pageWaiters = [];
+
+// Slots of the active batches, by batch id
+const batches = new Map();
+
+// Rule ids per tag selection, resolved once through axe.getRules()
+let axeSource = null;
+const rulesByTags = new Map();
+
+const worker = createWorker('axe-worker', {
+    onBrowserDisconnect: () => {
+        pages.clear();
+        idlePages.length = 0;
+        wakePageWaiter();
+    }
+});
+const { log } = worker;
+
+function wakePageWaiter() {
+    const next = pageWaiters.shift();
+    if (next) {
+        next();
+    }
+}
+
+// Pool size: the configured one, raised to the largest active batch
+function pageLimit() {
+    let limit = maxPages;
+    for (const batch of batches.values()) {
+        limit = Math.max(limit, batch.limit);
+    }
+    return limit;
+}
+
+function trimIdlePages() {
+    const limit = pageLimit();
+    while (idlePages.length && pages.size > limit) {
+        const page = idlePages.pop();
+        pages.delete(page);
+        page.close().catch(() => {});
+    }
+}
+
+async function acquireBatchSlot(spec) {
+    let batch = batches.get(spec.id);
+    if (!batch) {
+        batch = new Slots(spec.concurrency || 1);
+        batches.set(spec.id, batch);
+        // A larger pool may let queued jobs of other batches proceed too
+        for (let i = pages.size; i < pageLimit(); i++) {
+            wakePageWaiter();
+        }
+    }
+    await batch.acquire();
+    return batch;
+}
+
+function releaseBatchSlot(spec, batch) {
+    batch.release();
+    if (batch.idle) {
+        batches.delete(spec.id);
+        trimIdlePages();
+    }
+}
+
+async function acquirePage() {
+    for (;;) {
+        if (idlePages.length) {
+            return idlePages.pop();
+        }
+        if (pages.size + openingPages < pageLimit()) {
+            // Reserve the slot before awaiting so concurrent jobs cannot overshoot
+            openingPages++;
+            try {
+                const browser = await worker.getBrowser();
+                const page = await browser.newPage();
+                await page.setViewport({ width: 1280, height: 1024 });
+                pages.add(page);
+                return page;
+            } catch (error) {
+                wakePageWaiter();
+                throw error;
+            } finally {
+                openingPages--;
+            }
+        }
+        await new Promise(resolve => pageWaiters.push(resolve));
+    }
+}
+
+function releasePage(page, reusable) {
+    if (reusable && pages.has(page) && !page.isClosed() && pages.size <= pageLimit()) {
+        idlePages.push(page);
+    } else {
+        pages.delete(page);
+        page.close().catch(() => {});
+    }
+    wakePageWaiter();
+}
+
+function withTimeout(promise, ms, message) {
+    let timer;
+    const timeout = new Promise((_, reject) => {
+        timer = setTimeout(() => reject(new Error(message)), ms);
+    });
+    return Promise.race([promise, timeout]).finally(() => clearTimeout(timer));
+}
+
+async function writeResults(path, results) {
+    const meta = { ...results };
+    RESULT_GROUPS.forEach(group => delete meta[group]);
+
+    // Write to a temporary name so readers never see a half-written file
+    const partial = `${path}.part`;
+    const stream = fs.createWriteStream(partial, { encoding: 'utf8' });
+    const write = async record => {
+        if (!stream.write(JSON.stringify(record) + '\n')) {
+            await once(stream, 'drain');
+        }
+    };
+
+    const counts = {};
+    try {
+        await write({ record: 'meta', meta });
+        for (const group of RESULT_GROUPS) {
+            const rules = results[group] || [];
+            counts[group] = rules.length;
+            for (const rule of rules) {
+                await write({ record: 'rule', group, ...rule });
+            }
+        }
+    } finally {
+        stream.end();
+        await once(stream, 'close');
+    }
+    await fs.promises.rename(partial, path);
+    return counts;
+}
+
+function sha256(text) {
+    return crypto.createHash('sha256').update(text).digest('hex');
+}
+
+async function cacheLookup(page, job) {
+    const tags = [...(job.tags || DEFAULT_TAGS)].sort();
+    const rules = [...(job.rules || [])].sort();
+    const disabled = [...(job.disable_rules || [])].sort();
+    const domHash = sha256(await page.content());
+    const resources = resourceProfileName(job.resources);
+    // The same DOM can style differently without stylesheets, so reduced
+    // profiles get their own entries; "full" keeps the existing keys
+    const key = sha256(JSON.stringify({
+        dom: domHash, axe: AXE_VERSION, tags, rules, disabled,
+        ...(resources === 'full' ? {} : { resources })
+    }));
+    const entry = path.join(job.cache_dir, `${key}.ndjson`);
+    try {
+        await fs.promises.access(entry);
+        return { key, hit: entry };
+    } catch (error) {
+        return { key, hit: null };
+    }
+}
+
+function roundMs(ms) {
+    return Math.round(ms * 100) / 100;
+}
+
+async function collectProfile(page, navigationMs, analyzeMs) {
+    const measures = await page.evaluate(() => performance.getEntriesByType('measure')
+        .map(entry => ({ name: entry.name, duration: entry.duration })));
+
+    const rules = {};
+    let axeMs = null;
+    for (const { name, duration } of measures) {
+        // Sub-measures such as rule_<id>#gather are already part of rule_<id>
+        if (name.startsWith('rule_') && !name.includes('#')) {
+            const rule = name.slice('rule_'.length);
+            rules[rule] = roundMs((rules[rule] || 0) + duration);
+        } else if (name === 'axe') {
+            axeMs = duration;
+        }
+    }
+
+    const analysisMs = axeMs === null ? analyzeMs : Math.min(axeMs, analyzeMs);
+    return {
+        phases: {
+            navigation_ms: roundMs(navigationMs),
+            injection_ms: roundMs(analyzeMs - analysisMs),
+            analysis_ms: roundMs(analysisMs)
+        },
+        rules
+    };
+}
+
+// Runs inside the page: hash <head>, every child element of <body> and the
+// <html>/<body> shell. Keys stay stable when unrelated segments change.
+function segmentSnapshot() {
+    const hash = text => {
+        // cyrb53, good enough to detect changed markup
+        let h1 = 0xdeadbeef;
+        let h2 = 0x41c6ce57;
+        for (let i = 0; i < text.length; i++) {
+            const ch = text.charCodeAt(i);
+            h1 = Math.imul(h1 ^ ch, 2654435761);
+            h2 = Math.imul(h2 ^ ch, 1597334677);
+        }
+        h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+        h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+        return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(16);
+    };
+    const attributes = element => element
+        ? Array.from(element.attributes).map(attr => `${attr.name}=${attr.value}`).sort().join(' ')
+        : '';
+
+    const segments = {};
+    const selectors = {};
+    if (document.head) {
+        segments.head = hash(document.head.outerHTML);
+        selectors.head = 'head';
+    }
+
+    const seen = {};
+    const bodyText = [];
+    Array.from(document.body ? document.body.childNodes : []).forEach(node => {
+        if (node.nodeType === Node.TEXT_NODE) {
+            bodyText.push(node.textContent.trim());
+        }
+    });
+    Array.from(document.body ? document.body.children : []).forEach((element, index) => {
+        const classes = Array.from(element.classList).sort().join('.');
+        const base = element.id ? `${element.localName}#${element.id}` : `${element.localName}${classes ? '.' + classes : ''}`;
+        seen[base] = (seen[base] || 0) + 1;
+        const key = `${base}@${seen[base]}`;
+        segments[key] = hash(element.outerHTML);
+        selectors[key] = `body > :nth-child(${index + 1})`;
+    });
+
+    const shell = hash([attributes(document.documentElement), attributes(document.body), bodyText.join(' ')].join('|'));
+    return { segments, selectors, shell };
+}
+
+// Runs inside the page: map first-level node targets to their segment key
+function locateSegments(targets, selectors) {
+    const segmentOf = new Map();
+    for (const [key, selector] of Object.entries(selectors)) {
+        const element = document.querySelector(selector);
+        if (element) {
+            segmentOf.set(element, key);
+        }
+    }
+    return targets.map(target => {
+        let element = null;
+        try {
+            element = document.querySelector(target);
+        } catch (error) {
+            return null;
+        }
+        for (; element; element = element.parentElement) {
+            if (segmentOf.has(element)) {
+                return segmentOf.get(element);
+            }
+        }
+        return null;
+    });
+}
+
+function planIncremental(snapshot, incremental) {
+    const previous = incremental.previous;
+    const plan = { mode: 'full', changed: [], removed: [], page_rules: [] };
+    if (!previous || previous.axe_version !== AXE_VERSION || previous.shell !== snapshot.shell) {
+        return plan;
+    }
+
+    const keys = Object.keys(snapshot.segments);
+    plan.changed = keys.filter(key => previous.segments[key] !== snapshot.segments[key]);
+    plan.removed = Object.keys(previous.segments).filter(key => !(key in snapshot.segments));
+    const maxChanged = incremental.max_changed ?? DEFAULT_MAX_CHANGED;
+    if (plan.changed.length <= keys.length * maxChanged) {
+        plan.mode = 'partial';
+    }
+    return plan;
+}
+
+async function selectedRules(page, job) {
+    const disabled = new Set(job.disable_rules || []);
+    let rules = job.rules && job.rules.length ? job.rules : null;
+    if (!rules) {
+        const tags = job.tags || DEFAULT_TAGS;
+        const key = JSON.stringify(tags);
+        if (!rulesByTags.has(key)) {
+            if (axeSource === null) {
+                axeSource = await fs.promises.readFile(require.resolve('axe-core/axe.min.js'), 'utf8');
+            }
+            await page.evaluate(axeSource);
+            // Same set runOnly tags would select: experimental rules only on request
+            rulesByTags.set(key, await page.evaluate(t => axe.getRules(t)
+                .filter(rule => t.includes('experimental') || !rule.tags.includes('experimental'))
+                .map(rule => rule.ruleId), tags));
+        }
+        rules = rulesByTags.get(key);
+    }
+    return rules.filter(rule => !disabled.has(rule));
+}
+
+function newAxe(page, job) {
+    const axe = new AxePuppeteer(page);
+    if (job.profile) {
+        axe.options({ performanceTimer: true });
+    }
+    return axe;
+}
+
+async function fullScan(page, job) {
+    const axe = newAxe(page, job);
+    if (job.rules && job.rules.length) {
+        axe.withRules(job.rules);
+    } else {
+        axe.withTags(job.tags || DEFAULT_TAGS);
+    }
+    if (job.disable_rules && job.disable_rules.length) {
+        axe.disableRules(job.disable_rules);
+    }
+    return axe.analyze();
+}
+
+async function partialScan(page, job, plan, selectors) {
+    const rules = await selectedRules(page, job);
+    const pageRules = rules.filter(rule => PAGE_LEVEL_RULES.has(rule));
+    const elementRules = rules.filter(rule => !PAGE_LEVEL_RULES.has(rule));
+    plan.page_rules = pageRules;
+
+    const results = {
+        testEngine: { name: 'axe-core', version: AXE_VERSION },
+        url: page.url(),
+        timestamp: new Date().toISOString()
+    };
+    RESULT_GROUPS.forEach(group => { results[group] = []; });
+
+    const runs = [];
+    if (pageRules.length) {
+        runs.push(newAxe(page, job).withRules(pageRules));
+    }
+    if (elementRules.length && plan.changed.length) {
+        const axe = newAxe(page, job).withRules(elementRules);
+        plan.changed.forEach(key => axe.include(selectors[key]));
+        runs.push(axe);
+    }
+    for (const axe of runs) {
+        const partial = await axe.analyze();
+        RESULT_GROUPS.forEach(group => results[group].push(...(partial[group] || [])));
+        Object.assign(results, { testEngine: partial.testEngine, timestamp: partial.timestamp });
+    }
+    return results;
+}
+
+async function annotateSegments(page, results, selectors) {
+    const nodes = RESULT_GROUPS.flatMap(group => (results[group] || []).flatMap(rule => rule.nodes || []));
+    // Nodes inside frames or shadow roots are located by their host element
+    const targets = nodes.map(node => {
+        let target = (node.target || [])[0];
+        while (Array.isArray(target)) {
+            target = target[0];
+        }
+        return target || '';
+    });
+    const segments = await page.evaluate(locateSegments, targets, selectors);
+    nodes.forEach((node, index) => { node.segment = segments[index]; });
+}
+
+async function scan(job) {
+    if (!job.output) {
+        throw new Error('Scan job without output path');
+    }
+
+    const timeout = job.timeout || DEFAULT_TIMEOUT;
+    const control = worker.trackJob(job);
+
+    let batch = null;
+    let page;
+    let results;
+    let cache = null;
+    let profile = null;
+    let incremental = null;
+    let readiness = null;
+    let reusable = false;
+    try {
+        if (job.batch) {
+            batch = await acquireBatchSlot(job.batch);
+            control.check();
+        }
+        page = await acquirePage();
+        if (control.isCancelled) {
+            // The tab was never used and can go back to the pool
+            reusable = true;
+            control.check();
+        }
+
+        results = await withTimeout(Promise.race([(async () => {
+            await applyResourceProfile(page, job.resources);
+            log(`Navigating to ${job.url}...`);
+            const started = performance.now();
+            ({ readiness } = await loadAndSettle(page, job.url, { timeout, readiness: job.readiness }));
+            const navigated = performance.now();
+            log(`${job.url} ${readiness.stable ? 'stable' : 'still changing'} after ${readiness.waited_ms} ms`);
+
+            if (job.cache_dir) {
+                cache = await cacheLookup(page, job);
+                if (cache.hit) {
+                    log(`Cache hit for ${job.url}`);
+                    return null;
+                }
+            }
+
+            let snapshot = null;
+            if (job.incremental) {
+                snapshot = await page.evaluate(segmentSnapshot);
+                incremental = planIncremental(snapshot, job.incremental);
+            }
+
+            log(`Running Axe analysis on ${job.url}...`);
+            const analyzed = incremental && incremental.mode === 'partial'
+                ? await partialScan(page, job, incremental, snapshot.selectors)
+                : await fullScan(page, job);
+            if (snapshot) {
+                await annotateSegments(page, analyzed, snapshot.selectors);
+                Object.assign(incremental, {
+                    segments: snapshot.segments,
+                    shell: snapshot.shell,
+                    axe_version: AXE_VERSION
+                });
+                log(`Incremental ${incremental.mode} scan of ${job.url}: ` +
+                    `${incremental.changed.length} changed, ${incremental.removed.length} removed segments`);
+            }
+            if (job.profile) {
+                profile = await collectProfile(page, navigated - started, performance.now() - navigated);
+            }
+            return analyzed;
+        })(), control.cancelled]), job.page_timeout || timeout * 2, `Scan of ${job.url} timed out`);
+        reusable = true;
+    } finally {
+        control.done();
+        // Tabs that failed, timed out or were cancelled are closed rather than reused
+        if (page) {
+            releasePage(page, reusable);
+        }
+        if (batch) {
+            releaseBatchSlot(job.batch, batch);
+        }
+    }
+
+    const extra = {
+        ...(cache ? { cache_key: cache.key } : {}),
+        ...(readiness ? { readiness } : {}),
+        ...(profile ? { profile } : {}),
+        ...(incremental ? { incremental } : {})
+    };
+    if (cache && cache.hit) {
+        return { results_path: cache.hit, cached: true, ...extra };
+    }
+    return { results_path: job.output, counts: await writeResults(job.output, results), ...extra };
+}
+
+function configure(job) {
+    if (job.max_pages) {
+        maxPages = Math.max(1, job.max_pages);
+        trimIdlePages();
+        for (let i = pages.size; i < pageLimit(); i++) {
+            wakePageWaiter();
+        }
+    }
+    return { max_pages: maxPages, open_pages: pages.size };
+}
+
+worker.serve({ scan, configure });
@@ -0,0 +1,329 @@
+# src/tools/axe_worker.py
+
+import asyncio
+import atexit
+import itertools
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar
+
+from ..errors.exceptions import AxeWorkerError
+from .axe_cache import AxeResultCache
+from .axe_incremental import AxeSegmentStore
+from .node_toolchain import NodeToolchain
+from .node_worker import NodeWorkerClient
+
+WORKER_SCRIPT = Path(__file__).with_name("axe_worker.js")
+
+T = TypeVar("T")
+
+
+class AxeWorker(NodeWorkerClient):
+    """
+    Client for the long-lived Node.js axe worker (axe_worker.js).
+
+    The worker keeps Node.js and one Chromium instance warm and accepts
+    scan jobs as newline-delimited JSON over stdin/stdout (see
+    NodeWorkerClient). Responses are matched to requests by job id, so
+    several jobs may be in flight at once.
+
+    All process I/O runs on a private event loop in a background thread.
+    Synchronous callers (scan, scan_batch) block on that loop, coroutines
+    (ascan, ascan_batch) await it from their own loop without blocking it,
+    and both share the same warm browser. Cancelling an awaiting coroutine
+    cancels the job inside the worker as well.
+    """
+
+    name = "Axe worker"
+    error_class = AxeWorkerError
+    # Results travel through files, so protocol messages stay small
+    stream_limit = 1024 * 1024
+
+    def __init__(self,
+                 script_path: Path = WORKER_SCRIPT,
+                 node_binary: str = "node",
+                 toolchain: Optional[NodeToolchain] = None,
+                 startup_timeout: float = 30.0):
+        super().__init__(script_path, node_binary, toolchain, startup_timeout)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._batch_ids = itertools.count(1)
+
+    # Synchronous API
+
+    def start(self) -> None:
+        """Start the worker process if it is not running yet"""
+        self._call(self._start())
+
+    def scan(self,
+             url: str,
+             output_path: str,
+             tags: Optional[List[str]] = None,
+             timeout: float = 120.0,
+             cache: Optional[AxeResultCache] = None,
+             disable_rules: Optional[List[str]] = None,
+             profile: bool = False,
+             rules: Optional[List[str]] = None,
+             incremental: Optional[AxeSegmentStore] = None,
+             resources: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run axe against a single URL in the warm browser
+
+        Args:
+            url: URL to test
+            output_path: NDJSON file the worker streams the results into
+            tags: axe rule tags to run (worker default if omitted)
+            timeout: Seconds to wait for the job to finish
+            cache: Result cache; on a hit axe is skipped and the cached
+                result is copied to output_path
+            disable_rules: axe rule ids not to run
+            profile: Collect phase and per-rule timings
+            rules: Run only these axe rule ids (takes precedence over tags)
+            incremental: Segment store; re-audit only the changed parts of
+                the page and merge with the previous results
+            resources: Resource profile (ResourceProfile.to_job()) applied
+                while the page loads; everything loads if omitted
+
+        Returns:
+            {"results_path": ..., "counts": {group: number of rules},
+             "cached": bool, "readiness": {...}} plus "profile" if
+            requested and axe ran
+        """
+        return self._call(
+            self._scan(url, output_path, tags, timeout, cache, disable_rules, profile, rules, incremental,
+                       resources)
+        )
+
+    def scan_batch(self,
+                   targets: Dict[str, str],
+                   tags: Optional[List[str]] = None,
+                   concurrency: int = 4,
+                   page_timeout: float = 120.0,
+                   cache: Optional[AxeResultCache] = None,
+                   disable_rules: Optional[Dict[str, List[str]]] = None,
+                   profile: bool = False,
+                   rules: Optional[List[str]] = None,
+                   incremental: Optional[AxeSegmentStore] = None,
+                   resources: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Scan many URLs with up to `concurrency` tabs of the warm browser
+
+        Args:
+            targets: Mapping of URL to the NDJSON file for its results
+            tags: axe rule tags to run (worker default if omitted)
+            concurrency: Maximum number of pages analysed at the same time
+            page_timeout: Seconds one page may take before it is abandoned
+            cache: Result cache shared by all pages of the batch
+            disable_rules: Mapping of URL to axe rule ids not to run there
+            profile: Collect phase and per-rule timings
+            rules: Run only these axe rule ids (takes precedence over tags)
+            incremental: Segment store for incremental rescans
+            resources: Resource profile applied while the pages load
+
+        Returns:
+            Mapping of URL to {"results_path", "counts", "cached"[, "profile"]}
+            or {"error": ...}
+        """
+        return self._call(self._scan_batch(
+            targets, tags, concurrency, page_timeout, cache, disable_rules, profile, rules, incremental,
+            resources
+        ))
+
+    def request(self, payload: Dict[str, Any], timeout: float = 120.0) -> Dict[str, Any]:
+        """Send a job to the worker and wait for its response"""
+        return self._call(self._request(payload, timeout))
+
+    def close(self) -> None:
+        """Shut the worker down and release the browser"""
+        if self._loop is not None:
+            self._call(self._close())
+
+    # Asynchronous API
+
+    async def ascan(self,
+                    url: str,
+                    output_path: str,
+                    tags: Optional[List[str]] = None,
+                    timeout: float = 120.0,
+                    cache: Optional[AxeResultCache] = None,
+                    disable_rules: Optional[List[str]] = None,
+                    profile: bool = False,
+                    rules: Optional[List[str]] = None,
+                    incremental: Optional[AxeSegmentStore] = None,
+                    resources: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Awaitable variant of scan()"""
+        return await self._acall(
+            self._scan(url, output_path, tags, timeout, cache, disable_rules, profile, rules, incremental,
+                       resources)
+        )
+
+    async def ascan_batch(self,
+                          targets: Dict[str, str],
+                          tags: Optional[List[str]] = None,
+                          concurrency: int = 4,
+                          page_timeout: float = 120.0,
+                          cache: Optional[AxeResultCache] = None,
+                          disable_rules: Optional[Dict[str, List[str]]] = None,
+                          profile: bool = False,
+                          rules: Optional[List[str]] = None,
+                          incremental: Optional[AxeSegmentStore] = None,
+                          resources: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """Awaitable variant of scan_batch()"""
+        return await self._acall(self._scan_batch(
+            targets, tags, concurrency, page_timeout, cache, disable_rules, profile, rules, incremental,
+            resources
+        ))
+
+    async def arequest(self, payload: Dict[str, Any], timeout: float = 120.0) -> Dict[str, Any]:
+        """Awaitable variant of request()"""
+        return await self._acall(self._request(payload, timeout))
+
+    async def aclose(self) -> None:
+        """Awaitable variant of close()"""
+        if self._loop is not None:
+            await self._acall(self._close())
+
+    # Event loop bridge
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="axe-worker-loop", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def _call(self, coro: Awaitable[T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    async def _acall(self, coro: Awaitable[T]) -> T:
+        # Cancelling the wrapping future cancels the task on the worker loop
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()))
+
+    # Worker loop side
+
+    @staticmethod
+    def _scan_job(url: str,
+                  output_path: str,
+                  tags: Optional[List[str]],
+                  cache: Optional[AxeResultCache],
+                  disable_rules: Optional[List[str]] = None,
+                  profile: bool = False,
+                  rules: Optional[List[str]] = None,
+                  resources: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        # The worker runs in the toolchain directory, so paths must be absolute
+        job: Dict[str, Any] = {"cmd": "scan", "url": url, "output": str(Path(output_path).resolve())}
+        if tags:
+            job["tags"] = tags
+        if rules:
+            job["rules"] = list(rules)
+        if cache is not None:
+            job["cache_dir"] = str(cache.cache_dir)
+        if disable_rules:
+            job["disable_rules"] = list(disable_rules)
+        if profile:
+            job["profile"] = True
+        if resources is not None:
+            job["resources"] = resources
+        return job
+
+    async def _run_scan(self,
+                        job: Dict[str, Any],
+                        output_path: str,
+                        cache: Optional[AxeResultCache],
+                        timeout: float,
+                        incremental: Optional[AxeSegmentStore] = None) -> Dict[str, Any]:
+        if incremental is not None:
+            job["incremental"] = await asyncio.to_thread(incremental.job_payload, job)
+
+        response = await self._request(job, timeout)
+        key = response.get("cache_key")
+
+        if response.get("cached"):
+            if await asyncio.to_thread(cache.restore, key, output_path):
+                outcome = {"results_path": output_path, "counts": {}, "cached": True}
+                if "readiness" in response:
+                    outcome["readiness"] = response["readiness"]
+                return outcome
+            # Evicted between the worker's lookup and now: scan for real
+            response = await self._request({k: v for k, v in job.items() if k != "cache_dir"}, timeout)
+
+        counts = response.get("counts", {})
+        if incremental is not None:
+            # Merge partial results before anything else sees the file
+            counts = await asyncio.to_thread(incremental.finish, job, response, output_path) or counts
+        if cache is not None and key and not response.get("cached"):
+            await asyncio.to_thread(cache.store, key, output_path)
+
+        outcome = {"results_path": output_path, "counts": counts, "cached": False}
+        if "readiness" in response:
+            outcome["readiness"] = response["readiness"]
+        if "profile" in response:
+            outcome["profile"] = response["profile"]
+        if "incremental" in response:
+            outcome["incremental"] = {
+                name: response["incremental"].get(name) for name in ("mode", "changed", "removed")
+            }
+        return outcome
+
+    async def _scan(self,
+                    url: str,
+                    output_path: str,
+                    tags: Optional[List[str]],
+                    timeout: float,
+                    cache: Optional[AxeResultCache] = None,
+                    disable_rules: Optional[List[str]] = None,
+                    profile: bool = False,
+                    rules: Optional[List[str]] = None,
+                    incremental: Optional[AxeSegmentStore] = None,
+                    resources: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        job = self._scan_job(url, output_path, tags, cache, disable_rules, profile, rules, resources)
+        return await self._run_scan(job, output_path, cache, timeout, incremental)
+
+    async def _scan_batch(self,
+                          targets: Dict[str, str],
+                          tags: Optional[List[str]],
+                          concurrency: int,
+                          page_timeout: float,
+                          cache: Optional[AxeResultCache] = None,
+                          disable_rules: Optional[Dict[str, List[str]]] = None,
+                          profile: bool = False,
+                          rules: Optional[List[str]] = None,
+                          incremental: Optional[AxeSegmentStore] = None,
+                          resources: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        # The concurrency travels with every job of the batch; other callers
+        # sharing the worker keep their own limits
+        batch = {"id": next(self._batch_ids), "concurrency": max(1, concurrency)}
+
+        # The worker queues jobs beyond the batch limit, so the overall wait
+        # is bounded by the number of "rounds" the batch needs.
+        rounds = -(-len(targets) // max(1, concurrency))
+        batch_timeout = page_timeout * max(1, rounds) + 30
+
+        async def scan_one(url: str, output_path: str) -> Dict[str, Any]:
+            job = self._scan_job(
+                url, output_path, tags, cache, (disable_rules or {}).get(url), profile, rules, resources
+            )
+            job["page_timeout"] = int(page_timeout * 1000)
+            job["batch"] = batch
+            try:
+                return await self._run_scan(job, output_path, cache, batch_timeout, incremental)
+            except AxeWorkerError as e:
+                return {"error": str(e)}
+
+        outcomes = await asyncio.gather(*(scan_one(url, path) for url, path in targets.items()))
+        return dict(zip(targets, outcomes))
+
+
+_shared_worker: Optional[AxeWorker] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_worker() -> AxeWorker:
+    """Return the process-wide axe worker, creating it on first use"""
+    global _shared_worker
+    with _shared_lock:
+        if _shared_worker is None:
+            _shared_worker = AxeWorker()
+            atexit.register(_shared_worker.close)
+        return _shared_worker
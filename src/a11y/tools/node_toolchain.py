@@ -0,0 +1,215 @@
+# src/tools/node_toolchain.py
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10
+    tomllib = None
+
+from ..errors.exceptions import ToolchainError
+
+# Node.js packages the testing tools rely on, mapped to the executable
+# they provide (None for libraries that are only required()).
+TOOLCHAIN_PACKAGES: Dict[str, Optional[str]] = {
+    "axe-core": None,
+    "@axe-core/puppeteer": None,
+    "puppeteer": None,
+    "pa11y": "pa11y",
+    "lighthouse": "lighthouse",
+}
+
+FINGERPRINT_FILE = ".a11y-toolchain.json"
+
+
+class NodeToolchain:
+    """
+    Resolves the Node.js testing toolchain (axe-core, Puppeteer, pa11y,
+    Lighthouse) once and records it in a fingerprint file.
+
+    The fingerprint stores the pinned version specs from package.json and
+    pyproject.toml together with the resolved versions and paths. Later runs
+    only compare the pins and check that the recorded paths still exist,
+    and npm is invoked again only when a pin changed or a package vanished.
+    """
+
+    def __init__(self, project_dir: Optional[str] = None):
+        self.project_dir = Path(project_dir or os.getcwd())
+        self.node_modules = self.project_dir / "node_modules"
+        self.fingerprint_path = self.node_modules / FINGERPRINT_FILE
+        self.logger = logging.getLogger('NodeToolchain')
+        self._fingerprint: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def ensure(self) -> Dict[str, Any]:
+        """
+        Make sure the toolchain is installed and matches the pinned versions
+
+        Returns:
+            The current fingerprint
+        """
+        with self._lock:
+            if self._fingerprint is not None:
+                return self._fingerprint
+
+            pins = self.pinned_versions()
+            fingerprint = self._load_fingerprint()
+            if self._is_current(fingerprint, pins):
+                self.logger.debug("Node toolchain fingerprint is current")
+            else:
+                self._install(pins)
+                fingerprint = self._write_fingerprint(pins)
+
+            self._fingerprint = fingerprint
+            return fingerprint
+
+    def installed(self) -> Optional[Dict[str, Any]]:
+        """
+        The recorded fingerprint if it is current, without installing anything
+
+        Returns:
+            The fingerprint, or None if ensure() would have to run npm
+        """
+        if self._fingerprint is not None:
+            return self._fingerprint
+        fingerprint = self._load_fingerprint()
+        return fingerprint if self._is_current(fingerprint, self.pinned_versions()) else None
+
+    def pinned_versions(self) -> Dict[str, str]:
+        """
+        Collect the version specs of the toolchain packages
+
+        package.json is authoritative since that is what npm installs;
+        [tool.nodejs.dependencies] in pyproject.toml fills in the rest.
+        """
+        pins: Dict[str, str] = {}
+
+        pyproject = self.project_dir / "pyproject.toml"
+        if tomllib is not None and pyproject.exists():
+            with open(pyproject, "rb") as f:
+                node_deps = tomllib.load(f).get("tool", {}).get("nodejs", {}).get("dependencies", {})
+            pins.update({name: spec for name, spec in node_deps.items() if name in TOOLCHAIN_PACKAGES})
+
+        package_json = self.project_dir / "package.json"
+        if package_json.exists():
+            with open(package_json) as f:
+                package_deps = json.load(f).get("dependencies", {})
+            pins.update({name: spec for name, spec in package_deps.items() if name in TOOLCHAIN_PACKAGES})
+
+        for name in TOOLCHAIN_PACKAGES:
+            pins.setdefault(name, "latest")
+        return dict(sorted(pins.items()))
+
+    def package_path(self, name: str) -> Path:
+        """Installed location of a toolchain package"""
+        return Path(self.ensure()["packages"][name]["path"])
+
+    def bin_path(self, name: str) -> str:
+        """Executable of a toolchain package, falling back to PATH lookup"""
+        return self.ensure()["bins"].get(name) or name
+
+    def node_env(self) -> Dict[str, str]:
+        """Environment for Node.js processes that require() toolchain packages"""
+        env = dict(os.environ)
+        env["NODE_PATH"] = os.pathsep.join(
+            filter(None, [str(self.node_modules), env.get("NODE_PATH")])
+        )
+        return env
+
+    @staticmethod
+    def _pins_hash(pins: Dict[str, str]) -> str:
+        return hashlib.sha256(json.dumps(pins, sort_keys=True).encode()).hexdigest()
+
+    def _load_fingerprint(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.fingerprint_path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _is_current(self, fingerprint: Optional[Dict[str, Any]], pins: Dict[str, str]) -> bool:
+        if not fingerprint or fingerprint.get("pins_hash") != self._pins_hash(pins):
+            return False
+        recorded = list(fingerprint.get("packages", {}).values()) + [
+            {"path": path} for path in fingerprint.get("bins", {}).values()
+        ]
+        return all(Path(entry["path"]).exists() for entry in recorded)
+
+    def _install(self, pins: Dict[str, str]) -> None:
+        specs = [f"{name}@{spec}" for name, spec in pins.items()]
+        self.logger.info(f"Installing Node.js toolchain: {', '.join(specs)}")
+        try:
+            subprocess.run(
+                ['npm', 'install', '--no-save', '--no-audit', '--no-fund', *specs],
+                cwd=self.project_dir,
+                check=True,
+                capture_output=True
+            )
+        except FileNotFoundError:
+            raise ToolchainError("npm not found; please install Node.js and npm")
+        except subprocess.CalledProcessError as e:
+            raise ToolchainError(f"Error installing Node.js dependencies: {e.stderr.decode()}")
+
+    def _write_fingerprint(self, pins: Dict[str, str]) -> Dict[str, Any]:
+        packages = {}
+        bins = {}
+        for name, bin_name in TOOLCHAIN_PACKAGES.items():
+            package_dir = self.node_modules / name
+            try:
+                with open(package_dir / "package.json") as f:
+                    version = json.load(f).get("version")
+            except (OSError, json.JSONDecodeError):
+                raise ToolchainError(f"Node.js package {name} is missing after installation")
+            packages[name] = {"version": version, "path": str(package_dir)}
+
+            if bin_name:
+                bin_path = self.node_modules / ".bin" / bin_name
+                if bin_path.exists():
+                    bins[bin_name] = str(bin_path)
+
+        fingerprint = {
+            "pins": pins,
+            "pins_hash": self._pins_hash(pins),
+            "packages": packages,
+            "bins": bins,
+            "node_version": self._node_version(),
+            "created": datetime.now(timezone.utc).isoformat()
+        }
+        with open(self.fingerprint_path, "w") as f:
+            json.dump(fingerprint, f, indent=2)
+
+        self.logger.info(
+            "Node toolchain ready: " +
+            ", ".join(f"{name} {info['version']}" for name, info in packages.items())
+        )
+        return fingerprint
+
+    @staticmethod
+    def _node_version() -> Optional[str]:
+        try:
+            return subprocess.run(
+                ['node', '--version'], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+
+_toolchain: Optional[NodeToolchain] = None
+_toolchain_lock = threading.Lock()
+
+
+def get_toolchain() -> NodeToolchain:
+    """Return the process-wide toolchain for the current project directory"""
+    global _toolchain
+    with _toolchain_lock:
+        if _toolchain is None:
+            _toolchain = NodeToolchain()
+        return _toolchain
@@ -0,0 +1,203 @@
+# src/tools/node_worker.py
+
+import asyncio
+import itertools
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Type
+
+from ..errors.exceptions import ToolchainError, ToolExecutionError
+from .node_toolchain import NodeToolchain, get_toolchain
+
+
+class NodeWorkerClient:
+    """
+    Client for a long-lived Node.js worker built on worker_protocol.js.
+
+    Starts the worker script in the toolchain directory, sends jobs as
+    newline-delimited JSON over stdin and matches the one-line responses on
+    stdout to their futures by job id, so many jobs may be in flight at
+    once. A job that times out or whose caller is cancelled is cancelled
+    inside the worker as well.
+
+    All methods run on the event loop the worker was started from.
+    Subclasses set `name`, `error_class` and `stream_limit`, add their job
+    methods on top of _request() and may send setup jobs in _on_started().
+    """
+
+    # Used in log and error messages, e.g. "Axe worker"
+    name = "Node worker"
+    error_class: Type[ToolExecutionError] = ToolExecutionError
+    # Upper bound for a single protocol line
+    stream_limit = 1024 * 1024
+
+    def __init__(self,
+                 script_path: Path,
+                 node_binary: str = "node",
+                 toolchain: Optional[NodeToolchain] = None,
+                 startup_timeout: float = 30.0,
+                 logger: Optional[logging.Logger] = None):
+        self.script_path = Path(script_path)
+        self.node_binary = node_binary
+        self.toolchain = toolchain or get_toolchain()
+        self.startup_timeout = startup_timeout
+        self.logger = logger or logging.getLogger(type(self).__name__)
+
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._ready: Optional[asyncio.Event] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._readers: Set[asyncio.Task] = set()
+        self._ids = itertools.count(1)
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def _start(self) -> None:
+        """Start the worker process if it is not running yet"""
+        if self.is_running:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+
+        async with self._start_lock:
+            if self.is_running:
+                return
+
+            try:
+                await asyncio.to_thread(self.toolchain.ensure)
+            except ToolchainError as e:
+                raise self.error_class(str(e))
+
+            self.logger.info(f"Starting {self.name}...")
+            self._ready = asyncio.Event()
+            try:
+                self._process = await asyncio.create_subprocess_exec(
+                    self.node_binary, str(self.script_path),
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(self.toolchain.project_dir),
+                    env=self.toolchain.node_env(),
+                    limit=self.stream_limit
+                )
+            except OSError as e:
+                raise self.error_class(f"Could not start {self.name}: {e}")
+
+            for reader in (self._read_stdout, self._read_stderr):
+                task = asyncio.create_task(reader(self._process))
+                self._readers.add(task)
+                task.add_done_callback(self._readers.discard)
+
+            try:
+                await asyncio.wait_for(self._ready.wait(), self.startup_timeout)
+            except asyncio.TimeoutError:
+                await self._close()
+                raise self.error_class(f"{self.name} did not become ready in time")
+            if not self.is_running:
+                raise self.error_class(f"{self.name} exited during startup")
+
+        # Outside the lock: setup jobs go through _request() themselves
+        await self._on_started()
+
+    async def _on_started(self) -> None:
+        """Hook for setup jobs after a (re)start"""
+
+    async def _request(self, payload: Dict[str, Any], timeout: float = 120.0) -> Dict[str, Any]:
+        await self._start()
+
+        job_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[job_id] = future
+
+        try:
+            await self._send({**payload, "id": job_id})
+            response = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self._cancel_job(job_id)
+            raise self.error_class(f"{self.name} job {job_id} timed out after {timeout}s")
+        except asyncio.CancelledError:
+            self._cancel_job(job_id)
+            raise
+        finally:
+            self._pending.pop(job_id, None)
+
+        if not response.get("ok"):
+            raise self.error_class(response.get("error", f"Unknown {self.name} error"))
+        return response
+
+    def _cancel_job(self, job_id: int) -> None:
+        """Ask the worker to abandon a job and free its tab; fire and forget"""
+        if self.is_running:
+            try:
+                self._process.stdin.write((json.dumps({"cmd": "cancel", "target": job_id}) + "\n").encode())
+            except (OSError, RuntimeError):
+                pass
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        if not self.is_running:
+            raise self.error_class(f"{self.name} is not running")
+        try:
+            self._process.stdin.write((json.dumps(message) + "\n").encode())
+            await self._process.stdin.drain()
+        except (OSError, RuntimeError) as e:
+            raise self.error_class(f"Could not send job to {self.name}: {e}")
+
+    async def _close(self) -> None:
+        """Shut the worker down and release its browser"""
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        try:
+            if process.returncode is None:
+                process.stdin.close()
+                await asyncio.wait_for(process.wait(), 10)
+        except (OSError, asyncio.TimeoutError):
+            process.kill()
+        self._fail_pending(self.error_class(f"{self.name} was shut down"))
+        self.logger.info(f"{self.name} stopped")
+
+    async def _read_stdout(self, process: asyncio.subprocess.Process) -> None:
+        while True:
+            try:
+                line = await process.stdout.readline()
+            except (ValueError, asyncio.LimitOverrunError) as e:
+                self.logger.error(f"{self.name} output exceeded the line limit: {e}")
+                process.kill()
+                break
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                self.logger.warning(f"Ignoring malformed worker output: {line[:200]!r}")
+                continue
+
+            if message.get("event") == "ready":
+                self._ready.set()
+                continue
+
+            future = self._pending.get(message.get("id"))
+            if future is not None and not future.done():
+                future.set_result(message)
+
+        # stdout closed: the worker is gone, release everyone waiting on it
+        self._ready.set()
+        returncode = await process.wait()
+        if self._process in (process, None):
+            self._fail_pending(self.error_class(f"{self.name} exited with code {returncode}"))
+
+    async def _read_stderr(self, process: asyncio.subprocess.Process) -> None:
+        async for line in process.stderr:
+            self.logger.debug(line.decode(errors="replace").rstrip())
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in list(self._pending.values()):
+            if not future.done():
+                future.set_exception(error)
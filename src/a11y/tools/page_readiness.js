@@ -0,0 +1,48 @@
+// src/tools/page_readiness.js
+//
+// Navigation with DOM-stability readiness for Puppeteer pages, shared by
+// the axe and pa11y workers. Instead of waiting for network idle or a
+// fixed delay, a page is loaded up to DOMContentLoaded and then watched by
+// stability_probe.js until it has been quiet for a while.
+//
+// loadAndSettle() resolves to the probe's result plus
+// "dom_content_loaded_ms", the navigation time before the probe started.
+
+const fs = require('fs');
+const path = require('path');
+
+const PROBE_SOURCE = fs.readFileSync(path.join(__dirname, 'stability_probe.js'), 'utf8');
+
+// Client-side redirects replace the document while the probe runs
+const MAX_PROBE_ATTEMPTS = 3;
+
+function roundMs(ms) {
+    return Math.round(ms * 100) / 100;
+}
+
+function probeExpression(readiness) {
+    return `(${PROBE_SOURCE})(${JSON.stringify(readiness || {})})`;
+}
+
+async function waitForStable(page, readiness) {
+    for (let attempt = 1; ; attempt++) {
+        try {
+            return await page.evaluate(probeExpression(readiness));
+        } catch (error) {
+            if (attempt >= MAX_PROBE_ATTEMPTS || !/context was destroyed|navigat/i.test(error.message)) {
+                throw error;
+            }
+            await page.waitForNavigation({ waitUntil: 'domcontentloaded' }).catch(() => {});
+        }
+    }
+}
+
+async function loadAndSettle(page, url, { timeout, readiness } = {}) {
+    const started = performance.now();
+    const response = await page.goto(url, { waitUntil: 'domcontentloaded', timeout });
+    const loaded = performance.now();
+    const result = await waitForStable(page, readiness);
+    return { response, readiness: { ...result, dom_content_loaded_ms: roundMs(loaded - started) } };
+}
+
+module.exports = { loadAndSettle, waitForStable };
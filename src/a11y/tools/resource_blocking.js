@@ -0,0 +1,109 @@
+// src/tools/resource_blocking.js
+//
+// Resource profiles for Puppeteer pages, shared by the axe and pa11y
+// workers. A profile arrives from Python (ResourceProfile.to_job() in
+// wcag/resource_profiles.py) as
+//
+//   {"name": "no-media", "stub_types": ["image"], "block_types": [...],
+//    "block_hosts": [...], "url_patterns": [...]}
+//
+// applyResourceProfile() intercepts requests: a stubbed resource type is
+// answered with an empty placeholder so load and error handlers still
+// fire; blocked types and hosts (including their subdomains) are aborted.
+// Everything else loads normally.
+//
+// blockResourceUrls() is for pages whose request interception belongs to
+// someone else (pa11y intercepts every request itself and would clash with
+// a second handler). It blocks the profile's URL patterns in Chromium's
+// network stack instead, which never stubs and only recognises resource
+// types by their file extension.
+//
+// "full" and a missing profile leave the page untouched.
+
+// 1x1 transparent GIF
+const TRANSPARENT_GIF = Buffer.from('R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAICRAEAOw==', 'base64');
+
+const STUBS = {
+    image: { status: 200, contentType: 'image/gif', body: TRANSPARENT_GIF },
+    stylesheet: { status: 200, contentType: 'text/css', body: '' }
+};
+
+function matchesHost(url, hosts) {
+    let hostname;
+    try {
+        hostname = new URL(url).hostname;
+    } catch (error) {
+        return false;
+    }
+    return hosts.some(host => hostname === host || hostname.endsWith(`.${host}`));
+}
+
+function decide(profile, request) {
+    if (profile.block_hosts.length && matchesHost(request.url(), profile.block_hosts)) {
+        return 'block';
+    }
+    const type = request.resourceType();
+    if (profile.stub_types.includes(type) && STUBS[type]) {
+        return 'stub';
+    }
+    if (profile.stub_types.includes(type) || profile.block_types.includes(type)) {
+        return 'block';
+    }
+    return 'continue';
+}
+
+function normalize(profile) {
+    if (!profile || profile.name === 'full') {
+        return null;
+    }
+    return {
+        name: profile.name,
+        stub_types: profile.stub_types || [],
+        block_types: profile.block_types || [],
+        block_hosts: profile.block_hosts || [],
+        url_patterns: profile.url_patterns || []
+    };
+}
+
+// Sets the profile for the next navigation of `page`. Interception is
+// switched on once per tab and then follows whatever profile the tab
+// currently carries, so pooled tabs can change profiles between jobs.
+async function applyResourceProfile(page, profile) {
+    page.__resourceProfile = normalize(profile);
+    if (!page.__resourceProfile || page.__resourceInterception) {
+        return;
+    }
+    page.__resourceInterception = true;
+    await page.setRequestInterception(true);
+    page.on('request', request => {
+        if (request.isInterceptResolutionHandled()) {
+            return;
+        }
+        const current = page.__resourceProfile;
+        const action = current ? decide(current, request) : 'continue';
+        const settled = action === 'stub'
+            ? request.respond(STUBS[request.resourceType()])
+            : action === 'block'
+                ? request.abort('blockedbyclient')
+                : request.continue();
+        // The page may have navigated away or closed in the meantime
+        settled.catch(() => {});
+    });
+}
+
+async function blockResourceUrls(page, profile) {
+    const normalized = normalize(profile);
+    if (!normalized || !normalized.url_patterns.length) {
+        return;
+    }
+    const session = await page.target().createCDPSession();
+    await session.send('Network.enable');
+    await session.send('Network.setBlockedURLs', { urls: normalized.url_patterns });
+}
+
+function resourceProfileName(profile) {
+    const normalized = normalize(profile);
+    return normalized ? normalized.name : 'full';
+}
+
+module.exports = { applyResourceProfile, blockResourceUrls, resourceProfileName };
@@ -0,0 +1,77 @@
+// src/tools/stability_probe.js
+//
+// In-page readiness probe. Every loader runs it once the document has been
+// parsed: the axe and pa11y workers through page_readiness.js, the DevTools
+// axe path and page snapshots from Python (wcag/page_readiness.py). The
+// file holds a single function expression, so it can be embedded as
+// `(<source>)(options)`.
+//
+// The page counts as stable once, for `quiet_ms` in a row, no DOM mutation
+// and no layout shift has happened, no web font is still loading and the
+// document is no longer being parsed. Network activity is deliberately not
+// watched: long-polling and analytics beacons never go quiet. After
+// `timeout_ms` the probe gives up and reports "stable": false.
+//
+// Result: {"stable": true, "waited_ms": 412.3, "quiet_ms": 300,
+//          "mutations": 17, "layout_shifts": 1, "fonts_pending": false}
+async ({ quiet_ms = 300, timeout_ms = 10000, poll_ms = 50 } = {}) => {
+    const started = performance.now();
+    let lastActivity = started;
+    let mutations = 0;
+    let layoutShifts = 0;
+
+    const mutationObserver = new MutationObserver(records => {
+        mutations += records.length;
+        lastActivity = performance.now();
+    });
+    mutationObserver.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+
+    let shiftObserver = null;
+    if (typeof PerformanceObserver !== 'undefined' &&
+        (PerformanceObserver.supportedEntryTypes || []).includes('layout-shift')) {
+        shiftObserver = new PerformanceObserver(list => {
+            for (const entry of list.getEntries()) {
+                // Shifts caused by user input are expected, not instability
+                if (!entry.hadRecentInput) {
+                    layoutShifts++;
+                    lastActivity = performance.now();
+                }
+            }
+        });
+        shiftObserver.observe({ type: 'layout-shift' });
+    }
+
+    const busy = () => document.readyState === 'loading' ||
+        (!!document.fonts && document.fonts.status === 'loading');
+
+    let stable = false;
+    try {
+        for (;;) {
+            const now = performance.now();
+            if (busy()) {
+                lastActivity = now;
+            } else if (now - lastActivity >= quiet_ms) {
+                stable = true;
+                break;
+            }
+            if (now - started >= timeout_ms) {
+                break;
+            }
+            await new Promise(resolve => setTimeout(resolve, poll_ms));
+        }
+    } finally {
+        mutationObserver.disconnect();
+        if (shiftObserver) {
+            shiftObserver.disconnect();
+        }
+    }
+
+    return {
+        stable,
+        waited_ms: Math.round((performance.now() - started) * 100) / 100,
+        quiet_ms,
+        mutations,
+        layout_shifts: layoutShifts,
+        fonts_pending: !!document.fonts && document.fonts.status === 'loading'
+    };
+}
@@ -0,0 +1,209 @@
+// src/tools/worker_protocol.js
+//
+// Plumbing shared by the long-lived Node.js workers (axe_worker.js,
+// pa11y_worker.js). createWorker() owns the newline-delimited JSON
+// protocol on stdin/stdout, the lazily (re)launched Puppeteer browser,
+// cancellable jobs and shutdown; a worker only registers its commands:
+//
+//     const worker = createWorker('axe-worker', { onBrowserDisconnect });
+//     worker.serve({ scan, configure });
+//
+// Every job is answered with exactly one JSON line, {"id", "ok": true,
+// ...result} or {"id", "ok": false, "error"}; diagnostics go to stderr so
+// that stdout stays a clean protocol channel. Built-in commands:
+// {"cmd": "ping"}, {"cmd": "shutdown"} and {"cmd": "cancel", "target": <id>},
+// which abandons a job registered with trackJob(); it is not answered, the
+// cancelled job itself fails with an error.
+//
+// Slots is a counting semaphore whose limit can change at runtime, used for
+// tab pools and per-batch concurrency.
+
+const readline = require('readline');
+const puppeteer = require('puppeteer');
+
+class Slots {
+    constructor(limit) {
+        this.limit = Math.max(1, limit);
+        this.active = 0;
+        this.waiters = [];
+    }
+
+    async acquire() {
+        if (this.active < this.limit) {
+            this.active++;
+            return;
+        }
+        // release() hands its slot over directly, so it stays counted
+        await new Promise(resolve => this.waiters.push(resolve));
+    }
+
+    release() {
+        const next = this.waiters.shift();
+        if (next && this.active <= this.limit) {
+            next();
+        } else {
+            if (next) {
+                this.waiters.unshift(next);
+            }
+            this.active--;
+        }
+    }
+
+    resize(limit) {
+        this.limit = Math.max(1, limit);
+        while (this.active < this.limit && this.waiters.length) {
+            this.active++;
+            this.waiters.shift()();
+        }
+    }
+
+    get idle() {
+        return this.active === 0 && this.waiters.length === 0;
+    }
+}
+
+function createWorker(name, { onBrowserDisconnect } = {}) {
+    let browserPromise = null;
+    let shuttingDown = false;
+
+    // Jobs in progress, by id, so they can be cancelled
+    const activeJobs = new Map();
+
+    function send(message) {
+        process.stdout.write(JSON.stringify(message) + '\n');
+    }
+
+    function log(...args) {
+        console.error(`[${name}]`, ...args);
+    }
+
+    async function getBrowser() {
+        if (!browserPromise) {
+            log('Launching browser...');
+            browserPromise = puppeteer.launch({
+                headless: 'new',
+                args: ['--no-sandbox', '--disable-setuid-sandbox']
+            }).then(browser => {
+                // Relaunch lazily on the next job if Chromium goes away
+                browser.on('disconnected', () => {
+                    if (!shuttingDown) {
+                        log('Browser disconnected, will relaunch on next job');
+                    }
+                    browserPromise = null;
+                    if (onBrowserDisconnect) {
+                        onBrowserDisconnect();
+                    }
+                });
+                return browser;
+            }).catch(error => {
+                browserPromise = null;
+                throw error;
+            });
+        }
+        return browserPromise;
+    }
+
+    // Registers a job for cancellation. control.cancelled rejects once the
+    // job is cancelled (race the work against it), control.check() throws
+    // if it already was, and control.done() must run when the job ends.
+    function trackJob(job, onCancel) {
+        const error = () => new Error(`Job ${job.id} cancelled`);
+        const control = { isCancelled: false };
+        control.cancelled = new Promise((_, reject) => {
+            control.cancel = () => {
+                control.isCancelled = true;
+                if (onCancel) {
+                    onCancel();
+                }
+                reject(error());
+            };
+        });
+        control.cancelled.catch(() => {});
+        control.check = () => {
+            if (control.isCancelled) {
+                throw error();
+            }
+        };
+        control.done = () => activeJobs.delete(job.id);
+        activeJobs.set(job.id, control);
+        return control;
+    }
+
+    function cancel(job) {
+        const control = activeJobs.get(job.target);
+        if (control) {
+            log(`Cancelling job ${job.target}`);
+            control.cancel();
+        }
+    }
+
+    async function shutdown() {
+        if (shuttingDown) {
+            return;
+        }
+        shuttingDown = true;
+        if (browserPromise) {
+            try {
+                const browser = await browserPromise;
+                log('Closing browser...');
+                await browser.close();
+            } catch (error) {
+                log('Error closing browser:', error.message);
+            }
+        }
+        process.exit(0);
+    }
+
+    async function handle(commands, job) {
+        try {
+            switch (job.cmd) {
+                case 'cancel':
+                    cancel(job);
+                    return;
+                case 'ping':
+                    send({ id: job.id, ok: true });
+                    return;
+                case 'shutdown':
+                    send({ id: job.id, ok: true });
+                    await shutdown();
+                    return;
+            }
+            if (!Object.prototype.hasOwnProperty.call(commands, job.cmd)) {
+                send({ id: job.id, ok: false, error: `Unknown command: ${job.cmd}` });
+                return;
+            }
+            send({ id: job.id, ok: true, ...(await commands[job.cmd](job)) });
+        } catch (error) {
+            log(`Job ${job.id} failed:`, error.message);
+            send({ id: job.id, ok: false, error: error.message });
+        }
+    }
+
+    function serve(commands) {
+        const input = readline.createInterface({ input: process.stdin, terminal: false });
+
+        input.on('line', line => {
+            if (!line.trim()) {
+                return;
+            }
+            let job;
+            try {
+                job = JSON.parse(line);
+            } catch (error) {
+                send({ id: null, ok: false, error: `Invalid job: ${error.message}` });
+                return;
+            }
+            handle(commands, job);
+        });
+
+        // The Python side closing stdin means the worker is no longer needed
+        input.on('close', shutdown);
+        process.on('SIGTERM', shutdown);
+
+        send({ event: 'ready', pid: process.pid });
+    }
+
+    return { log, getBrowser, trackJob, serve };
+}
+
+module.exports = { Slots, createWorker };
@@ -1,11 +1,32 @@
 # src/wcag/__init__.py
+#
+# Exporte werden erst beim ersten Zugriff importiert, damit z.B. die
+# Ergebnisverarbeitung weder CrewAI noch Browser- und HTTP-Bibliotheken lädt.
 
-from .unified_result_processor import UnifiedResultProcessor
-from .wcag_integration_manager import WCAGIntegrationManager
-from .wcag_mapping_agent import WCAGMappingAgent
+import importlib
+
+_EXPORTS = {
+    'BrowserPool': '.browser_pool',
+    'ConformanceProfile': '.conformance_profile',
+    'PageSnapshot': '.page_snapshot',
+    'UnifiedResultProcessor': '.unified_result_processor',
+    'WCAGIntegrationManager': '.wcag_integration_manager',
+    'WCAGMappingAgent': '.wcag_mapping_agent',
+}
 
 __all__ = [
+    'BrowserPool',
+    'ConformanceProfile',
+    'PageSnapshot',
     'UnifiedResultProcessor',
     'WCAGIntegrationManager',
     'WCAGMappingAgent'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(module, __name__), name)
+    return value
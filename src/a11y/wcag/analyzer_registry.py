@@ -0,0 +1,153 @@
+# src/wcag/analyzer_registry.py
+
+import importlib
+import importlib.util
+import shutil
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from ..tools.node_toolchain import TOOLCHAIN_PACKAGES, get_toolchain
+
+if TYPE_CHECKING:
+    from .base_analyzer import BaseAnalyzer
+
+
+@dataclass(frozen=True)
+class ToolchainState:
+    """
+    Stand der Node.js-Werkzeugkette für die Abhängigkeitsprüfung
+
+    fingerprint ist der aktuelle Fingerprint oder None, wenn ensure() erst
+    noch npm ausführen müsste; das geschieht beim ersten Einsatz eines
+    Werkzeugs und nicht bei der Prüfung. Bis dahin gelten Pakete und
+    Programme der Werkzeugkette als verfügbar, sofern npm sie installieren
+    kann.
+    """
+    fingerprint: Optional[Dict[str, Any]] = None
+    can_install: bool = False
+
+    @classmethod
+    def current(cls) -> "ToolchainState":
+        return cls(get_toolchain().installed(), shutil.which('npm') is not None)
+
+    def _pending_install(self) -> bool:
+        return self.fingerprint is None and self.can_install
+
+    def has_package(self, name: str) -> bool:
+        if self.fingerprint is not None and name in self.fingerprint.get('packages', {}):
+            return True
+        return self._pending_install() and name in TOOLCHAIN_PACKAGES
+
+    def has_bin(self, name: str) -> bool:
+        if self.fingerprint is not None and name in self.fingerprint.get('bins', {}):
+            return True
+        return self._pending_install() and name in TOOLCHAIN_PACKAGES.values()
+
+
+@dataclass(frozen=True)
+class AnalyzerSpec:
+    """
+    Eintrag der Analyzer-Registry
+
+    Beschreibt, wo ein Analyzer liegt und was er zur Laufzeit braucht. Das
+    Modul wird erst mit load() importiert, sodass Einstiegspunkte, die
+    einen Analyzer nicht nutzen, auch seine Abhängigkeiten nicht laden.
+    """
+    name: str
+    module: str
+    class_name: str
+    # Python-Module, Pakete der Node.js-Werkzeugkette bzw. Programme (aus
+    # der Werkzeugkette oder im PATH), ohne die der Analyzer nicht läuft
+    python_modules: Tuple[str, ...] = ()
+    node_packages: Tuple[str, ...] = ()
+    executables: Tuple[str, ...] = ()
+
+    def load(self) -> Type["BaseAnalyzer"]:
+        """Importiert das Modul des Analyzers und liefert seine Klasse"""
+        module = importlib.import_module(f'.{self.module}', __package__)
+        return getattr(module, self.class_name)
+
+    def missing_dependencies(self, toolchain: Optional[ToolchainState] = None) -> List[str]:
+        """
+        Fehlende Abhängigkeiten, ohne sie zu importieren oder zu installieren
+
+        Args:
+            toolchain: Stand der Werkzeugkette; ohne Angabe wird er bei
+                Bedarf ermittelt
+        """
+        missing = [name for name in self.python_modules if not _importable(name)]
+        if self.node_packages or self.executables:
+            toolchain = toolchain or ToolchainState.current()
+        missing += [name for name in self.node_packages if not toolchain.has_package(name)]
+        missing += [
+            name for name in self.executables
+            if not toolchain.has_bin(name) and shutil.which(name) is None
+        ]
+        return missing
+
+
+def _importable(name: str) -> bool:
+    # Bereits geladene Module haben nicht immer ein __spec__
+    return name in sys.modules or importlib.util.find_spec(name) is not None
+
+
+ANALYZERS: Dict[str, AnalyzerSpec] = {
+    'html': AnalyzerSpec(
+        'html', 'html_analyzer', 'HTMLAnalyzer',
+        python_modules=('bs4', 'aiohttp'),
+    ),
+    'pa11y': AnalyzerSpec(
+        'pa11y', 'pa11y_analyzer', 'Pa11yAnalyzer',
+        node_packages=('pa11y', 'puppeteer'),
+        executables=('node',),
+    ),
+    'axe': AnalyzerSpec(
+        'axe', 'axe_analyzer', 'AxeAnalyzer',
+        python_modules=('aiohttp', 'playwright'),
+        node_packages=('axe-core',),
+    ),
+    'lighthouse': AnalyzerSpec(
+        'lighthouse', 'lighthouse_analyzer', 'LighthouseAnalyzer',
+        python_modules=('playwright',),
+        executables=('lighthouse',),
+    ),
+}
+
+
+def get_analyzer_spec(name: str) -> AnalyzerSpec:
+    try:
+        return ANALYZERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown analyzer: {name} (expected one of {', '.join(ANALYZERS)})"
+        ) from None
+
+
+def load_analyzer(name: str) -> Type["BaseAnalyzer"]:
+    """Analyzer-Klasse zu einem Registry-Namen (z.B. 'axe')"""
+    return get_analyzer_spec(name).load()
+
+
+def resolve_analyzers(names: Optional[Iterable[str]] = None) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Teilt die gewünschten Analyzer in lauffähige und solche mit fehlenden Abhängigkeiten
+
+    Args:
+        names: Registry-Namen; None für alle registrierten Analyzer
+
+    Returns:
+        (lauffähige Namen, Name -> fehlende Abhängigkeiten)
+    """
+    specs = {name: get_analyzer_spec(name) for name in (ANALYZERS if names is None else names)}
+    toolchain = None
+    if any(spec.node_packages or spec.executables for spec in specs.values()):
+        toolchain = ToolchainState.current()
+    available, missing = [], {}
+    for name, spec in specs.items():
+        absent = spec.missing_dependencies(toolchain)
+        if absent:
+            missing[name] = absent
+        else:
+            available.append(name)
+    return available, missing
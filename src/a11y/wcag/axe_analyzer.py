@@ -0,0 +1,113 @@
+# src/wcag/axe_analyzer.py
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .base_analyzer import BaseAnalyzer
+from .browser_pool import BrowserPool
+from .cdp_client import CDPConnection
+from .page_readiness import probe_expression
+from ..errors.exceptions import CDPError
+from ..tools.node_toolchain import get_toolchain
+
+class AxeAnalyzer(BaseAnalyzer):
+    """Analyzer für Axe Core Tests über das DevTools-Protokoll"""
+
+    # Zeitlimits in Sekunden für das Laden der Seite und den axe-Lauf
+    NAVIGATION_TIMEOUT = 60
+    RUN_TIMEOUT = 120
+
+    # Quelltext von axe.min.js je Pfad; wird einmal je Prozess gelesen
+    _axe_sources: Dict[Path, str] = {}
+
+    def __init__(self, *args, axe_script: Optional[Path] = None, **kwargs):
+        """
+        Args:
+            axe_script: Lokale axe.min.js; Standard ist die aus dem axe-core-
+                Paket der Node.js-Werkzeugkette
+        """
+        super().__init__(*args, **kwargs)
+        self.axe_script = axe_script
+    
+    async def analyze(self, url: str) -> Dict[str, Any]:
+        """
+        Führt Axe Core Tests aus und verarbeitet Ergebnisse
+
+        axe läuft ohne Node-Prozess direkt im Browser: über die dauerhafte
+        DevTools-Verbindung eines Pool-Browsers wird ein Tab geöffnet, die
+        Seite bis zur DOM-Stabilität geladen, axe.min.js per Runtime.evaluate
+        injiziert und axe.run mit der Regelauswahl des Konformitätsprofils
+        ausgeführt. Die gewählte Wartezeit steht unter "readiness".
+        """
+        try:
+            source = await asyncio.to_thread(self._axe_source)
+            pool = self.browser_pool
+            if pool is not None and pool.remote_debugging:
+                results, readiness = await self._run_axe(pool, url, source)
+            else:
+                # Ohne DevTools-fähigen Pool ein eigener Browser für diese Analyse
+                async with BrowserPool(size=1, remote_debugging=True, logger=self.logger) as own_pool:
+                    results, readiness = await self._run_axe(own_pool, url, source)
+
+            return {
+                "status": "success",
+                "tool": "axe",
+                "url": url,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "results": results,
+                "readiness": readiness
+            }
+                        
+        except Exception as e:
+            return self._create_error_result(str(e), url)
+
+    def _axe_source(self) -> str:
+        path = Path(self.axe_script) if self.axe_script else \
+            get_toolchain().package_path('axe-core') / 'axe.min.js'
+        source = self._axe_sources.get(path)
+        if source is None:
+            source = self._axe_sources[path] = path.read_text(encoding='utf-8')
+        return source
+
+    async def _run_axe(self, pool: BrowserPool, url: str, source: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        async with pool.cdp() as connection:
+            return await self._run_axe_in_tab(connection, self._target(url), source)
+
+    async def _run_axe_in_tab(self, connection: CDPConnection, target: str,
+                              source: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Lädt target in einem neuen Tab und führt axe aus
+
+        Returns:
+            (axe-Ergebnis, Ergebnis der Stabilitätssonde)
+        """
+        async with connection.page() as tab:
+            await tab.send('Page.enable')
+            # Ressourcenprofil als URL-Muster im Netzwerkstack des Tabs sperren
+            blocked = self.conformance.resource_profile('axe').url_patterns()
+            if blocked:
+                await tab.send('Network.enable')
+                await tab.send('Network.setBlockedURLs', {'urls': blocked})
+            # Statt auf das load-Ereignis nur bis DOMContentLoaded warten und
+            # dann, bis das DOM zur Ruhe gekommen ist
+            parsed = tab.wait_for('Page.domContentEventFired')
+            navigation = await tab.send('Page.navigate', {'url': target}, timeout=self.NAVIGATION_TIMEOUT)
+            if navigation.get('errorText'):
+                parsed.cancel()
+                raise CDPError(f"Navigation to {target} failed: {navigation['errorText']}")
+            try:
+                await asyncio.wait_for(parsed, self.NAVIGATION_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise CDPError(f"Page did not load within {self.NAVIGATION_TIMEOUT}s")
+            readiness = await tab.evaluate(probe_expression(), await_promise=True, timeout=self.NAVIGATION_TIMEOUT)
+
+            # axe einmal je Seite injizieren, dann mit der Regelauswahl ausführen
+            await tab.evaluate(source)
+            options = json.dumps(self.conformance.to_axe())
+            results = await tab.evaluate(
+                f"axe.run(document, {options})", await_promise=True, timeout=self.RUN_TIMEOUT
+            )
+            return results, readiness
@@ -0,0 +1,97 @@
+# src/wcag/base_analyzer.py
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ..tools.node_toolchain import get_toolchain
+from .conformance_profile import ConformanceProfile
+
+if TYPE_CHECKING:
+    # Nur für Annotationen; die Module ziehen aiohttp nach
+    from .browser_pool import BrowserPool
+    from .http_client import HTTPClient
+    from .page_snapshot import PageSnapshot
+
+class BaseAnalyzer:
+    """Basisklasse für alle WCAG Analyzer"""
+    
+    def __init__(self, results_path: Path, logger: logging.Logger, *,
+                 conformance: Optional[ConformanceProfile] = None,
+                 browser_pool: Optional["BrowserPool"] = None,
+                 snapshot: Optional["PageSnapshot"] = None,
+                 http_client: Optional["HTTPClient"] = None):
+        self.results_path = results_path
+        self.logger = logger
+        # Regelauswahl, die das Werkzeug ausführen soll
+        self.conformance = conformance or ConformanceProfile()
+        # Gemeinsame, vorgewärmte Browser für browserbasierte Analyzer
+        self.browser_pool = browser_pool
+        # Einmal gerenderte Seite; ohne Snapshot lädt der Analyzer selbst
+        self.snapshot = snapshot
+        # Gemeinsame HTTP-Session mit Keep-Alive und bedingten Abrufen
+        self.http_client = http_client
+        self.tool_name = self.__class__.__name__.replace('Analyzer', '').lower()
+        
+    async def analyze(self, url: str) -> Dict[str, Any]:
+        """
+        Abstrakte Methode für die Analyse
+        
+        Args:
+            url: Zu testende URL
+            
+        Returns:
+            Analyseergebnisse
+        """
+        raise NotImplementedError("Subclasses must implement analyze method")
+        
+    async def _run_process(self, cmd: List[str]):
+        """
+        Führt ein externes Werkzeug aus
+
+        Wird die Analyse abgebrochen (z.B. durch ein Zeitlimit), wird auch
+        der Prozess beendet, statt ihn weiterlaufen zu lassen.
+
+        Returns:
+            (returncode, stdout, stderr)
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        return process.returncode, stdout, stderr
+
+    async def _tool_command(self, name: str) -> str:
+        """
+        Programm aus der Node.js-Werkzeugkette des Projekts (z.B. 'pa11y')
+
+        Beim ersten Aufruf kann ensure() npm ausführen; das geschieht in
+        einem Thread, damit die Event-Loop nicht blockiert.
+        """
+        return await asyncio.to_thread(get_toolchain().bin_path, name)
+
+    def _target(self, url: str) -> str:
+        """Das gespeicherte Snapshot-DOM, falls vorhanden, sonst die URL selbst"""
+        if self.snapshot is not None and self.snapshot.file_url:
+            return self.snapshot.file_url
+        return url
+
+    def _create_error_result(self, error: str, url: str) -> Dict[str, Any]:
+        """Erstellt ein standardisiertes Fehlerergebnis"""
+        return {
+            "status": "error",
+            "error": str(error),
+            "tool": self.tool_name,
+            "url": url,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
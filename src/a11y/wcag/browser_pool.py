@@ -0,0 +1,352 @@
+# src/wcag/browser_pool.py
+
+import asyncio
+import logging
+import socket
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, List, Optional
+
+from ..errors.exceptions import BrowserPoolError
+from .cdp_client import CDPConnection
+
+DEFAULT_LAUNCH_ARGS = ['--no-sandbox', '--disable-setuid-sandbox']
+
+
+@dataclass
+class PooledBrowser:
+    """Ein vorgewärmter Browser des Pools mit seinen Nutzungszählern"""
+    slot: int
+    browser: Any = None
+    # Seit dem Start ausgegebene Kontexte
+    pages_served: int = 0
+    # Derzeit ausgeliehene Kontexte
+    active: int = 0
+    retiring: bool = False
+    crashed: bool = False
+    idle: asyncio.Event = field(default_factory=asyncio.Event)
+    # DevTools-Port für Werkzeuge, die sich selbst verbinden (Lighthouse)
+    debugging_port: Optional[int] = None
+    devtools_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Dauerhafte DevTools-Verbindung für In-Process-Werkzeuge (axe)
+    cdp: Optional[CDPConnection] = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.browser is not None and not self.crashed and self.browser.is_connected()
+
+
+class BrowserPool:
+    """
+    Pool warmer Chromium-Instanzen für alle Analysen eines Managers.
+
+    Der Pool startet Playwright einmal und hält eine feste Anzahl Browser
+    bereit. Analyzer leihen sich isolierte Kontexte (oder Seiten in einem
+    eigenen Kontext) aus; wiederholte Analysen zahlen damit keine
+    Startkosten mehr. Ein Browser wird ersetzt, nachdem er max_pages
+    Kontexte ausgegeben hat oder sein Speicherbedarf max_memory_mb
+    übersteigt, und abgestürzte Browser werden beim nächsten Zugriff
+    transparent neu gestartet.
+    """
+
+    def __init__(self,
+                 size: int = 2,
+                 max_pages: int = 50,
+                 max_memory_mb: Optional[float] = 1536,
+                 launch_args: Optional[List[str]] = None,
+                 remote_debugging: bool = False,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            size: Anzahl gleichzeitig gehaltener Browser
+            max_pages: Kontexte je Browser bis zum Recycling
+            max_memory_mb: Speichergrenze (RSS aller Browserprozesse);
+                None deaktiviert die Prüfung
+            launch_args: Chromium-Startargumente
+            remote_debugging: Browser mit DevTools-Port starten, damit
+                externe Werkzeuge sie über devtools() mitbenutzen können
+            logger: Logger; Standard ist 'BrowserPool'
+        """
+        if size < 1:
+            raise ValueError("Browser pool size must be at least 1")
+        self.size = size
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.launch_args = list(launch_args or DEFAULT_LAUNCH_ARGS)
+        self.remote_debugging = remote_debugging
+        self.logger = logger or logging.getLogger('BrowserPool')
+
+        self._playwright = None
+        self._slots: List[PooledBrowser] = []
+        self._lock = asyncio.Lock()
+        self._closed = False
+        self.launches = 0
+
+    async def __aenter__(self) -> "BrowserPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def started(self) -> bool:
+        return bool(self._slots)
+
+    async def start(self) -> None:
+        """Startet Playwright und alle Browser des Pools"""
+        async with self._lock:
+            if self._closed:
+                raise BrowserPoolError("Browser pool has been closed")
+            if self._slots:
+                return
+            self._slots = [PooledBrowser(slot=i) for i in range(self.size)]
+            await asyncio.gather(*(self._relaunch(slot) for slot in self._slots))
+            self.logger.info(f"Browser pool started with {self.size} browser(s)")
+
+    async def close(self) -> None:
+        """Schließt alle Browser und beendet Playwright"""
+        async with self._lock:
+            self._closed = True
+            slots, self._slots = self._slots, []
+            for slot in slots:
+                await self._close_browser(slot)
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception as e:
+                    self.logger.error(f"Error stopping Playwright: {str(e)}")
+                self._playwright = None
+
+    @asynccontextmanager
+    async def context(self, **context_options) -> AsyncIterator[Any]:
+        """
+        Leiht einen isolierten Browser-Kontext aus
+
+        Der Kontext wird beim Verlassen geschlossen; danach entscheidet der
+        Pool, ob der zugehörige Browser recycelt wird.
+        """
+        slot, context = await self._checkout(context_options)
+        try:
+            yield context
+        finally:
+            try:
+                await context.close()
+            except Exception as e:
+                # Ein abgestürzter Browser nimmt seine Kontexte mit
+                self.logger.debug(f"Error closing browser context: {str(e)}")
+            await self._checkin(slot)
+
+    @asynccontextmanager
+    async def page(self, **context_options) -> AsyncIterator[Any]:
+        """Leiht eine Seite in einem eigenen, isolierten Kontext aus"""
+        async with self.context(**context_options) as context:
+            yield await context.new_page()
+
+    @asynccontextmanager
+    async def devtools(self) -> AsyncIterator[int]:
+        """
+        Leiht den DevTools-Port eines Browsers für ein externes Werkzeug aus
+
+        Der Browser zählt dabei als belegt und wird nicht recycelt. Werkzeuge,
+        die den ganzen Browser steuern (Lighthouse emuliert und setzt den
+        Speicher zurück), laufen je Browser nacheinander; Kontexte anderer
+        Analyzer bleiben davon unberührt.
+        """
+        if not self.remote_debugging:
+            raise BrowserPoolError("Browser pool was started without remote debugging")
+        if not self.started:
+            await self.start()
+
+        slot = await self._pick_slot()
+        try:
+            async with slot.devtools_lock:
+                slot.pages_served += 1
+                yield slot.debugging_port
+        finally:
+            await self._checkin(slot)
+
+    @asynccontextmanager
+    async def cdp(self) -> AsyncIterator[CDPConnection]:
+        """
+        Leiht die dauerhafte DevTools-Verbindung eines Browsers aus
+
+        Die Verbindung wird beim ersten Zugriff aufgebaut und bleibt bis zum
+        Recycling des Browsers offen; Aufrufer öffnen darüber eigene Tabs
+        und laufen damit nebeneinander.
+        """
+        if not self.remote_debugging:
+            raise BrowserPoolError("Browser pool was started without remote debugging")
+        if not self.started:
+            await self.start()
+
+        slot = await self._pick_slot()
+        try:
+            if slot.cdp is None or not slot.cdp.connected:
+                slot.cdp = await self._connect_cdp(slot)
+            slot.pages_served += 1
+            yield slot.cdp
+        finally:
+            await self._checkin(slot)
+
+    async def _checkout(self, context_options):
+        if not self.started:
+            await self.start()
+
+        # Ein Neustart pro Versuch; ein zweiter Absturz in Folge wird gemeldet
+        last_error: Optional[Exception] = None
+        for _ in range(2):
+            slot = await self._pick_slot()
+            try:
+                context = await slot.browser.new_context(**context_options)
+            except Exception as e:
+                last_error = e
+                self.logger.warning(f"Browser {slot.slot} failed to open a context: {str(e)}")
+                slot.crashed = True
+                slot.active -= 1
+                if slot.active == 0:
+                    slot.idle.set()
+                continue
+            slot.pages_served += 1
+            return slot, context
+        raise BrowserPoolError(f"No usable browser in pool: {last_error}")
+
+    async def _pick_slot(self) -> PooledBrowser:
+        async with self._lock:
+            while True:
+                if self._closed:
+                    raise BrowserPoolError("Browser pool has been closed")
+                for slot in self._slots:
+                    if slot.active == 0 and (slot.retiring or not slot.healthy):
+                        await self._relaunch(slot)
+                candidates = [s for s in self._slots if s.healthy and not s.retiring]
+                if candidates:
+                    break
+                # Alle Browser warten auf ihr Recycling; auf den am wenigsten
+                # belasteten warten und ihn dann ersetzen
+                await self._wait_idle(min(self._slots, key=lambda s: s.active))
+
+            slot = min(candidates, key=lambda s: (s.active, s.pages_served))
+            slot.active += 1
+            slot.idle.clear()
+            return slot
+
+    async def _checkin(self, slot: PooledBrowser) -> None:
+        slot.active -= 1
+        if not slot.retiring and slot.healthy:
+            if slot.pages_served >= self.max_pages:
+                self.logger.info(f"Recycling browser {slot.slot} after {slot.pages_served} pages")
+                slot.retiring = True
+            elif self.max_memory_mb is not None:
+                memory = await self._browser_memory_mb(slot.browser)
+                if memory is not None and memory > self.max_memory_mb:
+                    self.logger.info(
+                        f"Recycling browser {slot.slot} at {memory:.0f} MB "
+                        f"(limit {self.max_memory_mb:.0f} MB)"
+                    )
+                    slot.retiring = True
+        if slot.active == 0:
+            slot.idle.set()
+            if slot.retiring or slot.crashed:
+                async with self._lock:
+                    if slot in self._slots and slot.active == 0 and (slot.retiring or slot.crashed):
+                        try:
+                            await self._relaunch(slot)
+                        except Exception as e:
+                            # Läuft im finally des Aufrufers und darf dessen
+                            # Ergebnis nicht verdecken; der nächste Checkout
+                            # startet den Browser erneut
+                            self.logger.error(f"Error relaunching browser {slot.slot}: {str(e)}")
+                            slot.crashed = True
+
+    async def _wait_idle(self, slot: PooledBrowser) -> None:
+        # Der Lock wird während des Wartens freigegeben, damit Kontexte
+        # zurückgegeben werden können
+        self._lock.release()
+        try:
+            await slot.idle.wait()
+        finally:
+            await self._lock.acquire()
+
+    async def _relaunch(self, slot: PooledBrowser) -> None:
+        """Ersetzt den Browser eines Slots durch einen frisch gestarteten"""
+        await self._close_browser(slot)
+        if self.remote_debugging:
+            slot.debugging_port = _free_port()
+            browser = await self._launch([f'--remote-debugging-port={slot.debugging_port}'])
+        else:
+            browser = await self._launch()
+        browser.on("disconnected", lambda _: self._on_disconnected(slot, browser))
+        slot.browser = browser
+        slot.pages_served = 0
+        slot.retiring = False
+        slot.crashed = False
+        self.launches += 1
+
+    def _on_disconnected(self, slot: PooledBrowser, browser) -> None:
+        if slot.browser is browser and not self._closed:
+            self.logger.warning(f"Browser {slot.slot} disconnected; it will be restarted")
+            slot.crashed = True
+
+    async def _close_browser(self, slot: PooledBrowser) -> None:
+        cdp, slot.cdp = slot.cdp, None
+        if cdp is not None:
+            await cdp.close()
+        browser, slot.browser = slot.browser, None
+        if browser is None:
+            return
+        try:
+            if browser.is_connected():
+                await browser.close()
+        except Exception as e:
+            self.logger.debug(f"Error closing browser {slot.slot}: {str(e)}")
+
+    async def _launch(self, extra_args: Optional[List[str]] = None):
+        """Startet einen Chromium-Browser"""
+        try:
+            if self._playwright is None:
+                from playwright.async_api import async_playwright
+                self._playwright = await async_playwright().start()
+            return await self._playwright.chromium.launch(args=self.launch_args + list(extra_args or []))
+        except Exception as e:
+            raise BrowserPoolError(f"Error launching browser: {str(e)}") from e
+
+    async def _connect_cdp(self, slot: PooledBrowser) -> CDPConnection:
+        return await CDPConnection.connect(slot.debugging_port, logger=self.logger)
+
+    async def _browser_memory_mb(self, browser) -> Optional[float]:
+        """
+        Resident Set Size aller Prozesse eines Browsers in MB
+
+        Die Prozess-IDs liefert das CDP SystemInfo-Protokoll; gelesen wird
+        /proc, auf anderen Plattformen entfällt die Prüfung (None).
+        """
+        try:
+            session = await browser.new_browser_cdp_session()
+            try:
+                info = await session.send("SystemInfo.getProcessInfo")
+            finally:
+                await session.detach()
+        except Exception as e:
+            self.logger.debug(f"Could not query browser processes: {str(e)}")
+            return None
+
+        total_kb = 0
+        for process in info.get("processInfo", []):
+            status = Path(f"/proc/{process.get('id')}/status")
+            try:
+                for line in status.read_text().splitlines():
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+            except (OSError, ValueError, IndexError):
+                continue
+        return total_kb / 1024 if total_kb else None
+
+
+def _free_port() -> int:
+    """Ein derzeit freier lokaler TCP-Port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
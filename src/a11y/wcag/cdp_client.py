@@ -0,0 +1,174 @@
+# src/wcag/cdp_client.py
+
+import asyncio
+import itertools
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from ..errors.exceptions import CDPError
+
+# axe-Ergebnisse großer Seiten passen nicht in aiohttps Standardgrenze von 4 MB
+MAX_MESSAGE_SIZE = 256 * 1024 * 1024
+
+
+class CDPSession:
+    """Eine an ein Ziel (Tab) angehängte Sitzung auf einer CDPConnection"""
+
+    def __init__(self, connection: "CDPConnection", session_id: str, target_id: str):
+        self.connection = connection
+        self.session_id = session_id
+        self.target_id = target_id
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None,
+                   timeout: Optional[float] = None) -> Dict[str, Any]:
+        return await self.connection.send(method, params, session_id=self.session_id, timeout=timeout)
+
+    def wait_for(self, event: str) -> "asyncio.Future":
+        """Future für das nächste Ereignis dieses Namens in dieser Sitzung"""
+        return self.connection.wait_for(event, self.session_id)
+
+    async def evaluate(self, expression: str, await_promise: bool = False,
+                       timeout: Optional[float] = None) -> Any:
+        """
+        Wertet JavaScript im Tab aus und liefert das Ergebnis als JSON-Wert
+
+        Raises:
+            CDPError: bei einer Ausnahme im Tab
+        """
+        response = await self.send('Runtime.evaluate', {
+            'expression': expression,
+            'awaitPromise': await_promise,
+            'returnByValue': True,
+        }, timeout=timeout)
+        if 'exceptionDetails' in response:
+            details = response['exceptionDetails']
+            message = details.get('exception', {}).get('description') or details.get('text')
+            raise CDPError(f"JavaScript error: {message}")
+        return response.get('result', {}).get('value')
+
+
+class CDPConnection:
+    """
+    Persistente DevTools-Websocket-Verbindung zu einem Browser
+
+    Über eine Verbindung laufen beliebig viele Tabs (flache Sitzungen per
+    Target.attachToTarget). Antworten werden per id zugeordnet, Ereignisse
+    per Sitzung und Name an Wartende verteilt.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, websocket: aiohttp.ClientWebSocketResponse,
+                 logger: Optional[logging.Logger] = None):
+        self._session = session
+        self._websocket = websocket
+        self.logger = logger or logging.getLogger('CDPConnection')
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._waiters: Dict[Tuple[Optional[str], str], List[asyncio.Future]] = {}
+        self._reader = asyncio.ensure_future(self._read())
+
+    @classmethod
+    async def connect(cls, port: int, host: str = '127.0.0.1',
+                      logger: Optional[logging.Logger] = None) -> "CDPConnection":
+        """Verbindet sich mit dem Browser-Endpunkt eines DevTools-Ports"""
+        session = aiohttp.ClientSession()
+        try:
+            async with session.get(f'http://{host}:{port}/json/version') as response:
+                endpoint = (await response.json())['webSocketDebuggerUrl']
+            websocket = await session.ws_connect(endpoint, max_msg_size=MAX_MESSAGE_SIZE)
+        except (aiohttp.ClientError, KeyError, ValueError) as e:
+            await session.close()
+            raise CDPError(f"Could not connect to DevTools on port {port}: {e}") from e
+        return cls(session, websocket, logger)
+
+    @property
+    def connected(self) -> bool:
+        return not self._websocket.closed and not self._reader.done()
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None,
+                   session_id: Optional[str] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Sendet einen CDP-Befehl und wartet auf seine Antwort"""
+        if not self.connected:
+            raise CDPError("DevTools connection is closed")
+        message_id = next(self._ids)
+        message: Dict[str, Any] = {'id': message_id, 'method': method, 'params': params or {}}
+        if session_id is not None:
+            message['sessionId'] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self._websocket.send_str(json.dumps(message))
+            response = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise CDPError(f"{method} timed out after {timeout}s")
+        finally:
+            self._pending.pop(message_id, None)
+        if 'error' in response:
+            raise CDPError(f"{method} failed: {response['error'].get('message')}")
+        return response.get('result', {})
+
+    def wait_for(self, event: str, session_id: Optional[str] = None) -> "asyncio.Future":
+        key = (session_id, event)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, []).append(future)
+        # Abgebrochene Wartende (z.B. nach Zeitüberschreitung) nicht aufheben
+        future.add_done_callback(lambda done: self._discard_waiter(key, done))
+        return future
+
+    def _discard_waiter(self, key: Tuple[Optional[str], str], future: "asyncio.Future") -> None:
+        waiters = self._waiters.get(key)
+        if waiters and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._waiters[key]
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[CDPSession]:
+        """Öffnet einen neuen Tab und schließt ihn beim Verlassen wieder"""
+        target = await self.send('Target.createTarget', {'url': 'about:blank'})
+        target_id = target['targetId']
+        try:
+            attached = await self.send('Target.attachToTarget', {'targetId': target_id, 'flatten': True})
+            yield CDPSession(self, attached['sessionId'], target_id)
+        finally:
+            if self.connected:
+                try:
+                    await self.send('Target.closeTarget', {'targetId': target_id})
+                except CDPError as e:
+                    self.logger.debug(f"Error closing target {target_id}: {str(e)}")
+
+    async def close(self) -> None:
+        await self._websocket.close()
+        await self._session.close()
+        self._reader.cancel()
+        self._fail_pending(CDPError("DevTools connection was closed"))
+
+    async def _read(self) -> None:
+        try:
+            async for message in self._websocket:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                data = json.loads(message.data)
+                if 'id' in data:
+                    future = self._pending.get(data['id'])
+                    if future is not None and not future.done():
+                        future.set_result(data)
+                    continue
+                for future in self._waiters.pop((data.get('sessionId'), data.get('method')), []):
+                    if not future.done():
+                        future.set_result(data.get('params', {}))
+        finally:
+            self._fail_pending(CDPError("DevTools connection was lost"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in list(self._pending.values()):
+            if not future.done():
+                future.set_exception(error)
+        waiters, self._waiters = self._waiters, {}
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
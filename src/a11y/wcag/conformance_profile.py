@@ -0,0 +1,270 @@
+# src/wcag/conformance_profile.py
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from .resource_profiles import (
+    ASSET_RULES, PA11Y_CONTRAST_CRITERIA, ResourceProfile, effective_profile, get_resource_profile
+)
+from .unified_result_processor import WCAGLevel
+
+# axe-core Tags je WCAG-Version und Stufe
+AXE_LEVEL_TAGS: Dict[WCAGLevel, List[str]] = {
+    WCAGLevel.A: ['wcag2a', 'wcag21a'],
+    WCAGLevel.AA: ['wcag2aa', 'wcag21aa', 'wcag22aa'],
+    WCAGLevel.AAA: ['wcag2aaa'],
+}
+AXE_BEST_PRACTICE_TAG = 'best-practice'
+
+# Pa11y (HTML_CodeSniffer) Standards je Stufe
+PA11Y_STANDARDS: Dict[WCAGLevel, str] = {
+    WCAGLevel.A: 'WCAG2A',
+    WCAGLevel.AA: 'WCAG2AA',
+    WCAGLevel.AAA: 'WCAG2AAA',
+}
+
+# Axe-basierte Accessibility-Audits von Lighthouse (Stand Lighthouse 12) mit
+# dem axe-Tag ihrer Stufe bzw. best-practice; manuelle Audits fehlen, da
+# Lighthouse sie nicht automatisch prüft
+LIGHTHOUSE_AUDIT_TAGS: Dict[str, str] = {
+    'accesskeys': 'best-practice',
+    'aria-allowed-attr': 'wcag2a',
+    'aria-allowed-role': 'best-practice',
+    'aria-command-name': 'wcag2a',
+    'aria-conditional-attr': 'wcag2a',
+    'aria-deprecated-role': 'wcag2a',
+    'aria-dialog-name': 'best-practice',
+    'aria-hidden-body': 'wcag2a',
+    'aria-hidden-focus': 'wcag2a',
+    'aria-input-field-name': 'wcag2a',
+    'aria-meter-name': 'wcag2a',
+    'aria-progressbar-name': 'wcag2a',
+    'aria-prohibited-attr': 'wcag2a',
+    'aria-required-attr': 'wcag2a',
+    'aria-required-children': 'wcag2a',
+    'aria-required-parent': 'wcag2a',
+    'aria-roles': 'wcag2a',
+    'aria-text': 'best-practice',
+    'aria-toggle-field-name': 'wcag2a',
+    'aria-tooltip-name': 'wcag2a',
+    'aria-treeitem-name': 'best-practice',
+    'aria-valid-attr-value': 'wcag2a',
+    'aria-valid-attr': 'wcag2a',
+    'button-name': 'wcag2a',
+    'bypass': 'wcag2a',
+    'color-contrast': 'wcag2aa',
+    'definition-list': 'wcag2a',
+    'dlitem': 'wcag2a',
+    'document-title': 'wcag2a',
+    'duplicate-id-aria': 'wcag2a',
+    'empty-heading': 'best-practice',
+    'form-field-multiple-labels': 'wcag2a',
+    'frame-title': 'wcag2a',
+    'heading-order': 'best-practice',
+    'html-has-lang': 'wcag2a',
+    'html-lang-valid': 'wcag2a',
+    'html-xml-lang-mismatch': 'wcag2a',
+    'identical-links-same-purpose': 'wcag2aaa',
+    'image-alt': 'wcag2a',
+    'image-redundant-alt': 'best-practice',
+    'input-button-name': 'wcag2a',
+    'input-image-alt': 'wcag2a',
+    'label': 'wcag2a',
+    'label-content-name-mismatch': 'wcag21a',
+    'landmark-one-main': 'best-practice',
+    'link-in-text-block': 'wcag2a',
+    'link-name': 'wcag2a',
+    'list': 'wcag2a',
+    'listitem': 'wcag2a',
+    'meta-refresh': 'wcag2a',
+    'meta-viewport': 'wcag2aa',
+    'object-alt': 'wcag2a',
+    'select-name': 'wcag2a',
+    'skip-link': 'best-practice',
+    'tabindex': 'best-practice',
+    'table-duplicate-name': 'best-practice',
+    'table-fake-caption': 'wcag2a',
+    'target-size': 'wcag22aa',
+    'td-has-header': 'wcag2a',
+    'td-headers-attr': 'wcag2a',
+    'th-has-data-cells': 'wcag2a',
+    'valid-lang': 'wcag2aa',
+    'video-caption': 'wcag2a',
+}
+
+_LEVEL_ORDER = [WCAGLevel.A, WCAGLevel.AA, WCAGLevel.AAA]
+
+
+def _is_pa11y_code(rule: str) -> bool:
+    """HTML_CodeSniffer-Codes beginnen mit dem Standard, z.B. WCAG2AA.Principle1..."""
+    return rule.startswith('WCAG2')
+
+
+@dataclass
+class ConformanceProfile:
+    """
+    Gemeinsames Konformitätsprofil für alle Testwerkzeuge.
+
+    Legt die Zielstufe (A/AA/AAA), die Einbeziehung von Best Practices und
+    explizite Allow-/Deny-Listen fest und übersetzt sie in die Optionen von
+    axe-core (runOnly), Pa11y (--standard/--ignore) und Lighthouse
+    (--only-audits/--skip-audits, Stufe über LIGHTHOUSE_AUDIT_TAGS), damit nur die Regeln laufen, die auch
+    bewertet werden.
+
+    Regeln werden mit ihrer axe-ID angegeben (Lighthouse verwendet für seine
+    Accessibility-Audits dieselben IDs). Einträge im HTML_CodeSniffer-Format
+    (WCAG2AA.Principle1...) gelten nur für Pa11y.
+
+    resources wählt das Ressourcenprofil für das Laden der Seiten (full,
+    no-media oder dom-only); Regeln, die echte Ressourcen brauchen, heben
+    es je Werkzeug automatisch an.
+    """
+    level: WCAGLevel = WCAGLevel.AA
+    best_practices: bool = True
+    allow_rules: List[str] = field(default_factory=list)
+    deny_rules: List[str] = field(default_factory=list)
+    resources: str = 'full'
+
+    def __post_init__(self):
+        if isinstance(self.level, str):
+            self.level = WCAGLevel(self.level.upper())
+        get_resource_profile(self.resources)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ConformanceProfile":
+        """Erstellt ein Profil aus einer Konfiguration (z.B. YAML)"""
+        return cls(
+            level=data.get('level', WCAGLevel.AA.value),
+            best_practices=data.get('best_practices', True),
+            allow_rules=list(data.get('allow_rules', [])),
+            deny_rules=list(data.get('deny_rules', [])),
+            resources=data.get('resources', 'full')
+        )
+
+    @property
+    def levels(self) -> List[WCAGLevel]:
+        """Alle Stufen bis einschließlich der Zielstufe"""
+        return _LEVEL_ORDER[:_LEVEL_ORDER.index(self.level) + 1]
+
+    # axe-core
+
+    def axe_tags(self) -> List[str]:
+        """axe-Tags der Zielstufe einschließlich niedrigerer Stufen"""
+        tags = [tag for level in self.levels for tag in AXE_LEVEL_TAGS[level]]
+        if self.best_practices:
+            tags.append(AXE_BEST_PRACTICE_TAG)
+        return tags
+
+    def axe_allow_rules(self) -> List[str]:
+        return [rule for rule in self.allow_rules if not _is_pa11y_code(rule) and rule not in self.deny_rules]
+
+    def axe_deny_rules(self) -> List[str]:
+        return [rule for rule in self.deny_rules if not _is_pa11y_code(rule)]
+
+    def to_axe(self) -> Dict[str, Any]:
+        """
+        axe.run()-Optionen des Profils
+
+        Returns:
+            {"runOnly": {"type": "tag"|"rule", "values": [...]},
+             "rules": {id: {"enabled": False}}}
+        """
+        allow = self.axe_allow_rules()
+        run_only = {"type": "rule", "values": allow} if allow else {"type": "tag", "values": self.axe_tags()}
+        return {
+            "runOnly": run_only,
+            "rules": {rule: {"enabled": False} for rule in self.axe_deny_rules()}
+        }
+
+    def axe_asset_rules(self) -> List[str]:
+        """Laufende axe-Regeln, die echte Ressourcen (Bilder, Stylesheets, Fonts) brauchen"""
+        allow = self.axe_allow_rules()
+        if allow:
+            return [rule for rule in allow if rule in ASSET_RULES]
+        tags, deny = set(self.axe_tags()), self.axe_deny_rules()
+        return [rule for rule, (_, tag) in ASSET_RULES.items() if tag in tags and rule not in deny]
+
+    # Ressourcen
+
+    def resource_profile(self, tool: Optional[str] = None) -> ResourceProfile:
+        """
+        Wirksames Ressourcenprofil für ein Werkzeug
+
+        Args:
+            tool: 'axe' und 'lighthouse' richten sich nach den axe-Regeln,
+                'pa11y' nach den eigenen Kontrastprüfungen von HTML_CodeSniffer;
+                None liefert das Profil, das allen Werkzeugen genügt (für
+                gemeinsam geladene Seiten wie den PageSnapshot)
+        """
+        needed = []
+        if tool in (None, 'pa11y') and self._pa11y_checks_contrast():
+            needed.append('full')
+        if tool != 'pa11y':
+            needed.extend(ASSET_RULES[rule][0] for rule in self.axe_asset_rules())
+        return effective_profile(self.resources, needed)
+
+    # Pa11y
+
+    def pa11y_args(self) -> List[str]:
+        """
+        Kommandozeilenargumente für Pa11y
+
+        Pa11y kennt keine Allow-Liste; es werden Standard und Ignore-Liste gesetzt.
+        """
+        options = self.pa11y_options()
+        args = ['--standard', options['standard']]
+        for rule in options['ignore']:
+            args.extend(['--ignore', rule])
+        return args
+
+    def pa11y_options(self) -> Dict[str, Any]:
+        """Dieselbe Auswahl als Optionen der programmatischen pa11y-API"""
+        return {
+            'standard': PA11Y_STANDARDS[self.level],
+            'ignore': [rule for rule in self.deny_rules if _is_pa11y_code(rule)]
+        }
+
+    def _pa11y_checks_contrast(self) -> bool:
+        ignore = self.pa11y_options()['ignore']
+        for level in self.levels:
+            standard = PA11Y_STANDARDS[level]
+            criterion = PA11Y_CONTRAST_CRITERIA.get(standard)
+            if criterion is None:
+                continue
+            code = f"{PA11Y_STANDARDS[self.level]}.{criterion}"
+            if not any(code.startswith(rule) for rule in ignore):
+                return True
+        return False
+
+    # Lighthouse
+
+    def lighthouse_args(self) -> List[str]:
+        """
+        Audit-Filter für Lighthouse (--only-audits bzw. --skip-audits)
+
+        Ohne Allow-Liste wird die Zielstufe über LIGHTHOUSE_AUDIT_TAGS auf
+        eine Audit-Liste abgebildet, damit Lighthouse denselben Umfang wie
+        axe prüft. Nur wenn die Stufe alle bekannten Audits einschließt
+        (AAA mit Best Practices), bleibt es beim Kategoriefilter, sodass
+        auch Audits neuerer Lighthouse-Versionen laufen.
+        """
+        allow = self.axe_allow_rules()
+        if allow:
+            return [f"--only-audits={','.join(allow)}"]
+        deny = self.axe_deny_rules()
+        tags = set(self.axe_tags())
+        if not tags.issuperset(LIGHTHOUSE_AUDIT_TAGS.values()):
+            audits = [audit for audit, tag in LIGHTHOUSE_AUDIT_TAGS.items() if tag in tags and audit not in deny]
+            return [f"--only-audits={','.join(audits)}"]
+        if deny:
+            return [f"--skip-audits={','.join(deny)}"]
+        return []
+
+
+def as_profile(profile: Union[ConformanceProfile, Dict[str, Any], None]) -> ConformanceProfile:
+    """Normalisiert None, Dicts und Profile zu einem ConformanceProfile"""
+    if profile is None:
+        return ConformanceProfile()
+    if isinstance(profile, dict):
+        return ConformanceProfile.from_dict(profile)
+    return profile
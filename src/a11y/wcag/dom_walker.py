@@ -0,0 +1,142 @@
+# src/wcag/dom_walker.py
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from bs4 import BeautifulSoup, Tag
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+LANDMARK_TAGS = ('header', 'nav', 'main', 'footer', 'article', 'aside')
+ARIA_ATTRIBUTES = {
+    'role_attributes': 'role',
+    'aria_labelledby': 'aria-labelledby',
+    'aria_label': 'aria-label',
+    'aria_describedby': 'aria-describedby',
+}
+# Beschriftbare Formularelemente (HTML "labelable elements" mit Benutzereingabe)
+LABELABLE_TAGS = ('input', 'select', 'textarea')
+# Eingabetypen ohne Beschriftungspflicht: unsichtbar oder durch value/alt benannt
+UNLABELLED_INPUT_TYPES = ('hidden', 'button', 'submit', 'reset', 'image')
+
+
+@dataclass
+class FormField:
+    """Beschriftbares Formularelement mit seiner impliziten Beschriftung"""
+    element: Tag
+    # Von einem <label> umschlossen, das kein anderes Element referenziert
+    wrapped: bool = False
+
+
+@dataclass
+class DOMStats:
+    """Alles, was die Struktur- und Problemprüfungen des HTMLAnalyzers brauchen"""
+    has_doctype_tag: bool = False
+    html_lang: bool = False
+    title: bool = False
+    meta_viewport: bool = False
+    meta_charset: bool = False
+    headings: Dict[str, int] = field(default_factory=lambda: {tag: 0 for tag in HEADING_TAGS})
+    landmarks: Dict[str, int] = field(default_factory=lambda: {tag: 0 for tag in LANDMARK_TAGS})
+    aria: Dict[str, int] = field(default_factory=lambda: {key: 0 for key in ARIA_ATTRIBUTES})
+    # Zu prüfende Formularelemente in Dokumentreihenfolge
+    form_fields: List[FormField] = field(default_factory=list)
+    # for-Attribute aller <label>
+    label_targets: Set[str] = field(default_factory=set)
+    # Häufigkeit von ids, Klassen und Tags (aria-labelledby-Ziele, Eindeutigkeit von Selektoren)
+    ids: Counter = field(default_factory=Counter)
+    classes: Counter = field(default_factory=Counter)
+    tags: Counter = field(default_factory=Counter)
+
+    def has_label(self, form_field: FormField) -> bool:
+        """
+        Prüft die Beschriftung eines Formularelements in O(1)
+
+        Beschriftet ist ein Element durch ein umschließendes <label>, ein
+        <label for> auf seine id, ein nicht leeres aria-label oder ein
+        aria-labelledby, das auf mindestens eine vorhandene id verweist.
+        """
+        element = form_field.element
+        if form_field.wrapped:
+            return True
+        element_id = element.get('id')
+        if element_id and element_id in self.label_targets:
+            return True
+        if (element.get('aria-label') or '').strip():
+            return True
+        return any(ref in self.ids for ref in (element.get('aria-labelledby') or '').split())
+
+
+def walk_dom(soup: BeautifulSoup) -> DOMStats:
+    """
+    Sammelt alle Zählwerte und Kandidaten in einem einzigen Durchlauf
+
+    Entspricht den früheren find()/find_all()-Aufrufen je Überschrift,
+    Landmark und ARIA-Attribut, besucht aber jedes Element nur einmal und
+    baut dabei die Indizes für die Beschriftungsprüfung auf.
+    """
+    stats = DOMStats()
+    headings, landmarks, aria = stats.headings, stats.landmarks, stats.aria
+
+    # Explizite Tiefensuche in Dokumentreihenfolge; zu jedem Element wird
+    # das umschließende <label> mitgeführt
+    stack: List[tuple] = [(soup, None)]
+    while stack:
+        element, enclosing_label = stack.pop()
+        name = element.name
+        attrs = element.attrs
+        stats.tags[name] += 1
+
+        if name in headings:
+            headings[name] += 1
+        elif name in landmarks:
+            landmarks[name] += 1
+        elif name in LABELABLE_TAGS:
+            if name != 'input' or str(attrs.get('type', 'text')).lower() not in UNLABELLED_INPUT_TYPES:
+                stats.form_fields.append(FormField(element, _is_wrapped(element, enclosing_label)))
+        elif name == 'label':
+            target = attrs.get('for')
+            if target is not None:
+                stats.label_targets.add(target)
+            enclosing_label = element
+        elif name == 'meta':
+            if attrs.get('name') == 'viewport':
+                stats.meta_viewport = True
+            if 'charset' in attrs:
+                stats.meta_charset = True
+        elif name == 'title':
+            stats.title = True
+        elif name == 'html':
+            if 'lang' in attrs:
+                stats.html_lang = True
+        elif name == 'doctype':
+            # Wie soup.find('doctype'): ein Element dieses Namens, nicht die Deklaration
+            stats.has_doctype_tag = True
+
+        if attrs:
+            if 'id' in attrs:
+                stats.ids[attrs['id']] += 1
+            if 'class' in attrs:
+                stats.classes.update(set(class_names(element)))
+            for key, attribute in ARIA_ATTRIBUTES.items():
+                if attribute in attrs:
+                    aria[key] += 1
+
+        children = [child for child in element.contents if isinstance(child, Tag)]
+        stack.extend((child, enclosing_label) for child in reversed(children))
+
+    return stats
+
+
+def _is_wrapped(element: Tag, label: Optional[Tag]) -> bool:
+    """Ein <label for> beschriftet nur sein Ziel, nicht jeden Nachfahren"""
+    if label is None:
+        return False
+    target = label.get('for')
+    return target is None or target == element.get('id')
+
+
+def class_names(element: Tag) -> List[str]:
+    """Klassen eines Elements, unabhängig davon, ob der Parser sie aufteilt"""
+    classes = element.get('class') or []
+    return classes.split() if isinstance(classes, str) else list(classes)
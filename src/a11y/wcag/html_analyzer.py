@@ -0,0 +1,241 @@
+# src/wcag/html_analyzer.py
+
+import asyncio
+import codecs
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from .base_analyzer import BaseAnalyzer
+from .dom_walker import DOMStats, walk_dom
+from .html_parsing import parse_html, resolve_parser
+from .html_stream import HTMLStream, StreamElement, stream_selector
+from .http_client import HTTPClient
+from .selector_service import SelectorService
+
+class HTMLAnalyzer(BaseAnalyzer):
+    """Analyzer für HTML Struktur und ARIA Verwendung"""
+
+    # Größe der Stücke, in denen große Dokumente gelesen und geparst werden
+    STREAM_CHUNK_SIZE = 256 * 1024
+
+    def __init__(self, *args, parser: str = 'auto',
+                 stream_threshold: Optional[int] = 8 * 1024 * 1024, **kwargs):
+        """
+        Args:
+            parser: Parser-Backend ('auto', 'lxml', 'html5lib', 'html.parser');
+                'auto' nimmt das schnellste installierte
+            stream_threshold: Ab dieser Dokumentgröße in Bytes wird ohne
+                Baum inkrementell analysiert (0: immer, None: nie)
+        """
+        super().__init__(*args, **kwargs)
+        self.parser = resolve_parser(parser)
+        self.stream_threshold = stream_threshold
+    
+    async def analyze(self, url: str) -> Dict[str, Any]:
+        """Analysiert HTML-Struktur und Zugänglichkeitsmerkmale"""
+        try:
+            if self.snapshot is not None:
+                # Gerendertes DOM aus dem gemeinsamen Snapshot
+                html, stream = self.snapshot.html, None
+                if self._exceeds_stream_threshold(len(html)):
+                    html, stream = None, HTMLStream()
+                    await asyncio.to_thread(self._feed_text, stream, self.snapshot.html)
+                return await self._run_checks(url, html, stream)
+
+            if self.http_client is not None:
+                return await self._fetch_and_analyze(self.http_client, url)
+            async with HTTPClient(logger=self.logger) as client:
+                return await self._fetch_and_analyze(client, url)
+                    
+        except Exception as e:
+            return self._create_error_result(str(e), url)
+
+    async def _fetch_and_analyze(self, client: HTTPClient, url: str,
+                                 conditional: bool = True) -> Dict[str, Any]:
+        """
+        Ruft die Seite ab und analysiert sie
+
+        Meldet der Server 304, wird das zu den Validatoren gespeicherte
+        Ergebnis ohne erneute Analyse übernommen. Fehlt es, wird die Seite
+        unbedingt neu abgerufen.
+        """
+        async with client.get(url, conditional=conditional) as response:
+            if response.status == 304:
+                cached = client.cached_result(url)
+                if cached is not None:
+                    return {
+                        **cached,
+                        "not_modified": True,
+                        "timestamp": datetime.now(timezone.utc).isoformat()
+                    }
+            elif response.status != 200:
+                return self._create_error_result(
+                    f"Failed to fetch URL: {response.status}", url
+                )
+            else:
+                length = response.content_length
+                if length is not None and not self._exceeds_stream_threshold(length):
+                    html, stream = await response.text(), None
+                else:
+                    html, stream = await self._read_or_stream(response)
+                result = await self._run_checks(url, html, stream)
+                client.remember(url, response.headers, result)
+                return result
+        return await self._fetch_and_analyze(client, url, conditional=False)
+
+    async def _run_checks(self, url: str, html: Optional[str],
+                          stream: Optional[HTMLStream]) -> Dict[str, Any]:
+        """Prüft ein geladenes Dokument oder einen fertig gelesenen Stream"""
+        # Parsen und Prüfen sind CPU-lastig und laufen neben den anderen
+        # Analyzern in einem eigenen Thread
+        if stream is not None:
+            analysis, issues = await asyncio.to_thread(self._analyze_stream, stream)
+        else:
+            analysis, issues = await asyncio.to_thread(self._analyze_html, html)
+
+        return {
+            "status": "success",
+            "tool": "html",
+            "parser": 'html.parser' if stream is not None else self.parser,
+            "streamed": stream is not None,
+            "url": url,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "analysis": analysis,
+            "issues": issues
+        }
+
+    def _analyze_html(self, html: str):
+        """Parst das Dokument und führt Struktur- und Problemprüfung aus"""
+        soup = parse_html(html, self.parser)
+
+        # Ein Durchlauf sammelt alles für Struktur- und Problemprüfung
+        stats = walk_dom(soup)
+
+        # Strukturanalyse durchführen
+        analysis = self._analyze_structure(stats)
+
+        # Probleme identifizieren
+        issues = self._check_for_issues(stats, analysis)
+        return analysis, issues
+
+    def _analyze_stream(self, stream: HTMLStream):
+        """Führt Struktur- und Problemprüfung auf einem fertig gelesenen Stream aus"""
+        stats = stream.finish()
+        analysis = self._analyze_structure(stats)
+        return analysis, self._check_for_issues(stats, analysis)
+
+    def _exceeds_stream_threshold(self, size: int) -> bool:
+        return self.stream_threshold is not None and size > self.stream_threshold
+
+    def _feed_text(self, stream: HTMLStream, html: str) -> None:
+        for start in range(0, len(html), self.STREAM_CHUNK_SIZE):
+            stream.feed(html[start:start + self.STREAM_CHUNK_SIZE])
+
+    async def _read_or_stream(self, response: aiohttp.ClientResponse):
+        """
+        Liest eine Antwort unbekannter oder großer Länge stückweise
+
+        Bis zur Schwelle werden die Stücke gepuffert; wird sie überschritten,
+        geht der Puffer an einen HTMLStream und alle weiteren Stücke direkt
+        hinterher, ohne dass das ganze Dokument im Speicher liegt.
+
+        Returns:
+            (html, None) für kleine Dokumente, sonst (None, stream)
+        """
+        decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+        buffered: List[str] = []
+        size = 0
+        stream = None
+        async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+            text = decoder.decode(chunk)
+            if stream is not None:
+                await asyncio.to_thread(stream.feed, text)
+                continue
+            buffered.append(text)
+            size += len(chunk)
+            if self._exceeds_stream_threshold(size):
+                stream = HTMLStream()
+                await asyncio.to_thread(stream.feed, ''.join(buffered))
+                buffered = []
+        tail = decoder.decode(b'', final=True)
+        if stream is None:
+            return ''.join(buffered) + tail, None
+        stream.feed(tail)
+        return None, stream
+
+    def _analyze_structure(self, stats: DOMStats) -> Dict[str, Any]:
+        """Analysiert HTML-Strukturelemente"""
+        return {
+            "doctype": stats.has_doctype_tag,
+            "lang_attribute": stats.html_lang,
+            "head_elements": {
+                "title": stats.title,
+                "meta_viewport": stats.meta_viewport,
+                "meta_charset": stats.meta_charset
+            },
+            "headings": dict(stats.headings),
+            "landmarks": dict(stats.landmarks),
+            "aria": dict(stats.aria)
+        }
+
+    def _check_for_issues(self, stats: DOMStats, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Überprüft auf Zugänglichkeitsprobleme"""
+        issues = []
+        
+        # Überprüfe Überschriftenhierarchie
+        prev_level = 0
+        for i in range(1, 7):
+            curr_count = analysis["headings"][f"h{i}"]
+            if curr_count > 0 and prev_level == 0 and i > 1:
+                issues.append({
+                    "type": "heading_hierarchy",
+                    "level": "error",
+                    "message": f"Heading level h{i} used before h{i-1}",
+                    "wcag": ["WCAG2.1.3.1"],
+                    "context": f"Found h{i} without preceding h{i-1}"
+                })
+            prev_level = curr_count
+        
+        # Überprüfe Landmarks
+        if analysis["landmarks"]["main"] == 0:
+            issues.append({
+                "type": "landmarks",
+                "level": "error",
+                "message": "No <main> landmark found",
+                "wcag": ["WCAG2.1.3.1", "WCAG2.4.1"],
+                "context": "Document structure"
+            })
+        
+        # Überprüfe Sprache
+        if not analysis["lang_attribute"]:
+            issues.append({
+                "type": "language",
+                "level": "error",
+                "message": "Missing lang attribute on html element",
+                "wcag": ["WCAG3.1.1"],
+                "context": "Document language"
+            })
+        
+        # Überprüfe Formularelemente
+        self._check_form_elements(stats, issues)
+        
+        return issues
+
+    def _check_form_elements(self, stats: DOMStats, issues: List[Dict[str, Any]]) -> None:
+        """Überprüft Formularelemente auf Zugänglichkeit"""
+        selectors = SelectorService(stats)
+        for form_field in stats.form_fields:
+            if not stats.has_label(form_field):
+                input_field = form_field.element
+                issues.append({
+                    "type": "form_labels",
+                    "level": "error",
+                    "message": "Input field missing label or aria-label",
+                    "wcag": ["WCAG1.3.1", "WCAG3.3.2"],
+                    "context": str(input_field),
+                    "selector": (stream_selector(stats, input_field)
+                                 if isinstance(input_field, StreamElement)
+                                 else selectors.selector(input_field))
+                })
@@ -0,0 +1,49 @@
+# src/wcag/html_parsing.py
+
+import importlib.util
+from typing import List
+
+from bs4 import BeautifulSoup
+
+# BeautifulSoup-Builder in der Reihenfolge, in der 'auto' sie wählt.
+# html5lib ist spezifikationstreu, aber langsamer als der Standardparser und
+# wird daher nur auf ausdrücklichen Wunsch verwendet.
+PARSER_PREFERENCE = ['lxml', 'html.parser']
+PARSER_MODULES = {
+    'lxml': 'lxml',
+    'html5lib': 'html5lib',
+    'html.parser': None,
+}
+
+
+def available_parsers() -> List[str]:
+    """Installierte Parser-Backends; der Standardparser ist immer verfügbar"""
+    return [
+        name for name, module in PARSER_MODULES.items()
+        if module is None or importlib.util.find_spec(module) is not None
+    ]
+
+
+def resolve_parser(parser: str = 'auto') -> str:
+    """
+    Wählt das Parser-Backend
+
+    Args:
+        parser: 'auto' (schnellstes installiertes Backend), 'lxml',
+            'html5lib' oder 'html.parser'
+
+    Returns:
+        Name des BeautifulSoup-Builders; ein nicht installiertes Backend
+        fällt auf den Standardparser zurück
+    """
+    available = available_parsers()
+    if parser == 'auto':
+        return next(name for name in PARSER_PREFERENCE if name in available)
+    if parser not in PARSER_MODULES:
+        raise ValueError(f"Unknown HTML parser backend: {parser}")
+    return parser if parser in available else 'html.parser'
+
+
+def parse_html(html: str, parser: str = 'auto') -> BeautifulSoup:
+    """Parst HTML mit dem gewählten Backend"""
+    return BeautifulSoup(html, resolve_parser(parser))
@@ -0,0 +1,175 @@
+# src/wcag/html_stream.py
+
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+
+from .dom_walker import (
+    ARIA_ATTRIBUTES,
+    LABELABLE_TAGS,
+    UNLABELLED_INPUT_TYPES,
+    DOMStats,
+    FormField,
+)
+from .selector_service import unique_selector
+
+# Elemente ohne Inhalt; sie kommen nie auf den Stapel offener Elemente
+VOID_TAGS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr',
+))
+# Elemente mit optionalem End-Tag, die ein gleichnamiges Geschwister schließt
+IMPLICITLY_CLOSED_TAGS = frozenset(('li', 'p', 'option', 'dt', 'dd', 'tr', 'td', 'th'))
+# Höchstlänge des Kontexts, der je gemeldetem Element behalten wird
+CONTEXT_LIMIT = 500
+
+
+@dataclass
+class PathStep:
+    """Ein Vorfahre eines gemeldeten Elements, soweit ihn der Selektor braucht"""
+    name: str
+    position: int
+    element_id: Optional[str]
+    classes: Tuple[str, ...]
+
+
+class StreamElement:
+    """
+    Leichtgewichtiger Ersatz für ein BeautifulSoup-Tag
+
+    Behält nur Attribute, einen gekürzten Start-Tag als Kontext und den Pfad
+    der Vorfahren; get() verhält sich wie Tag.get(), damit DOMStats.has_label
+    unverändert funktioniert.
+    """
+
+    __slots__ = ('name', 'attrs', 'context', 'path')
+
+    def __init__(self, name: str, attrs: Dict[str, str], context: str, path: Tuple[PathStep, ...]):
+        self.name = name
+        self.attrs = attrs
+        self.context = context
+        self.path = path
+
+    def get(self, key: str, default=None):
+        return self.attrs.get(key, default)
+
+    def __str__(self) -> str:
+        return self.context
+
+
+@dataclass
+class _OpenElement:
+    step: PathStep
+    # Bisher gesehene Kinder je Tag, für :nth-of-type
+    children: Dict[str, int]
+    is_label: bool = False
+    label_for: Optional[str] = None
+
+
+class HTMLStream(HTMLParser):
+    """
+    Inkrementelle Variante von walk_dom für sehr große Dokumente
+
+    Das Dokument wird stückweise per feed() gelesen, ohne Baum: gehalten
+    werden nur die Zählwerte, der Stapel offener Elemente und die
+    Formularelemente, deren Beschriftung erst am Dokumentende feststeht.
+    Der Speicherbedarf hängt so von Schachtelungstiefe und Zahl der
+    Kandidaten ab, nicht von der Dokumentgröße.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stats = DOMStats()
+        self._open: List[_OpenElement] = [_OpenElement(PathStep('[document]', 1, None, ()), {})]
+
+    def handle_starttag(self, name: str, attr_list: List[Tuple[str, Optional[str]]]) -> None:
+        stats = self.stats
+        attrs = {key: '' if value is None else value for key, value in attr_list}
+        stats.tags[name] += 1
+
+        if name in IMPLICITLY_CLOSED_TAGS and self._open[-1].step.name == name:
+            self._open.pop()
+
+        parent = self._open[-1]
+        position = parent.children[name] = parent.children.get(name, 0) + 1
+        classes = tuple(dict.fromkeys(attrs.get('class', '').split()))
+        step = PathStep(name, position, attrs.get('id'), classes)
+
+        if name in stats.headings:
+            stats.headings[name] += 1
+        elif name in stats.landmarks:
+            stats.landmarks[name] += 1
+        elif name in LABELABLE_TAGS:
+            if name != 'input' or attrs.get('type', 'text').lower() not in UNLABELLED_INPUT_TYPES:
+                self._add_form_field(name, attrs, step)
+        elif name == 'meta':
+            if attrs.get('name') == 'viewport':
+                stats.meta_viewport = True
+            if 'charset' in attrs:
+                stats.meta_charset = True
+        elif name == 'title':
+            stats.title = True
+        elif name == 'html':
+            if 'lang' in attrs:
+                stats.html_lang = True
+        elif name == 'doctype':
+            stats.has_doctype_tag = True
+
+        if 'id' in attrs:
+            stats.ids[attrs['id']] += 1
+        stats.classes.update(classes)
+        for key, attribute in ARIA_ATTRIBUTES.items():
+            if attribute in attrs:
+                stats.aria[key] += 1
+
+        if name not in VOID_TAGS:
+            is_label = name == 'label'
+            if is_label and 'for' in attrs:
+                stats.label_targets.add(attrs['for'])
+            self._open.append(_OpenElement(step, {}, is_label, attrs.get('for')))
+
+    def handle_endtag(self, name: str) -> None:
+        # Nicht geschlossene Elemente dazwischen gelten als beendet;
+        # verwaiste End-Tags werden ignoriert
+        for index in range(len(self._open) - 1, 0, -1):
+            if self._open[index].step.name == name:
+                del self._open[index:]
+                return
+
+    def _add_form_field(self, name: str, attrs: Dict[str, str], step: PathStep) -> None:
+        label = next((element for element in reversed(self._open) if element.is_label), None)
+        wrapped = label is not None and (label.label_for is None or label.label_for == attrs.get('id'))
+        # Sofort beschriftete Elemente werden nie gemeldet und nicht behalten
+        if wrapped or attrs.get('aria-label', '').strip():
+            return
+        context = self.get_starttag_text() or ''
+        if len(context) > CONTEXT_LIMIT:
+            context = context[:CONTEXT_LIMIT] + '...'
+        path = tuple(element.step for element in self._open[1:]) + (step,)
+        self.stats.form_fields.append(FormField(StreamElement(name, attrs, context, path)))
+
+    def finish(self) -> DOMStats:
+        """Schließt den Parser und liefert die gesammelten Werte"""
+        self.close()
+        self._open = self._open[:1]
+        return self.stats
+
+
+def stream_selector(stats: DOMStats, element: StreamElement) -> str:
+    """
+    Eindeutiger Selektor aus dem mitgeführten Pfad
+
+    Wie beim SelectorService genügt ein für sich eindeutiges #id, .klasse
+    oder Tag, in dieser Rangfolge; sonst wird vom nächsten solchen
+    Vorfahren abgestiegen. Da die
+    Zahl gleichnamiger Geschwister beim Lesen noch offen ist, trägt jeder
+    Schritt :nth-of-type.
+    """
+    steps: List[str] = []
+    for step in reversed(element.path):
+        own = unique_selector(stats, step.name, step.element_id, step.classes)
+        if own is not None:
+            steps.append(own)
+            break
+        steps.append(f"{step.name}:nth-of-type({step.position})")
+    return ' > '.join(reversed(steps))
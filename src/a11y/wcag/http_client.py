@@ -0,0 +1,199 @@
+# src/wcag/http_client.py
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Mapping, Optional, Tuple
+
+import aiohttp
+
+DEFAULT_STORE_DIR = "output/wcag_results/http_validators"
+
+# aiohttp entpackt brotli nur, wenn eines der Brotli-Module installiert ist
+_HAS_BROTLI = any(importlib.util.find_spec(module) is not None for module in ('brotli', 'brotlicffi'))
+ACCEPT_ENCODING = 'br, gzip, deflate' if _HAS_BROTLI else 'gzip, deflate'
+
+
+class ValidatorStore:
+    """
+    Persistente ETag/Last-Modified-Angaben je URL samt letztem Ergebnis
+
+    Je URL eine JSON-Datei <sha256(url)>.json, atomar ersetzt; so überlebt
+    der Stand Prozessneustarts, und eine 304-Antwort kann das gespeicherte
+    Ergebnis liefern, ohne die Seite erneut zu analysieren.
+    """
+
+    def __init__(self, store_dir: str = DEFAULT_STORE_DIR):
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger('ValidatorStore')
+        self._entries: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def path_for(self, url: str) -> Path:
+        return self.store_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """Gespeicherter Eintrag einer URL oder None"""
+        if url not in self._entries:
+            try:
+                entry = json.loads(self.path_for(url).read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                entry = None
+            self._entries[url] = entry if entry and entry.get('url') == url else None
+        return self._entries[url]
+
+    def save(self, url: str, entry: Dict[str, Any]) -> None:
+        entry = {'url': url, **entry}
+        self._entries[url] = entry
+        path = self.path_for(url)
+        partial = path.with_suffix(f".{os.getpid()}.part")
+        try:
+            partial.write_text(json.dumps(entry, ensure_ascii=False), encoding='utf-8')
+            os.replace(partial, path)
+        except OSError as e:
+            self.logger.warning(f"Could not store validators for {url}: {e}")
+            partial.unlink(missing_ok=True)
+
+    def forget(self, url: str) -> None:
+        self._entries[url] = None
+        self.path_for(url).unlink(missing_ok=True)
+
+
+class HTTPClient:
+    """
+    Gemeinsamer HTTP-Client für alle Abrufe eines Managers.
+
+    Eine einzige aiohttp-Session hält Verbindungen offen (Keep-Alive),
+    begrenzt sie je Host, cacht DNS-Auflösungen und handelt Kompression
+    aus. Mit einem ValidatorStore werden Abrufe bedingt gestellt
+    (If-None-Match/If-Modified-Since); unveränderte Seiten kommen als 304
+    zurück, und der Aufrufer übernimmt sein gespeichertes Ergebnis.
+    """
+
+    def __init__(self,
+                 limit: int = 32,
+                 limit_per_host: int = 6,
+                 keepalive_timeout: float = 30,
+                 dns_cache_ttl: int = 300,
+                 timeout: float = 60,
+                 store: Optional[ValidatorStore] = None,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            limit: Obergrenze offener Verbindungen insgesamt
+            limit_per_host: Obergrenze offener Verbindungen je Host
+            keepalive_timeout: Sekunden, die eine freie Verbindung offen bleibt
+            dns_cache_ttl: Gültigkeit aufgelöster Hostnamen in Sekunden
+            timeout: Zeitlimit je Abruf in Sekunden
+            store: Ablage der Validatoren; ohne Store keine bedingten Abrufe
+            logger: Logger; Standard ist 'HTTPClient'
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self.store = store
+        self.logger = logger or logging.getLogger('HTTPClient')
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.requests = 0
+        self.not_modified = 0
+
+    async def __aenter__(self) -> "HTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Erst beim ersten Abruf anlegen, damit die Session an der
+        # laufenden Event-Loop hängt
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'Accept-Encoding': ACCEPT_ENCODING},
+            )
+        return self._session
+
+    @asynccontextmanager
+    async def get(self, url: str, conditional: bool = True,
+                  key: Optional[str] = None) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Ruft eine URL über die gemeinsame Session ab
+
+        Args:
+            url: Abzurufende URL
+            conditional: Gespeicherte Validatoren mitsenden
+            key: Ablageschlüssel der Validatoren; Standard ist die URL.
+                Verschiedene Ergebnisse derselben Seite (z.B. HTML-Analyse
+                und Gesamtanalyse) liegen unter eigenen Schlüsseln
+        """
+        headers = self._conditional_headers(key or url) if conditional else {}
+        self.requests += 1
+        async with self._get_session().get(url, headers=headers) as response:
+            if response.status == 304:
+                self.not_modified += 1
+            yield response
+
+    async def head(self, url: str, conditional: bool = True,
+                   key: Optional[str] = None) -> Tuple[int, Mapping[str, str]]:
+        """
+        Fragt eine URL per HEAD ab, ohne den Body zu übertragen
+
+        Die Verbindung geht danach an den Pool zurück. Argumente wie bei
+        get().
+
+        Returns:
+            (Status, Antwort-Header)
+        """
+        headers = self._conditional_headers(key or url) if conditional else {}
+        self.requests += 1
+        async with self._get_session().head(url, headers=headers, allow_redirects=True) as response:
+            if response.status == 304:
+                self.not_modified += 1
+            return response.status, response.headers
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        entry = self.store.load(url) if self.store is not None else None
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def cached_result(self, url: str, key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Das zu den gesendeten Validatoren gespeicherte Ergebnis"""
+        entry = self.store.load(key or url) if self.store is not None else None
+        return entry.get('result') if entry else None
+
+    def remember(self, url: str, headers: Mapping[str, str], result: Dict[str, Any],
+                 key: Optional[str] = None) -> None:
+        """Speichert Validatoren (aus den Antwort-Headern) und Ergebnis einer vollständigen Antwort"""
+        if self.store is None:
+            return
+        url = key or url
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if etag or last_modified:
+            self.store.save(url, {'etag': etag, 'last_modified': last_modified, 'result': result})
+        elif self.store.load(url) is not None:
+            self.store.forget(url)
+
+    async def close(self) -> None:
+        """Schließt die Session und alle offenen Verbindungen"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
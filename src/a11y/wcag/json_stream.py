@@ -0,0 +1,117 @@
+# src/wcag/json_stream.py
+
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+# Außerhalb von Zeichenketten sind nur Strukturzeichen interessant; alles
+# dazwischen wird übersprungen
+_STRUCTURAL = re.compile(r'["{}\[\],]')
+
+
+class JSONMemberExtractor:
+    """
+    Liest ausgewählte Einträge des obersten JSON-Objekts aus einem Datenstrom
+
+    Das Dokument wird stückweise per feed() gelesen. Nur die Werte der
+    gesuchten Schlüssel werden gepuffert und mit json.loads geparst; alles
+    andere, etwa Screenshots in Lighthouse-Berichten, wird lediglich
+    überflogen. Sind alle Schlüssel gefunden, meldet feed() das Ende, und
+    der Rest des Stroms muss nicht mehr gelesen werden.
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        self.wanted = set(keys)
+        self.values: Dict[str, Any] = {}
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expecting_key = False
+        # Teile des gerade gelesenen Schlüssels bzw. des gepufferten Werts
+        self._key_parts: Optional[List[str]] = None
+        self._capture: Optional[List[str]] = None
+        self._capture_key: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self.wanted.issubset(self.values)
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Verarbeitet das nächste Stück des Dokuments
+
+        Returns:
+            True, sobald alle gesuchten Schlüssel gefunden sind
+        """
+        position, end = 0, len(chunk)
+        capture_start = 0
+        while position < end and not self.done:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    self._collect_key(chunk[position])
+                    position += 1
+                    continue
+                # str.find statt Regex: lange Zeichenketten (Base64-Bilder)
+                # werden so mit memchr-Geschwindigkeit übersprungen
+                index = chunk.find('"', position)
+                backslash = chunk.find('\\', position, end if index < 0 else index)
+                if backslash >= 0:
+                    index = backslash
+                elif index < 0:
+                    self._collect_key(chunk[position:])
+                    position = end
+                    break
+                if chunk[index] == '\\':
+                    self._collect_key(chunk[position:index + 1])
+                    self._escape = True
+                    position = index + 1
+                    continue
+                self._collect_key(chunk[position:index])
+                self._in_string = False
+                position = index + 1
+                if self._key_parts is not None:
+                    key = json.loads('"' + ''.join(self._key_parts) + '"')
+                    self._key_parts = None
+                    if key in self.wanted:
+                        self._capture, self._capture_key = [], key
+                        capture_start = position
+                continue
+
+            match = _STRUCTURAL.search(chunk, position)
+            if match is None:
+                position = end
+                break
+            index = match.start()
+            char = chunk[index]
+            position = index + 1
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expecting_key:
+                    self._key_parts = []
+                    self._expecting_key = False
+            elif char in '{[':
+                self._depth += 1
+                if self._depth == 1 and char == '{':
+                    self._expecting_key = True
+            elif char in '}]' or (char == ',' and self._depth == 1):
+                if self._depth == 1:
+                    if self._capture is not None:
+                        self._finish_capture(chunk[capture_start:index])
+                    self._expecting_key = char == ','
+                if char != ',':
+                    self._depth -= 1
+
+        if self._capture is not None:
+            self._capture.append(chunk[capture_start:position])
+        return self.done
+
+    def _collect_key(self, text: str) -> None:
+        if self._key_parts is not None:
+            self._key_parts.append(text)
+
+    def _finish_capture(self, tail: str) -> None:
+        # Gepuffert wurde ab dem Schlüssel, also einschließlich des Doppelpunkts
+        raw = ''.join(self._capture) + tail
+        self.values[self._capture_key] = json.loads(raw.strip()[1:])
+        self._capture = self._capture_key = None
@@ -0,0 +1,109 @@
+# src/wcag/lighthouse_analyzer.py
+
+import asyncio
+import codecs
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from .base_analyzer import BaseAnalyzer
+from .json_stream import JSONMemberExtractor
+
+class LighthouseAnalyzer(BaseAnalyzer):
+    """Analyzer für Lighthouse Accessibility Tests"""
+
+    # Lesegröße für den JSON-Bericht auf stdout
+    READ_CHUNK_SIZE = 256 * 1024
+    
+    async def analyze(self, url: str) -> Dict[str, Any]:
+        """Führt Lighthouse Tests aus und verarbeitet Ergebnisse"""
+        try:
+            # Lighthouse Kommando vorbereiten; eine Allow-Liste ersetzt den Kategoriefilter
+            audit_filter = self.conformance.lighthouse_args()
+            if not any(arg.startswith('--only-audits') for arg in audit_filter):
+                audit_filter.insert(0, '--only-categories=accessibility')
+            cmd = [
+                await self._tool_command('lighthouse'),
+                url,
+                '--output=json',
+                '--quiet',
+                *audit_filter,
+                *(f'--blocked-url-patterns={pattern}'
+                  for pattern in self.conformance.resource_profile('lighthouse').url_patterns())
+            ]
+            
+            # Lighthouse ausführen; mit DevTools-fähigem Browserpool hängt es
+            # sich an einen warmen Browser, statt Chrome selbst zu starten
+            pool = self.browser_pool
+            if pool is not None and pool.remote_debugging:
+                async with pool.devtools() as port:
+                    returncode, audits, stderr = await self._run_lighthouse([*cmd, f'--port={port}'])
+            else:
+                returncode, audits, stderr = await self._run_lighthouse(
+                    [*cmd, '--chrome-flags=--headless --no-sandbox --disable-gpu']
+                )
+            
+            if returncode != 0:
+                return self._create_error_result(
+                    f"Lighthouse failed with code {returncode}: {stderr.decode()}", 
+                    url
+                )
+            if audits is None:
+                return self._create_error_result(
+                    "Failed to parse Lighthouse output", 
+                    url
+                )
+
+            return {
+                "status": "success",
+                "tool": "lighthouse",
+                "url": url,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "results": audits
+            }
+                
+        except Exception as e:
+            return self._create_error_result(str(e), url)
+
+    async def _run_lighthouse(self, cmd: List[str]):
+        """
+        Führt Lighthouse aus und liest nur die Audits aus dem Bericht
+
+        Der Bericht wird beim Lesen von stdout inkrementell durchsucht; nur
+        der Eintrag "audits" wird gepuffert und geparst. Danach wird der
+        Rest (Screenshots, i18n, ...) nur noch abgelesen, damit Lighthouse
+        nicht an einer vollen Pipe hängen bleibt.
+
+        Returns:
+            (returncode, audits oder None bei unlesbarem Bericht, stderr)
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        extractor = JSONMemberExtractor(['audits'])
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        parsed = True
+        try:
+            while True:
+                chunk = await process.stdout.read(self.READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if parsed and not extractor.done:
+                    try:
+                        extractor.feed(decoder.decode(chunk))
+                    except json.JSONDecodeError:
+                        parsed = False
+            stderr = await stderr_task
+            returncode = await process.wait()
+        except asyncio.CancelledError:
+            stderr_task.cancel()
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+
+        audits = extractor.values.get('audits') if parsed and extractor.done else None
+        return returncode, audits, stderr
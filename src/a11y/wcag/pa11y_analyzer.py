@@ -0,0 +1,126 @@
+# src/wcag/pa11y_analyzer.py
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from .base_analyzer import BaseAnalyzer
+from .pa11y_worker import Pa11yWorker
+
+class Pa11yAnalyzer(BaseAnalyzer):
+    """Analyzer für Pa11y Accessibility Tests"""
+
+    # Zeitlimit je Seite in Millisekunden
+    TIMEOUT_MS = 60000
+
+    def __init__(self, *args, pa11y_worker: Optional[Pa11yWorker] = None, **kwargs):
+        """
+        Args:
+            pa11y_worker: Langlebiger pa11y-Prozess mit geteiltem Browser;
+                ohne Worker wird ein Snapshot per pa11y-Kommando geprüft und
+                eine URL in einem eigenen, kurzlebigen Worker
+        """
+        super().__init__(*args, **kwargs)
+        self.pa11y_worker = pa11y_worker
+
+    async def analyze(self, url: str) -> Dict[str, Any]:
+        """
+        Führt Pa11y Tests aus und verarbeitet Ergebnisse
+
+        Ein Snapshot-DOM ist bereits stabil und wird ohne Wartezeit geprüft.
+        Live-Seiten lädt immer der Worker, der auf ein stabiles DOM wartet
+        statt einer festen Wartezeit.
+        """
+        target = self._target(url)
+        if self.pa11y_worker is not None or target == url:
+            return (await self.analyze_batch([url]))[url]
+        try:
+            # Pa11y Kommando vorbereiten
+            cmd = [
+                await self._tool_command('pa11y'),
+                '--reporter', 'json',
+                *self.conformance.pa11y_args(),
+                '--timeout', str(self.TIMEOUT_MS),
+                target
+            ]
+            
+            # Pa11y ausführen
+            returncode, stdout, stderr = await self._run_process(cmd)
+            
+            # Ergebnisse verarbeiten
+            if returncode == 2:  # Pa11y gibt 2 zurück, wenn es Probleme findet
+                try:
+                    results = json.loads(stdout.decode())
+                    return {
+                        "status": "success",
+                        "tool": "pa11y",
+                        "url": url,
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "results": results
+                    }
+                except json.JSONDecodeError:
+                    return self._create_error_result(
+                        "Failed to parse Pa11y output", url
+                    )
+            elif returncode != 0:
+                return self._create_error_result(
+                    f"Pa11y failed with code {returncode}: {stderr.decode()}", 
+                    url
+                )
+            
+            # Keine Probleme gefunden
+            return {
+                "status": "success",
+                "tool": "pa11y",
+                "url": url,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "results": []
+            }
+            
+        except Exception as e:
+            return self._create_error_result(str(e), url)
+
+    async def analyze_batch(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Prüft viele URLs in einem einzigen pa11y-Prozess
+
+        Ohne gemeinsamen Worker wird für den Batch ein eigener gestartet
+        und danach beendet.
+
+        Returns:
+            URL -> Ergebnis im Format von analyze()
+        """
+        if self.pa11y_worker is not None:
+            return await self._analyze_with_worker(self.pa11y_worker, urls)
+        async with Pa11yWorker(logger=self.logger) as worker:
+            return await self._analyze_with_worker(worker, urls)
+
+    async def _analyze_with_worker(self, worker: Pa11yWorker, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        options = {
+            **self.conformance.pa11y_options(),
+            'timeout': self.TIMEOUT_MS
+        }
+        try:
+            targets = {url: self._target(url) for url in urls}
+            outcomes = await worker.run_batch(
+                list(dict.fromkeys(targets.values())), options,
+                resources=self.conformance.resource_profile('pa11y').to_job()
+            )
+        except Exception as e:
+            return {url: self._create_error_result(str(e), url) for url in urls}
+
+        results = {}
+        for url, target in targets.items():
+            outcome = outcomes[target]
+            if "error" in outcome:
+                results[url] = self._create_error_result(f"Pa11y failed: {outcome['error']}", url)
+            else:
+                results[url] = {
+                    "status": "success",
+                    "tool": "pa11y",
+                    "url": url,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "results": outcome["issues"] or [],
+                    "readiness": outcome.get("readiness")
+                }
+        return results
@@ -0,0 +1,97 @@
+// src/wcag/pa11y_worker.js
+//
+// Long-lived pa11y worker. Keeps Node.js and a single Puppeteer browser
+// warm and runs pa11y through its programmatic API on tabs of that browser,
+// so a URL costs a navigation instead of a process and a Chrome start.
+// Jobs arrive as newline-delimited JSON on stdin and every job is answered
+// with exactly one JSON line on stdout; diagnostics go to stderr.
+//
+// Request:  {"id": 1, "cmd": "run", "url": "https://...",
+//            "options": {"standard": "WCAG2AA", "ignore": [...], "timeout": 60000},
+//            "resources": {...}, "readiness": {"quiet_ms": 300, "timeout_ms": 10000}}
+// Response: {"id": 1, "ok": true, "issues": [...], "document_title": "...", "page_url": "...",
+//            "readiness": {...}}
+//           {"id": 1, "ok": false, "error": "..."}
+//
+// "issues" is what `pa11y --reporter json` prints for the same URL.
+// The worker loads the page itself, up to DOMContentLoaded and then until
+// the DOM is stable (see tools/stability_probe.js), and hands the settled
+// tab to pa11y with ignoreUrl instead of a fixed "wait". "readiness" in the
+// response records how long that took.
+// "resources" is a resource profile (see tools/resource_blocking.js) whose
+// URL patterns are blocked in the tab before pa11y navigates; omitted or
+// "full" loads everything.
+// Run jobs may arrive while others are still running; they share a pool of
+// at most `maxPages` tabs and queue until a tab is free.
+// {"cmd": "configure", "max_pages": N} resizes the pool.
+// {"cmd": "cancel", "target": <id>} abandons a queued or running job and
+// closes its tab; it is not answered, the cancelled job itself fails.
+// Protocol, browser and cancellation come from tools/worker_protocol.js.
+
+const pa11y = require('pa11y');
+const { blockResourceUrls } = require('../tools/resource_blocking');
+const { loadAndSettle } = require('../tools/page_readiness');
+const { Slots, createWorker } = require('../tools/worker_protocol');
+
+const DEFAULT_MAX_PAGES = 4;
+
+const worker = createWorker('pa11y-worker');
+const { log } = worker;
+
+// Open tabs, at most maxPages at a time
+const tabs = new Slots(DEFAULT_MAX_PAGES);
+
+async function run(job) {
+    let page;
+    // Closing the tab stops pa11y and frees the slot right away
+    const control = worker.trackJob(job, () => {
+        if (page) {
+            page.close().catch(() => {});
+        }
+    });
+
+    await tabs.acquire();
+    try {
+        control.check();
+        return await Promise.race([(async () => {
+            const browser = await worker.getBrowser();
+            // A fresh tab per URL: pa11y leaves listeners and injected scripts behind
+            page = await browser.newPage();
+            if (control.isCancelled) {
+                // Opened after the cancel already cleaned up
+                page.close().catch(() => {});
+            }
+            control.check();
+            await blockResourceUrls(page, job.resources);
+            const options = job.options || {};
+            log(`Loading ${job.url}...`);
+            const { readiness } = await loadAndSettle(page, job.url, {
+                timeout: options.timeout,
+                readiness: job.readiness
+            });
+            log(`Testing ${job.url} (${readiness.stable ? 'stable' : 'still changing'} after ${readiness.waited_ms} ms)...`);
+            const results = await pa11y(job.url, { ...options, wait: 0, ignoreUrl: true, browser, page });
+            return {
+                issues: results.issues,
+                document_title: results.documentTitle,
+                page_url: results.pageUrl,
+                readiness
+            };
+        })(), control.cancelled]);
+    } finally {
+        control.done();
+        if (page) {
+            page.close().catch(() => {});
+        }
+        tabs.release();
+    }
+}
+
+function configure(job) {
+    if (job.max_pages) {
+        tabs.resize(job.max_pages);
+    }
+    return { max_pages: tabs.limit };
+}
+
+worker.serve({ run, configure });
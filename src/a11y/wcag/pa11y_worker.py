@@ -0,0 +1,112 @@
+# src/wcag/pa11y_worker.py
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..errors.exceptions import Pa11yWorkerError
+from ..tools.node_toolchain import NodeToolchain
+from ..tools.node_worker import NodeWorkerClient
+
+WORKER_SCRIPT = Path(__file__).with_name("pa11y_worker.js")
+
+
+class Pa11yWorker(NodeWorkerClient):
+    """
+    Client für den langlebigen Node.js Pa11y Worker (pa11y_worker.js).
+
+    Der Worker hält Node.js und einen Chromium warm und führt pa11y über
+    seine programmatische API in Tabs dieses Browsers aus. Aufträge gehen
+    als zeilenweises JSON über stdin/stdout und werden per id zugeordnet
+    (siehe NodeWorkerClient), so dass viele URLs gleichzeitig unterwegs
+    sein können; der Worker begrenzt die offenen Tabs auf max_pages.
+
+    Der Worker gehört zur Event-Loop, in der er gestartet wurde, und wird
+    beim ersten Auftrag gestartet.
+    """
+
+    name = "Pa11y worker"
+    error_class = Pa11yWorkerError
+    # pa11y-Ergebnisse reisen über stdout
+    stream_limit = 16 * 1024 * 1024
+
+    def __init__(self,
+                 max_pages: int = 4,
+                 script_path: Path = WORKER_SCRIPT,
+                 node_binary: str = "node",
+                 toolchain: Optional[NodeToolchain] = None,
+                 startup_timeout: float = 30.0,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            max_pages: Gleichzeitig geprüfte Seiten im Browser des Workers
+            script_path: Worker-Skript
+            node_binary: Node.js-Programm
+            toolchain: Node.js-Werkzeugkette; Standard ist die des Projekts
+            startup_timeout: Sekunden bis zur Bereitschaftsmeldung
+            logger: Logger; Standard ist 'Pa11yWorker'
+        """
+        super().__init__(script_path, node_binary, toolchain, startup_timeout, logger)
+        self.max_pages = max_pages
+
+    async def __aenter__(self) -> "Pa11yWorker":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def run(self, url: str, options: Dict[str, Any], timeout: float = 120.0,
+                  resources: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Prüft eine URL mit pa11y
+
+        Args:
+            url: Zu testende URL
+            options: pa11y-Optionen (standard, ignore, timeout, ...)
+            timeout: Sekunden bis zum Abbruch des Auftrags
+            resources: Ressourcenprofil (ResourceProfile.to_job()); None lädt alles
+
+        Returns:
+            {"issues": [...], "document_title": ..., "page_url": ...,
+             "readiness": {"stable": ..., "waited_ms": ...}}
+        """
+        payload = {"cmd": "run", "url": url, "options": options}
+        if resources is not None:
+            payload["resources"] = resources
+        response = await self._request(payload, timeout)
+        return {key: response.get(key) for key in ("issues", "document_title", "page_url", "readiness")}
+
+    async def run_batch(self, urls: List[str], options: Dict[str, Any],
+                        page_timeout: float = 120.0,
+                        resources: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Prüft viele URLs; der Worker arbeitet höchstens max_pages gleichzeitig ab
+
+        Returns:
+            URL -> Ergebnis von run() oder {"error": ...}
+        """
+        # Aufträge über der Tab-Grenze warten im Worker, die Gesamtdauer
+        # wächst mit der Zahl der "Runden"
+        rounds = -(-len(urls) // max(1, self.max_pages))
+        timeout = page_timeout * max(1, rounds) + 30
+
+        async def run_one(url: str) -> Dict[str, Any]:
+            try:
+                return await self.run(url, options, timeout, resources)
+            except Pa11yWorkerError as e:
+                return {"error": str(e)}
+
+        outcomes = await asyncio.gather(*(run_one(url) for url in urls))
+        return dict(zip(urls, outcomes))
+
+    async def start(self) -> None:
+        """Startet den Worker, falls er noch nicht läuft"""
+        await self._start()
+
+    async def close(self) -> None:
+        """Beendet den Worker und seinen Browser"""
+        await self._close()
+
+    async def _on_started(self) -> None:
+        await self._request({"cmd": "configure", "max_pages": self.max_pages})
@@ -0,0 +1,34 @@
+# src/wcag/page_readiness.py
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Gemeinsam mit den Node.js-Workern genutzte Sonde (siehe dort für das Ergebnisformat)
+STABILITY_PROBE = Path(__file__).resolve().parent.parent / 'tools' / 'stability_probe.js'
+
+
+@lru_cache(maxsize=1)
+def stability_probe_source() -> str:
+    return STABILITY_PROBE.read_text(encoding='utf-8')
+
+
+def probe_expression(quiet_ms: Optional[int] = None, timeout_ms: Optional[int] = None) -> str:
+    """
+    JavaScript-Ausdruck, der wartet, bis die Seite stabil ist
+
+    Der Ausdruck liefert ein Promise auf das Ergebnis der Sonde, u.a.
+    {"stable": bool, "waited_ms": float}. Ohne Angaben gelten die
+    Vorgaben der Sonde.
+
+    Args:
+        quiet_ms: Ruhefenster ohne DOM-Änderungen und Layout-Verschiebungen
+        timeout_ms: Höchstwartezeit, danach gilt die Seite als nicht stabil
+    """
+    options: Dict[str, Any] = {}
+    if quiet_ms is not None:
+        options['quiet_ms'] = quiet_ms
+    if timeout_ms is not None:
+        options['timeout_ms'] = timeout_ms
+    return f"({stability_probe_source()})({json.dumps(options)})"
@@ -0,0 +1,246 @@
+# src/wcag/page_snapshot.py
+
+import hashlib
+import html as html_lib
+import json
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .browser_pool import BrowserPool
+from .page_readiness import probe_expression
+from .resource_profiles import ResourceProfile, route_resources
+
+# Berechnete Stile, die für Kontrast, Sichtbarkeit und Textgröße relevant sind
+SNAPSHOT_STYLES = [
+    'color', 'background-color', 'font-size', 'font-weight',
+    'display', 'visibility', 'opacity', 'position', 'overflow'
+]
+
+# Obergrenze erfasster Elemente, damit sehr große Seiten den Snapshot nicht sprengen
+MAX_SNAPSHOT_ELEMENTS = 20000
+
+# Läuft in der Seite: Layout-Boxen und berechnete Stile in Dokumentreihenfolge
+_CAPTURE_ELEMENTS_JS = """
+([properties, limit]) => {
+    const elements = [];
+    const all = document.body ? document.body.querySelectorAll('*') : [];
+    for (let i = 0; i < all.length && elements.length < limit; i++) {
+        const el = all[i];
+        const rect = el.getBoundingClientRect();
+        const computed = window.getComputedStyle(el);
+        const styles = {};
+        for (const property of properties) {
+            styles[property] = computed.getPropertyValue(property);
+        }
+        elements.push({
+            index: i,
+            tag: el.tagName.toLowerCase(),
+            id: el.id || null,
+            box: [rect.x, rect.y, rect.width, rect.height],
+            styles
+        });
+    }
+    return {elements, total: all.length};
+}
+"""
+
+_HEAD_RE = re.compile(r'<head(\s[^>]*)?>', re.IGNORECASE)
+
+
+@dataclass
+class PageSnapshot:
+    """
+    Einmal gerenderter Zustand einer Seite, den alle Analyzer teilen.
+
+    Enthält das finale DOM nach Skriptausführung, Layout-Boxen und
+    berechnete Stile der Elemente (in Dokumentreihenfolge unterhalb von
+    <body>) sowie das HAR der Navigation. readiness hält fest, wie lange
+    bis zum stabilen DOM gewartet wurde. Das DOM wird zusätzlich als
+    Datei mit <base href> abgelegt, damit externe Werkzeuge die Seite
+    über file_url prüfen können, statt sie erneut zu laden. Die Datei
+    enthält keine Skripte: sie liefen sonst ein zweites Mal auf dem
+    bereits gerenderten DOM, und unter file:// schlagen ihre Abrufe fehl.
+    """
+    url: str
+    final_url: str
+    status: Optional[int]
+    html: str
+    elements: List[Dict[str, Any]] = field(default_factory=list)
+    total_elements: int = 0
+    html_path: Optional[Path] = None
+    har_path: Optional[Path] = None
+    readiness: Optional[Dict[str, Any]] = None
+    captured_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    @property
+    def file_url(self) -> Optional[str]:
+        """file://-URL des gespeicherten DOMs"""
+        return self.html_path.resolve().as_uri() if self.html_path else None
+
+    @property
+    def truncated(self) -> bool:
+        """True, wenn nicht alle Elemente erfasst wurden"""
+        return self.total_elements > len(self.elements)
+
+    @classmethod
+    async def capture(cls,
+                      browser_pool: BrowserPool,
+                      url: str,
+                      output_dir: Path,
+                      wait_until: str = 'domcontentloaded',
+                      timeout_ms: int = 60000,
+                      resources: Optional[ResourceProfile] = None) -> "PageSnapshot":
+        """
+        Lädt eine Seite einmal im Browserpool und hält ihren Zustand fest
+
+        Args:
+            browser_pool: Pool, aus dem der Browser-Kontext geliehen wird
+            url: Zu ladende URL
+            output_dir: Verzeichnis für DOM, Elementdaten und HAR
+            wait_until: Playwright-Ladezustand, ab dem auf ein stabiles DOM
+                gewartet wird
+            timeout_ms: Navigationszeitlimit
+            resources: Ressourcenprofil für das Laden; None lädt alles
+
+        Returns:
+            Snapshot der Seite
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        # Zeitstempel und Zufallsanteil halten gleichzeitige Läufe derselben
+        # URL auseinander, auch über Manager mit gemeinsamem output_dir
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        url_hash = hashlib.sha1(url.encode()).hexdigest()[:8]
+        stem = f"snapshot_{timestamp}_{url_hash}_{uuid.uuid4().hex[:8]}"
+        har_path = output_dir / f"{stem}.har"
+
+        # Das HAR wird beim Schließen des Kontexts geschrieben
+        async with browser_pool.context(record_har_path=str(har_path), record_har_content='omit') as context:
+            if resources is not None:
+                await route_resources(context, resources)
+            page = await context.new_page()
+            response = await page.goto(url, wait_until=wait_until, timeout=timeout_ms)
+            readiness = await page.evaluate(probe_expression())
+            html = await page.content()
+            captured = await page.evaluate(_CAPTURE_ELEMENTS_JS, [SNAPSHOT_STYLES, MAX_SNAPSHOT_ELEMENTS])
+            final_url = page.url
+
+        snapshot = cls(
+            url=url,
+            final_url=final_url,
+            status=response.status if response else None,
+            html=html,
+            elements=captured.get('elements', []),
+            total_elements=captured.get('total', 0),
+            har_path=har_path if har_path.exists() else None,
+            readiness=readiness
+        )
+        snapshot.save(output_dir / stem)
+        return snapshot
+
+    def save(self, path_stem: Path) -> None:
+        """
+        Speichert das DOM (<stem>.html) und die Elementdaten (<stem>.json)
+
+        Das gespeicherte DOM erhält ein <base href> auf die finale URL, damit
+        relative Ressourcen beim Laden über file_url aufgelöst werden.
+        <script>-Elemente und on*-Handler werden entfernt; html selbst
+        bleibt unverändert.
+        """
+        self.html_path = path_stem.with_suffix('.html')
+        static_html = _without_scripts(self.html)
+        self.html_path.write_text(_with_base_href(static_html, self.final_url), encoding='utf-8')
+        with open(path_stem.with_suffix('.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                "url": self.url,
+                "final_url": self.final_url,
+                "status": self.status,
+                "captured_at": self.captured_at,
+                "readiness": self.readiness,
+                "total_elements": self.total_elements,
+                "elements": self.elements,
+                "har": str(self.har_path) if self.har_path else None
+            }, f)
+
+
+def _with_base_href(html: str, base_url: str) -> str:
+    """Fügt direkt nach <head> ein <base href> ein, sofern keines vorhanden ist"""
+    if re.search(r'<base\s[^>]*href', html, re.IGNORECASE):
+        return html
+    base = f'<base href="{base_url}">'
+    match = _HEAD_RE.search(html)
+    if match:
+        return html[:match.end()] + base + html[match.end():]
+    return base + html
+
+
+class _ScriptStripper(HTMLParser):
+    """Gibt das Markup unverändert wieder aus, ohne <script> und on*-Attribute"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.parts: List[str] = []
+        self._in_script = False
+
+    def handle_starttag(self, tag, attrs):
+        self._emit_tag(tag, attrs, self.get_starttag_text())
+
+    def handle_startendtag(self, tag, attrs):
+        self._emit_tag(tag, attrs, self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if tag == 'script':
+            self._in_script = False
+        elif not self._in_script:
+            self.parts.append(f'</{tag}>')
+
+    def handle_data(self, data):
+        if not self._in_script:
+            self.parts.append(data)
+
+    def handle_entityref(self, name):
+        self.parts.append(f'&{name};')
+
+    def handle_charref(self, name):
+        self.parts.append(f'&#{name};')
+
+    def handle_comment(self, data):
+        self.parts.append(f'<!--{data}-->')
+
+    def handle_decl(self, decl):
+        self.parts.append(f'<!{decl}>')
+
+    def handle_pi(self, data):
+        self.parts.append(f'<?{data}>')
+
+    def unknown_decl(self, data):
+        self.parts.append(f'<![{data}]>')
+
+    def _emit_tag(self, tag, attrs, text):
+        if tag == 'script':
+            # Ein selbstschließendes <script/> hat kein Endtag
+            self._in_script = not text.endswith('/>')
+            return
+        if self._in_script:
+            return
+        if not any(name.startswith('on') for name, _ in attrs):
+            self.parts.append(text)
+            return
+        kept = ''.join(
+            f' {name}' if value is None else f' {name}="{html_lib.escape(value)}"'
+            for name, value in attrs if not name.startswith('on')
+        )
+        self.parts.append(f'<{tag}{kept}{" /" if text.endswith("/>") else ""}>')
+
+
+def _without_scripts(html: str) -> str:
+    """Entfernt <script>-Elemente und Inline-Handler (onclick, onload, ...)"""
+    stripper = _ScriptStripper()
+    stripper.feed(html)
+    stripper.close()
+    return ''.join(stripper.parts)
@@ -0,0 +1,176 @@
+# src/wcag/resource_profiles.py
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Bekannte Tracking- und Analytics-Hosts (samt Subdomains); für DOM-Prüfungen
+# ohne Bedeutung, halten aber networkidle-Wartezeiten auf
+TRACKER_HOSTS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'googleadservices.com', 'connect.facebook.net',
+    'analytics.tiktok.com', 'hotjar.com', 'clarity.ms', 'segment.io',
+    'segment.com', 'mixpanel.com', 'amplitude.com', 'newrelic.com',
+    'nr-data.net', 'matomo.cloud', 'bat.bing.com', 'ads.linkedin.com',
+    'snap.licdn.com', 'scorecardresearch.com', 'quantserve.com', 'optimizely.com',
+)
+
+# Dateiendungen je Ressourcenklasse für Werkzeuge, die nur URL-Muster kennen
+# (Lighthouse, Network.setBlockedURLs)
+RESOURCE_EXTENSIONS: Dict[str, List[str]] = {
+    'image': ['png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'],
+    'media': ['mp4', 'webm', 'ogg', 'ogv', 'mp3', 'wav', 'm4a', 'mov', 'm3u8'],
+    'font': ['woff', 'woff2', 'ttf', 'otf', 'eot'],
+    'stylesheet': ['css'],
+    'texttrack': ['vtt'],
+    'manifest': ['webmanifest'],
+}
+
+# Ersatzantworten für gestubbte Klassen: die Ressource "lädt", ohne übertragen zu werden
+_TRANSPARENT_GIF = (
+    b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00'
+    b'\x00\x00\x00,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'
+)
+STUB_RESPONSES: Dict[str, Dict[str, Any]] = {
+    'image': {'content_type': 'image/gif', 'body': _TRANSPARENT_GIF},
+    'stylesheet': {'content_type': 'text/css', 'body': b''},
+}
+
+
+@dataclass(frozen=True)
+class ResourceProfile:
+    """
+    Welche Ressourcen beim Laden einer Seite für die Analyse entfallen
+
+    Gestubbte Klassen werden mit einer leeren Ersatzantwort beantwortet,
+    damit load- und error-Handler der Seite wie gewohnt laufen; blockierte
+    Klassen und Hosts werden abgebrochen. Der Rang ordnet die Profile von
+    sparsam (dom-only) bis vollständig (full).
+    """
+    name: str
+    rank: int
+    stub_types: FrozenSet[str] = frozenset()
+    block_types: FrozenSet[str] = frozenset()
+    block_hosts: FrozenSet[str] = frozenset()
+
+    @property
+    def blocks_anything(self) -> bool:
+        return bool(self.stub_types or self.block_types or self.block_hosts)
+
+    def action(self, resource_type: str, url: str) -> Optional[str]:
+        """'stub', 'block' oder None (laden) für eine Anfrage"""
+        if self.block_hosts and _matches_host(urlsplit(url).hostname or '', self.block_hosts):
+            return 'block'
+        if resource_type in self.stub_types:
+            return 'stub'
+        if resource_type in self.block_types:
+            return 'block'
+        return None
+
+    def url_patterns(self) -> List[str]:
+        """Dieselbe Auswahl als URL-Muster; gestubbte Klassen werden dabei blockiert"""
+        patterns = [f'*://*.{host}/*' for host in sorted(self.block_hosts)]
+        patterns += [f'*://{host}/*' for host in sorted(self.block_hosts)]
+        for resource_type in sorted(self.stub_types | self.block_types):
+            for extension in RESOURCE_EXTENSIONS.get(resource_type, []):
+                patterns += [f'*.{extension}', f'*.{extension}?*']
+        return patterns
+
+    def to_job(self) -> Dict[str, Any]:
+        """Darstellung für die Node.js-Worker (resource_blocking.js)"""
+        return {
+            'name': self.name,
+            'stub_types': sorted(self.stub_types),
+            'block_types': sorted(self.block_types),
+            'block_hosts': sorted(self.block_hosts),
+            'url_patterns': self.url_patterns(),
+        }
+
+
+RESOURCE_PROFILES: Dict[str, ResourceProfile] = {
+    'dom-only': ResourceProfile(
+        'dom-only', 0,
+        stub_types=frozenset({'image', 'stylesheet'}),
+        block_types=frozenset({'media', 'font', 'texttrack', 'manifest'}),
+        block_hosts=frozenset(TRACKER_HOSTS),
+    ),
+    'no-media': ResourceProfile(
+        'no-media', 1,
+        stub_types=frozenset({'image'}),
+        block_types=frozenset({'media', 'font'}),
+        block_hosts=frozenset(TRACKER_HOSTS),
+    ),
+    'full': ResourceProfile('full', 2),
+}
+
+# axe-Regeln (Lighthouse verwendet dieselben IDs), deren Ergebnis von echten
+# Ressourcen abhängt: mindestens nötiges Profil und der axe-Tag, über den die
+# Regel bei Tag-Auswahl läuft. Kontrast über Hintergrundbildern und mit
+# Webfonts braucht die Seite vollständig, Linkfarben, Ausrichtung und
+# Zielgrößen brauchen die Stylesheets
+ASSET_RULES: Dict[str, Tuple[str, str]] = {
+    'color-contrast': ('full', 'wcag2aa'),
+    'color-contrast-enhanced': ('full', 'wcag2aaa'),
+    'link-in-text-block': ('no-media', 'wcag2a'),
+    'css-orientation-lock': ('no-media', 'wcag21aa'),
+    'target-size': ('no-media', 'wcag22aa'),
+}
+
+# HTML_CodeSniffer prüft Kontrast (1.4.3 bzw. 1.4.6) unabhängig von axe
+PA11Y_CONTRAST_CRITERIA = {
+    'WCAG2AA': 'Principle1.Guideline1_4.1_4_3',
+    'WCAG2AAA': 'Principle1.Guideline1_4.1_4_6',
+}
+
+
+def get_resource_profile(name: str) -> ResourceProfile:
+    try:
+        return RESOURCE_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown resource profile: {name} (expected one of {', '.join(RESOURCE_PROFILES)})"
+        ) from None
+
+
+def effective_profile(requested: str, needed: Iterable[str]) -> ResourceProfile:
+    """
+    Das angeforderte Profil, angehoben auf das, was die gewählten Regeln brauchen
+
+    Args:
+        requested: Gewünschtes Profil
+        needed: Mindestprofile der laufenden Regeln
+    """
+    profile = get_resource_profile(requested)
+    for name in needed:
+        if RESOURCE_PROFILES[name].rank > profile.rank:
+            profile = RESOURCE_PROFILES[name]
+    return profile
+
+
+async def route_resources(context: Any, profile: ResourceProfile) -> None:
+    """Wendet ein Profil per Request-Routing auf einen Playwright-Kontext an"""
+    if not profile.blocks_anything:
+        return
+
+    async def handle(route):
+        request = route.request
+        action = profile.action(request.resource_type, request.url)
+        if action == 'stub':
+            stub = STUB_RESPONSES.get(request.resource_type)
+            if stub is not None:
+                await route.fulfill(status=200, content_type=stub['content_type'], body=stub['body'])
+                return
+            action = 'block'
+        if action == 'block':
+            await route.abort('blockedbyclient')
+        else:
+            await route.continue_()
+
+    await context.route('**/*', handle)
+
+
+def _matches_host(hostname: str, hosts: FrozenSet[str]) -> bool:
+    if hostname in hosts:
+        return True
+    parts = hostname.split('.')
+    return any('.'.join(parts[i:]) in hosts for i in range(1, len(parts) - 1))
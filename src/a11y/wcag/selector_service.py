@@ -0,0 +1,115 @@
+# src/wcag/selector_service.py
+
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+from bs4 import Tag
+
+from .dom_walker import DOMStats, class_names
+
+_PLAIN_IDENTIFIER = re.compile(r'^-?[A-Za-z_][A-Za-z0-9_-]*$')
+
+
+def css_escape(identifier: str) -> str:
+    """Maskiert einen Bezeichner für CSS (vereinfachtes CSS.escape)"""
+    if _PLAIN_IDENTIFIER.match(identifier):
+        return identifier
+    escaped = []
+    for index, char in enumerate(identifier):
+        if char.isdigit() and (index == 0 or (index == 1 and identifier[0] == '-')):
+            escaped.append(f"\\{ord(char):x} ")
+        elif char.isalnum() or char in '_-' or ord(char) >= 0x80:
+            escaped.append(char)
+        else:
+            escaped.append(f"\\{char}")
+    return ''.join(escaped)
+
+
+def unique_selector(stats: DOMStats, tag: str, element_id: Optional[str],
+                    classes: Iterable[str]) -> Optional[str]:
+    """Selektor, der für sich allein eindeutig ist: id vor Klasse vor Tag"""
+    if element_id and stats.ids[element_id] == 1:
+        return f"#{css_escape(element_id)}"
+    unique_classes = [f".{css_escape(name)}" for name in classes if stats.classes[name] == 1]
+    if unique_classes:
+        return min(unique_classes, key=len)
+    if stats.tags[tag] == 1:
+        return tag
+    return None
+
+
+class SelectorService:
+    """
+    Erzeugt kurze, eindeutige CSS-Selektoren für gemeldete Elemente.
+
+    Eindeutigkeit wird gegen die Häufigkeiten von ids, Klassen und Tags
+    aus dem DOM-Durchlauf geprüft: ein eindeutiges #id, .klasse oder Tag
+    genügt als Selektor, in dieser Rangfolge. Eine id bleibt auch dann
+    gültig, wenn die Seite weitere Elemente desselben Tags enthält, und hat
+    deshalb Vorrang vor einem kürzeren Tag. Andernfalls wird vom nächsten
+    Vorfahren mit eindeutigem Selektor per '>' und :nth-of-type
+    abgestiegen. Die Streaming-Analyse (html_stream) nutzt dieselbe
+    Rangfolge über unique_selector(). Selektoren
+    und Geschwisterpositionen werden je Element zwischengespeichert, so
+    dass sich Meldungen mit gemeinsamen Vorfahren deren Pfad teilen.
+    """
+
+    def __init__(self, stats: DOMStats):
+        self.stats = stats
+        self._selectors: Dict[int, str] = {}
+        # Position und Anzahl gleichnamiger Geschwister je Element
+        self._positions: Dict[int, Tuple[int, int]] = {}
+
+    def selector(self, element: Tag) -> str:
+        """Kürzester eindeutiger Selektor eines Elements"""
+        cached = self._selectors.get(id(element))
+        if cached is not None:
+            return cached
+
+        # Vorfahren ohne eindeutigen Selektor sammeln, damit der Pfad
+        # iterativ und nicht rekursiv aufgebaut wird
+        chain = []
+        current: Optional[Tag] = element
+        prefix = None
+        while current is not None and id(current) not in self._selectors:
+            own = self._unique_selector(current)
+            if own is not None:
+                self._selectors[id(current)] = own
+                break
+            chain.append(current)
+            parent = current.parent
+            current = parent if isinstance(parent, Tag) and parent.name != '[document]' else None
+        if current is not None:
+            prefix = self._selectors[id(current)]
+
+        for node in reversed(chain):
+            step = self._step(node)
+            prefix = f"{prefix} > {step}" if prefix else step
+            self._selectors[id(node)] = prefix
+
+        return self._selectors[id(element)]
+
+    def _unique_selector(self, element: Tag) -> Optional[str]:
+        return unique_selector(self.stats, element.name, element.get('id'), class_names(element))
+
+    def _step(self, element: Tag) -> str:
+        """Tag, bei gleichnamigen Geschwistern mit :nth-of-type"""
+        position, count = self._position(element)
+        return element.name if count == 1 else f"{element.name}:nth-of-type({position})"
+
+    def _position(self, element: Tag) -> Tuple[int, int]:
+        cached = self._positions.get(id(element))
+        if cached is not None:
+            return cached
+        parent = element.parent
+        siblings = [child for child in parent.contents if isinstance(child, Tag)] if parent is not None else [element]
+        # Positionen aller Geschwister auf einmal, damit jedes Elternelement
+        # nur einmal durchlaufen wird
+        totals: Dict[str, int] = {}
+        for sibling in siblings:
+            totals[sibling.name] = totals.get(sibling.name, 0) + 1
+        seen: Dict[str, int] = {}
+        for sibling in siblings:
+            seen[sibling.name] = seen.get(sibling.name, 0) + 1
+            self._positions[id(sibling)] = (seen[sibling.name], totals[sibling.name])
+        return self._positions[id(element)]
@@ -1,11 +1,15 @@
 # src/wcag/wcag_integration_manager.py
 
-from typing import Dict, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Mapping, Optional, Set, Tuple, Union
+from contextlib import contextmanager
 from datetime import datetime, timezone
+import hashlib
 import logging
 from pathlib import Path
 import json
 import asyncio
+import shutil
+import tempfile
 import aiofiles
 from ..logging_config import get_logger
 from .unified_result_processor import (
@@ -15,8 +19,16 @@ from .unified_result_processor import (
     WCAGLevel,
     IssueSeverity
 )
-from .wcag_mapping_agent import WCAGMappingAgent
-from .wcag_analyzers import HTMLAnalyzer, Pa11yAnalyzer, AxeAnalyzer, LighthouseAnalyzer
+from .analyzer_registry import load_analyzer, resolve_analyzers
+from .conformance_profile import ConformanceProfile, as_profile
+from .browser_pool import BrowserPool
+from .page_snapshot import PageSnapshot
+from .http_client import HTTPClient, ValidatorStore
+from .pa11y_worker import Pa11yWorker
+
+if TYPE_CHECKING:
+    from .base_analyzer import BaseAnalyzer
+    from .wcag_mapping_agent import WCAGMappingAgent
 
 class WCAGIntegrationManager:
     """
@@ -25,12 +37,48 @@ class WCAGIntegrationManager:
     und Berichtsgenerierung.
     """
 
-    def __init__(self, output_dir: str = "output/wcag_results"):
+    def __init__(self,
+                 output_dir: str = "output/wcag_results",
+                 conformance: Union[ConformanceProfile, Dict[str, Any], None] = None,
+                 browser_pool: Optional[BrowserPool] = None,
+                 http_client: Optional[HTTPClient] = None,
+                 pa11y_worker: Optional[Pa11yWorker] = None,
+                 analyzer_timeout: Optional[float] = 180,
+                 max_concurrent_analyzers: int = 4,
+                 use_snapshot: bool = True,
+                 keep_snapshots: int = 0,
+                 html_parser: str = 'auto',
+                 analyzers: Optional[List[str]] = None):
         """
         Initialisiert den WCAG Integration Manager
         
         Args:
             output_dir: Verzeichnis für die Ausgabedateien
+            conformance: Konformitätsprofil (Zielstufe, Best Practices,
+                Allow-/Deny-Listen, Ressourcenprofil) für alle Analyzer
+            browser_pool: Gemeinsamer Browserpool; ohne Angabe legt der
+                Manager einen eigenen an und schließt ihn in close()
+            http_client: Gemeinsamer HTTP-Client; ohne Angabe legt der
+                Manager einen mit Validator-Ablage im Ausgabeverzeichnis an
+                und schließt ihn in close()
+            pa11y_worker: Langlebiger pa11y-Prozess für alle Analysen; ohne
+                Angabe startet der Manager beim ersten pa11y-Lauf einen
+                eigenen und beendet ihn in close()
+            analyzer_timeout: Zeitlimit je Analyzer in Sekunden; danach wird
+                er abgebrochen (None: kein Limit)
+            max_concurrent_analyzers: Obergrenze gleichzeitig laufender
+                Analyzer über alle Analysen dieses Managers
+            use_snapshot: Seite einmal rendern und den Snapshot an alle
+                Analyzer weitergeben, statt sie je Werkzeug neu zu laden
+            keep_snapshots: Anzahl der zuletzt aufgenommenen Snapshots (DOM,
+                Elementdaten, HAR), die unter output_dir/snapshots erhalten
+                bleiben; bei 0 liegen sie in einem temporären Verzeichnis,
+                das nach den Analyzern gelöscht wird
+            html_parser: Parser-Backend des HTMLAnalyzers ('auto', 'lxml',
+                'html5lib', 'html.parser')
+            analyzers: Registry-Namen der auszuführenden Analyzer (siehe
+                analyzer_registry.ANALYZERS); ohne Angabe alle. Analyzer mit
+                fehlenden Abhängigkeiten werden mit Warnung übersprungen
         """
         # Logging Setup
         self.logger = get_logger('WCAGIntegration', log_dir='output/logs')
@@ -38,13 +86,78 @@ class WCAGIntegrationManager:
         # Ausgabeverzeichnis erstellen
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Komponenten initialisieren
-        self.wcag_agent = WCAGMappingAgent()
+        self.conformance = as_profile(conformance)
+        resources = self.conformance.resource_profile()
+        if resources.name != self.conformance.resources:
+            self.logger.info(
+                f"Resource profile '{self.conformance.resources}' raised to '{resources.name}' "
+                f"for selected rules that need real assets"
+            )
+
+        # Browser werden über alle Analysen hinweg wiederverwendet; Lighthouse
+        # verbindet sich über ihren DevTools-Port
+        self._owns_browser_pool = browser_pool is None
+        self.browser_pool = browser_pool or BrowserPool(logger=self.logger, remote_debugging=True)
+
+        # Eine HTTP-Session je Manager; unveränderte Seiten kommen als 304
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or HTTPClient(
+            store=ValidatorStore(str(self.output_dir / "http_validators")),
+            logger=self.logger
+        )
+
+        # pa11y läuft in einem Prozess mit geteiltem Browser statt je URL
+        self._owns_pa11y_worker = pa11y_worker is None
+        self.pa11y_worker = pa11y_worker or Pa11yWorker(logger=self.logger)
+
+        # Analyzer laufen nebenläufig, begrenzt durch Zeitlimit und Semaphore
+        self.analyzer_timeout = analyzer_timeout
+        self._analyzer_slots = asyncio.Semaphore(max_concurrent_analyzers)
+        self.use_snapshot = use_snapshot
+        self.keep_snapshots = keep_snapshots
+        self._active_snapshot_dirs: Set[Path] = set()
+        self.html_parser = html_parser
+
+        # Analyzer-Module werden erst beim ersten Lauf importiert; übersprungene
+        # Analyzer erscheinen auch im Ergebnis, damit Lücken sichtbar bleiben
+        self.analyzer_names, self.skipped_analyzers = resolve_analyzers(analyzers)
+        for name, absent in self.skipped_analyzers.items():
+            self.logger.warning(f"Skipping analyzer '{name}': missing {', '.join(absent)}")
+
+        # Gespeicherte Gesamtanalysen gelten nur für dieselbe Regel- und
+        # Analyzerauswahl
+        selection = json.dumps([repr(self.conformance), self.analyzer_names])
+        self._analysis_scope = hashlib.sha1(selection.encode('utf-8')).hexdigest()[:12]
+
+        # Komponenten initialisieren; der Mapping-Agent lädt CrewAI und
+        # entsteht erst bei der ersten Ergebnisverarbeitung
+        self._wcag_agent: Optional["WCAGMappingAgent"] = None
         self.result_processor = UnifiedResultProcessor(logger=self.logger)
         
         self.logger.info("WCAG Integration Manager initialized")
 
+    @property
+    def wcag_agent(self) -> "WCAGMappingAgent":
+        if self._wcag_agent is None:
+            from .wcag_mapping_agent import WCAGMappingAgent
+            self._wcag_agent = WCAGMappingAgent()
+        return self._wcag_agent
+
+    async def __aenter__(self) -> "WCAGIntegrationManager":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Gibt Browserpool, HTTP-Session und pa11y-Worker frei, soweit eigene"""
+        if self._owns_browser_pool:
+            await self.browser_pool.close()
+        if self._owns_http_client:
+            await self.http_client.close()
+        if self._owns_pa11y_worker:
+            await self.pa11y_worker.close()
+
     async def analyze_url(self, url: str) -> Dict[str, Any]:
         """
         Führt eine vollständige WCAG-Analyse für eine URL durch
@@ -57,28 +170,48 @@ class WCAGIntegrationManager:
         """
         try:
             self.logger.info(f"Starting analysis for URL: {url}")
-            
-            # Browser für JavaScript-basierte Tests initialisieren
-            browser = await self._setup_browser()
-            try:
-                # Analyzer initialisieren
+
+            # Unveränderte Seiten (304) übernehmen die gespeicherte Analyse,
+            # ohne gerendert und erneut geprüft zu werden
+            stored, validators = await self._revalidate(url)
+            if stored is not None:
+                self.logger.info(f"{url} not modified, reusing stored analysis")
+                return {
+                    **stored,
+                    "not_modified": True,
+                    "timestamp": datetime.now(timezone.utc).isoformat()
+                }
+
+            with self._snapshot_workspace() as snapshot_dir:
+                # Seite einmal rendern; die Analyzer teilen sich den Snapshot
+                snapshot = await self._capture_snapshot(url, snapshot_dir)
+
+                # Analyzer initialisieren; browserbasierte Tests leihen sich
+                # ihre Seiten aus dem gemeinsamen Browserpool
+                shared = {
+                    "conformance": self.conformance,
+                    "browser_pool": self.browser_pool,
+                    "snapshot": snapshot,
+                    "http_client": self.http_client
+                }
+                extra = {
+                    "html": {"parser": self.html_parser},
+                    "pa11y": {"pa11y_worker": self.pa11y_worker}
+                }
                 analyzers = {
-                    "html": HTMLAnalyzer(self.output_dir, self.logger),
-                    "pa11y": Pa11yAnalyzer(self.output_dir, self.logger),
-                    "axe": AxeAnalyzer(self.output_dir, self.logger, browser),
-                    "lighthouse": LighthouseAnalyzer(self.output_dir, self.logger, browser)
+                    name: load_analyzer(name)(self.output_dir, self.logger, **shared, **extra.get(name, {}))
+                    for name in self.analyzer_names
                 }
 
                 # Alle Tests ausführen
                 raw_results = await self._run_all_analyzers(analyzers, url)
-                
-                # Ergebnisse normalisieren und WCAG-Mapping durchführen
-                processed_results = await self.process_results(raw_results, url)
-                
-                return processed_results
-                
-            finally:
-                await self._cleanup_browser(browser)
+            
+            # Ergebnisse normalisieren und WCAG-Mapping durchführen
+            processed_results = await self.process_results(raw_results, url)
+            if validators is not None and not processed_results.get("error"):
+                self.http_client.remember(url, validators, processed_results, key=self._analysis_key(url))
+
+            return processed_results
                 
         except Exception as e:
             error_msg = f"Error analyzing URL {url}: {str(e)}"
@@ -89,11 +222,106 @@ class WCAGIntegrationManager:
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
 
+    def _analysis_key(self, url: str) -> str:
+        """Ablageschlüssel der Gesamtanalyse, getrennt von dem des HTMLAnalyzers"""
+        return f"analysis:{self._analysis_scope}:{url}"
+
+    async def _revalidate(self, url: str) -> Tuple[Optional[Dict[str, Any]], Optional[Mapping[str, str]]]:
+        """
+        Fragt die Seite vor dem Rendern bedingt per HEAD ab
+
+        Der Snapshot lädt die Seite im Browser; ohne diese Vorabfrage käme
+        der bedingte Abruf des HTMLAnalyzers nur zum Zug, wenn die Aufnahme
+        fehlschlägt. HEAD überträgt keinen Body, die Verbindung bleibt im
+        Pool. Fehlt zu einer 304-Antwort die gespeicherte Analyse, wird
+        einmal unbedingt nachgefragt, damit die Validatoren erneuert werden.
+
+        Returns:
+            (gespeicherte Analyse bei 304 sonst None,
+             Antwort-Header für remember() bei 200 sonst None)
+        """
+        if self.http_client.store is None:
+            return None, None
+        key = self._analysis_key(url)
+        try:
+            status, headers = await self.http_client.head(url, key=key)
+            if status == 304:
+                stored = self.http_client.cached_result(url, key=key)
+                if stored is not None:
+                    return stored, None
+                status, headers = await self.http_client.head(url, conditional=False, key=key)
+        except Exception as e:
+            self.logger.warning(f"Could not revalidate {url}, analyzing it anyway: {str(e)}")
+            return None, None
+        return None, headers if status == 200 else None
+
+    @contextmanager
+    def _snapshot_workspace(self) -> Iterator[Path]:
+        """
+        Eigenes Verzeichnis für den Snapshot einer Analyse
+
+        Ohne keep_snapshots ist es temporär und wird danach gelöscht.
+        Sonst liegt es unter output_dir/snapshots, und nur die neuesten
+        keep_snapshots Verzeichnisse laufender oder beendeter Analysen
+        bleiben erhalten.
+        """
+        if self.keep_snapshots <= 0:
+            with tempfile.TemporaryDirectory(prefix="a11y-snapshot-") as workspace:
+                yield Path(workspace)
+            return
+
+        root = self.output_dir / "snapshots"
+        root.mkdir(parents=True, exist_ok=True)
+        workspace = Path(tempfile.mkdtemp(prefix=datetime.now().strftime("%Y%m%d_%H%M%S_"), dir=root))
+        self._active_snapshot_dirs.add(workspace)
+        try:
+            yield workspace
+        finally:
+            self._active_snapshot_dirs.discard(workspace)
+            self._prune_snapshots(root)
+
+    def _prune_snapshots(self, root: Path) -> None:
+        """Löscht die ältesten Snapshot-Verzeichnisse über keep_snapshots hinaus"""
+        finished = sorted(
+            (path for path in root.iterdir() if path.is_dir() and path not in self._active_snapshot_dirs),
+            key=lambda path: (path.stat().st_mtime, path.name)
+        )
+        keep = max(self.keep_snapshots - len(self._active_snapshot_dirs), 0)
+        for path in finished[:max(len(finished) - keep, 0)]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    async def _capture_snapshot(self, url: str, snapshot_dir: Path) -> Optional[PageSnapshot]:
+        """
+        Rendert die Seite einmal im Browserpool
+
+        Schlägt die Aufnahme fehl, laden die Analyzer die Seite wie bisher
+        selbst (None).
+        """
+        if not self.use_snapshot:
+            return None
+        try:
+            snapshot = await PageSnapshot.capture(
+                self.browser_pool, url, snapshot_dir,
+                resources=self.conformance.resource_profile()
+            )
+            self.logger.info(
+                f"Captured snapshot of {snapshot.final_url} ({snapshot.total_elements} elements)"
+            )
+            return snapshot
+        except Exception as e:
+            self.logger.warning(f"Could not capture page snapshot, analyzers load {url} themselves: {str(e)}")
+            return None
+
     async def _run_all_analyzers(self, 
-                                analyzers: Dict[str, Union[HTMLAnalyzer, Pa11yAnalyzer, AxeAnalyzer, LighthouseAnalyzer]], 
+                                analyzers: Dict[str, "BaseAnalyzer"], 
                                 url: str) -> List[Dict[str, Any]]:
         """
-        Führt alle Analyzer für eine URL aus
+        Führt alle Analyzer für eine URL nebenläufig aus
+
+        Jeder Analyzer läuft unter der gemeinsamen Semaphore und wird nach
+        analyzer_timeout abgebrochen. Ergebnisse der fertigen Analyzer
+        werden in der Reihenfolge von analyzers zurückgegeben, auch wenn
+        andere fehlschlagen oder abgebrochen werden.
         
         Args:
             analyzers: Dictionary mit Analyzer-Instanzen
@@ -102,22 +330,36 @@ class WCAGIntegrationManager:
         Returns:
             Kombinierte Testergebnisse
         """
+        outcomes = await asyncio.gather(*(
+            self._run_analyzer(name, analyzer, url)
+            for name, analyzer in analyzers.items()
+        ))
+
         results = []
-        for name, analyzer in analyzers.items():
+        for normalized in outcomes:
+            results.extend(normalized)
+        return results
+
+    async def _run_analyzer(self, name: str, analyzer, url: str) -> List[Dict[str, Any]]:
+        """Führt einen Analyzer mit Zeitlimit aus; Fehler ergeben keine Ergebnisse"""
+        async with self._analyzer_slots:
+            started = asyncio.get_running_loop().time()
             try:
                 self.logger.info(f"Running {name} analyzer...")
-                result = await analyzer.analyze(url)
-                
-                if not result.get("error"):
-                    results.extend(self._normalize_analyzer_results(result, name))
-                    self.logger.info(f"{name} analysis completed successfully")
-                else:
-                    self.logger.warning(f"{name} analysis failed: {result.get('error')}")
-                    
+                result = await asyncio.wait_for(analyzer.analyze(url), timeout=self.analyzer_timeout)
+            except asyncio.TimeoutError:
+                self.logger.warning(f"{name} analysis cancelled after {self.analyzer_timeout}s")
+                return []
             except Exception as e:
                 self.logger.error(f"Error running {name} analyzer: {str(e)}")
-                
-        return results
+                return []
+
+            elapsed = asyncio.get_running_loop().time() - started
+            if result.get("error"):
+                self.logger.warning(f"{name} analysis failed: {result.get('error')}")
+                return []
+            self.logger.info(f"{name} analysis completed successfully in {elapsed:.1f}s")
+            return self._normalize_analyzer_results(result, name)
 
     def _normalize_analyzer_results(self, 
                                   result: Dict[str, Any], 
@@ -196,7 +438,8 @@ class WCAGIntegrationManager:
                     for issue in self.result_processor.issues
                 ],
                 "summary": self.result_processor.get_summary(),
-                "remediation_guidance": await self._generate_remediation_guidance()
+                "remediation_guidance": await self._generate_remediation_guidance(),
+                "skipped_analyzers": self.skipped_analyzers
             }
             
             # Speichere die Ergebnisse
@@ -307,29 +550,3 @@ class WCAGIntegrationManager:
         except Exception as e:
             self.logger.error(f"Error saving results: {str(e)}")
             raise
-
-    async def _setup_browser(self):
-        """Initialisiert den Browser für JavaScript-basierte Tests"""
-        try:
-            from playwright.async_api import async_playwright
-            playwright = await async_playwright().start()
-            browser = await playwright.chromium.launch(
-                args=['--no-sandbox', '--disable-setuid-sandbox']
-            )
-            return browser
-        except Exception as e:
-            self.logger.error(f"Error setting up browser: {str(e)}")
-            raise
-
-    async def _cleanup_browser(self, browser) -> None:
-        """
-        Bereinigt Browser-Ressourcen
-        
-        Args:
-            browser: Zu bereinigender Browser
-        """
-        try:
-            await browser.close()
-            await browser.playwright.stop()
-        except Exception as e:
-            self.logger.error(f"Error cleaning up browser: {str(e)}")
\ No newline at end of file
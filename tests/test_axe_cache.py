@@ -0,0 +1,35 @@
+# tests/test_axe_cache.py
+
+import os
+
+from a11y.tools.axe_cache import AxeResultCache
+
+
+def _result(tmp_path, name, size):
+    path = tmp_path / name
+    path.write_text("x" * size)
+    return str(path)
+
+
+def test_store_and_restore(tmp_path):
+    cache = AxeResultCache(str(tmp_path / "cache"))
+    cache.store("abc", _result(tmp_path, "fresh.ndjson", 10))
+
+    restored = tmp_path / "restored.ndjson"
+    assert cache.restore("abc", str(restored))
+    assert restored.read_text() == "x" * 10
+    assert not cache.restore("missing", str(tmp_path / "other.ndjson"))
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = AxeResultCache(str(tmp_path / "cache"))
+    for i, key in enumerate(["old", "used", "new"]):
+        cache.store(key, _result(tmp_path, f"{key}.ndjson", 100))
+        os.utime(cache.path_for(key), (1000 + i, 1000 + i))
+
+    # A hit refreshes the entry, so "old" is the one to go
+    cache.restore("old", str(tmp_path / "hit.ndjson"))
+    assert cache.evict(max_bytes=250) == 1
+    assert cache.path_for("old").exists()
+    assert not cache.path_for("used").exists()
+    assert cache.path_for("new").exists()
@@ -0,0 +1,49 @@
+# tests/test_axe_digest.py
+
+from a11y.tools.axe_digest import build_digest, count_tokens
+from a11y.tools.axe_results import AxeResultSummary
+
+
+def _violation(rule_id, impact, nodes):
+    return {
+        "record": "rule", "group": "violations", "id": rule_id, "impact": impact,
+        "help": f"Help for {rule_id}", "tags": ["wcag2a"], "nodes": nodes
+    }
+
+
+def _node(i, reason="Fix any of the following:\n  Element has no alt text"):
+    return {"target": [f"img:nth-child({i})"], "html": f"<img src='{i}.png'>", "failureSummary": reason}
+
+
+def test_samples_prefer_distinct_failure_reasons():
+    summary = AxeResultSummary(sample_size=2)
+    nodes = [_node(1), _node(2), _node(3, "Fix all of the following:\n  Element is hidden")]
+    summary.add(_violation("image-alt", "critical", nodes))
+
+    samples = summary.violations[0]["samples"]
+    assert [s["target"] for s in samples] == ["img:nth-child(1)", "img:nth-child(3)"]
+    assert samples[1]["failure"] == "Element is hidden"
+
+
+def test_digest_ranks_by_impact_and_respects_budget():
+    summary = AxeResultSummary()
+    summary.add(_violation("region", "moderate", [_node(1)]))
+    for i in range(200):
+        summary.add(_violation(f"rule-{i}", "serious", [_node(n) for n in range(50)]))
+    summary.add(_violation("image-alt", "critical", [_node(1)]))
+
+    digest = build_digest(summary, "output/tool_results/axe_results.ndjson", token_budget=800)
+
+    assert count_tokens(digest) <= 800
+    assert digest.index("image-alt") < digest.index("rule-0")
+    assert "more violated rules not shown" in digest
+    assert digest.endswith("Detailed results saved to: output/tool_results/axe_results.ndjson")
+
+
+def test_small_results_are_shown_completely():
+    summary = AxeResultSummary()
+    summary.add(_violation("image-alt", "critical", [_node(1), _node(2)]))
+
+    digest = build_digest(summary, "results.ndjson")
+    assert "img:nth-child(1)" in digest
+    assert "not shown" not in digest
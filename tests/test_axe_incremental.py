@@ -0,0 +1,73 @@
+# tests/test_axe_incremental.py
+
+import json
+
+import pytest
+
+from a11y.tools.axe_incremental import AxeSegmentStore, merge_incremental
+from a11y.tools.axe_results import load_axe_results
+
+
+def _write(path, rules, meta=None):
+    lines = [{"record": "meta", "meta": meta or {"url": "https://example.com"}}]
+    lines += [{"record": "rule", "group": group, **rule} for group, rule in rules]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+    return str(path)
+
+
+def _node(target, segment, impact=None):
+    return {"target": [target], "segment": segment, "impact": impact}
+
+
+@pytest.fixture
+def previous(tmp_path):
+    return _write(tmp_path / "previous.ndjson", [
+        ("violations", {"id": "image-alt", "impact": "critical",
+                        "nodes": [_node("#a img", "div#a@1", "critical"), _node("#b img", "div#b@1", "critical")]}),
+        ("passes", {"id": "image-alt", "nodes": [_node("#c img", "div#c@1")]}),
+        ("violations", {"id": "region", "impact": "moderate", "nodes": [_node("#b p", "div#b@1", "moderate")]}),
+        ("passes", {"id": "link-name", "nodes": [_node("#b a", "div#b@1")]}),
+    ])
+
+
+def test_merge_replaces_nodes_of_changed_segments(tmp_path, previous):
+    # Segment div#b@1 changed: its image got fixed and its link now fails
+    partial = _write(tmp_path / "partial.ndjson", [
+        ("passes", {"id": "image-alt", "nodes": [_node("#b img", "div#b@1")]}),
+        ("violations", {"id": "link-name", "impact": "serious", "nodes": [_node("#b a", "div#b@1", "serious")]}),
+        ("passes", {"id": "region", "nodes": [_node("body", None)]}),
+    ], meta={"url": "https://example.com", "timestamp": "later"})
+
+    counts = merge_incremental(previous, partial, partial, stale_segments=["div#b@1"], page_rules=["region"])
+    results = load_axe_results(partial)
+
+    violations = {rule["id"]: rule for rule in results["violations"]}
+    assert [n["target"] for n in violations["image-alt"]["nodes"]] == [["#a img"]]
+    assert violations["link-name"]["impact"] == "serious"
+    assert "region" not in violations
+    passes = {rule["id"]: rule for rule in results["passes"]}
+    assert len(passes["image-alt"]["nodes"]) == 2
+    assert "link-name" not in passes
+    assert results["timestamp"] == "later"
+    assert counts == {"violations": 2, "passes": 2, "incomplete": 0, "inapplicable": 0}
+
+
+def test_rule_without_remaining_nodes_becomes_inapplicable(tmp_path, previous):
+    partial = _write(tmp_path / "partial.ndjson", [("inapplicable", {"id": "link-name", "nodes": []})])
+
+    merge_incremental(previous, partial, partial, stale_segments=["div#b@1"], page_rules=[])
+    results = load_axe_results(partial)
+
+    assert sorted(rule["id"] for rule in results["inapplicable"]) == ["link-name", "region"]
+
+
+def test_store_round_trip(tmp_path, previous):
+    store = AxeSegmentStore(str(tmp_path / "state"))
+    job = {"url": "https://example.com", "tags": ["wcag2a"]}
+    assert store.job_payload(job)["previous"] is None
+
+    snapshot = {"segments": {"div#a@1": "1", "div#b@1": "2"}, "shell": "s", "axe_version": "4.10.0"}
+    store.finish(job, {"incremental": {"mode": "full", **snapshot}}, previous)
+
+    assert store.job_payload(job)["previous"] == snapshot
+    assert store.job_payload({**job, "tags": ["wcag2aa"]})["previous"] is None
@@ -0,0 +1,39 @@
+# tests/test_axe_profile.py
+
+import json
+
+from a11y.tools.axe_profile import AxeProfileStore
+
+
+def _profile(navigation, rules):
+    return {
+        "phases": {"navigation_ms": navigation, "injection_ms": 20.0, "analysis_ms": sum(rules.values())},
+        "rules": rules
+    }
+
+
+def test_record_writes_run_profile_and_host_aggregate(tmp_path):
+    store = AxeProfileStore(str(tmp_path))
+    results_path = str(tmp_path / "axe_results_1.ndjson")
+
+    profile_path = store.record("https://example.com/a", results_path, _profile(100.0, {"region": 10.0}))
+    store.record("https://example.com/b", str(tmp_path / "axe_results_2.ndjson"), _profile(300.0, {"region": 30.0}))
+
+    with open(profile_path) as f:
+        assert json.load(f)["rules"] == {"region": 10.0}
+
+    aggregate = store.load_aggregate("example.com")
+    assert aggregate["runs"] == 2
+    assert aggregate["phases"]["navigation_ms"]["mean_ms"] == 200.0
+    assert aggregate["rules"]["region"] == {"runs": 2, "total_ms": 40.0, "max_ms": 30.0, "mean_ms": 20.0}
+
+
+def test_slow_rules_sorted_by_mean(tmp_path):
+    store = AxeProfileStore(str(tmp_path))
+    rules = {"color-contrast": 900.0, "region": 300.0, "image-alt": 5.0}
+    store.record("https://example.com/", str(tmp_path / "r.ndjson"), _profile(50.0, rules))
+
+    slow = store.slow_rules("example.com", min_mean_ms=250.0)
+    assert [entry["rule"] for entry in slow] == ["color-contrast", "region"]
+    assert store.slow_rules("example.com", limit=1)[0]["rule"] == "color-contrast"
+    assert store.slow_rules("other.org") == []
@@ -0,0 +1,46 @@
+# tests/test_axe_results.py
+
+import json
+
+import pytest
+
+from a11y.tools.axe_results import AxeResultSummary, iter_axe_results, load_axe_results
+
+
+@pytest.fixture
+def results_file(tmp_path):
+    """NDJSON file as written by the axe worker"""
+    records = [
+        {"record": "meta", "meta": {"url": "https://example.com", "testEngine": {"version": "4.10.0"}}},
+        {"record": "rule", "group": "violations", "id": "image-alt", "impact": "critical",
+         "help": "Images must have alternate text", "tags": ["wcag2a", "wcag111"],
+         "nodes": [{"target": ["img"]}, {"target": ["#logo"]}]},
+        {"record": "rule", "group": "passes", "id": "html-has-lang", "nodes": [{"target": ["html"]}]},
+        {"record": "rule", "group": "inapplicable", "id": "video-caption", "nodes": []},
+    ]
+    path = tmp_path / "axe_results.ndjson"
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+    return str(path)
+
+
+def test_iter_axe_results_streams_records(results_file):
+    records = list(iter_axe_results(results_file))
+    assert records[0]["record"] == "meta"
+    assert [r["id"] for r in records[1:]] == ["image-alt", "html-has-lang", "video-caption"]
+
+
+def test_summary_counts_and_violations(results_file):
+    summary = AxeResultSummary.from_file(results_file)
+    assert summary.url == "https://example.com"
+    assert summary.counts == {"violations": 1, "passes": 1, "incomplete": 0, "inapplicable": 1}
+    assert summary.violations[0]["id"] == "image-alt"
+    assert summary.violations[0]["node_count"] == 2
+    assert "nodes" not in summary.violations[0]
+
+
+def test_load_axe_results_rebuilds_classic_format(results_file):
+    results = load_axe_results(results_file)
+    assert results["url"] == "https://example.com"
+    assert results["violations"][0]["id"] == "image-alt"
+    assert "group" not in results["violations"][0]
+    assert results["incomplete"] == []
@@ -0,0 +1,60 @@
+# tests/test_axe_worker.py
+
+import asyncio
+import json
+import os
+import sys
+import textwrap
+
+import pytest
+
+from a11y.tools.axe_worker import AxeWorker
+
+# Records every job and writes an empty result file for scans
+FAKE_WORKER = textwrap.dedent("""
+    import json, os, sys
+    log = open(os.environ["JOBS_LOG"], "a")
+    print(json.dumps({"event": "ready", "pid": 0}), flush=True)
+    for line in sys.stdin:
+        job = json.loads(line)
+        log.write(line)
+        log.flush()
+        if job["cmd"] == "scan":
+            open(job["output"], "w").close()
+        print(json.dumps({"id": job["id"], "ok": True, "counts": {}}), flush=True)
+""")
+
+
+class FakeToolchain:
+    def __init__(self, project_dir):
+        self.project_dir = project_dir
+
+    def ensure(self):
+        pass
+
+    def node_env(self):
+        return {**os.environ, "JOBS_LOG": str(self.project_dir / "jobs.ndjson")}
+
+
+@pytest.mark.asyncio
+async def test_batches_carry_their_own_concurrency(tmp_path):
+    script = tmp_path / "worker.py"
+    script.write_text(FAKE_WORKER)
+    worker = AxeWorker(script_path=script, node_binary=sys.executable, toolchain=FakeToolchain(tmp_path))
+
+    def targets(prefix):
+        return {f"https://{prefix}{i}.example": str(tmp_path / f"{prefix}{i}.ndjson") for i in range(3)}
+
+    try:
+        await asyncio.gather(
+            worker.ascan_batch(targets("a"), concurrency=1),
+            worker.ascan_batch(targets("b"), concurrency=6),
+        )
+    finally:
+        await worker.aclose()
+
+    jobs = [json.loads(line) for line in (tmp_path / "jobs.ndjson").read_text().splitlines()]
+    assert not [job for job in jobs if job["cmd"] == "configure"]
+    batches = {job["url"][8]: job["batch"] for job in jobs if job["cmd"] == "scan"}
+    assert batches["a"]["concurrency"] == 1 and batches["b"]["concurrency"] == 6
+    assert batches["a"]["id"] != batches["b"]["id"]
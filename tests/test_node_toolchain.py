@@ -0,0 +1,87 @@
+# tests/test_node_toolchain.py
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from a11y.tools.node_toolchain import NodeToolchain, TOOLCHAIN_PACKAGES, FINGERPRINT_FILE
+
+
+def _fake_npm_install(project_dir: Path, version: str = "1.0.0"):
+    """Simulates npm by creating package folders and executables"""
+    def run(cmd, **kwargs):
+        if cmd[0] == 'npm':
+            for name, bin_name in TOOLCHAIN_PACKAGES.items():
+                package_dir = project_dir / "node_modules" / name
+                package_dir.mkdir(parents=True, exist_ok=True)
+                (package_dir / "package.json").write_text(json.dumps({"version": version}))
+                if bin_name:
+                    bin_dir = project_dir / "node_modules" / ".bin"
+                    bin_dir.mkdir(parents=True, exist_ok=True)
+                    (bin_dir / bin_name).write_text("")
+        return subprocess.CompletedProcess(cmd, 0, stdout="v20.0.0\n", stderr=b"")
+    return run
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    (tmp_path / "package.json").write_text(json.dumps({
+        "dependencies": {"axe-core": "^4.8.4", "puppeteer": "^22.15.0", "pa11y": "^8.0.0"}
+    }))
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.nodejs.dependencies]\n"puppeteer" = "latest"\n"lighthouse" = "^12.0.0"\n'
+    )
+    return tmp_path
+
+
+def test_pinned_versions_prefers_package_json(project_dir):
+    pins = NodeToolchain(project_dir).pinned_versions()
+    assert pins["puppeteer"] == "^22.15.0"
+    assert pins["lighthouse"] == "^12.0.0"
+    assert pins["@axe-core/puppeteer"] == "latest"
+
+
+def test_ensure_installs_once_and_records_fingerprint(project_dir):
+    with patch('subprocess.run', side_effect=_fake_npm_install(project_dir)) as mock_run:
+        fingerprint = NodeToolchain(project_dir).ensure()
+        npm_calls = [c for c in mock_run.call_args_list if c.args[0][0] == 'npm']
+        assert len(npm_calls) == 1
+
+    assert (project_dir / "node_modules" / FINGERPRINT_FILE).exists()
+    assert fingerprint["packages"]["axe-core"]["version"] == "1.0.0"
+    assert fingerprint["bins"]["pa11y"].endswith("pa11y")
+
+    # A fresh process finds the fingerprint and skips npm entirely
+    with patch('subprocess.run') as mock_run:
+        NodeToolchain(project_dir).ensure()
+        mock_run.assert_not_called()
+
+
+def test_changed_pin_triggers_reinstall(project_dir):
+    with patch('subprocess.run', side_effect=_fake_npm_install(project_dir)):
+        NodeToolchain(project_dir).ensure()
+
+    package_json = json.loads((project_dir / "package.json").read_text())
+    package_json["dependencies"]["axe-core"] = "^4.10.0"
+    (project_dir / "package.json").write_text(json.dumps(package_json))
+
+    with patch('subprocess.run', side_effect=_fake_npm_install(project_dir, "2.0.0")) as mock_run:
+        fingerprint = NodeToolchain(project_dir).ensure()
+        assert any(c.args[0][0] == 'npm' for c in mock_run.call_args_list)
+    assert fingerprint["pins"]["axe-core"] == "^4.10.0"
+    assert fingerprint["packages"]["axe-core"]["version"] == "2.0.0"
+
+
+def test_installed_never_runs_npm(project_dir):
+    with patch('subprocess.run') as mock_run:
+        assert NodeToolchain(project_dir).installed() is None
+        mock_run.assert_not_called()
+
+    with patch('subprocess.run', side_effect=_fake_npm_install(project_dir)):
+        NodeToolchain(project_dir).ensure()
+    with patch('subprocess.run') as mock_run:
+        assert NodeToolchain(project_dir).installed()["packages"]["axe-core"]["version"] == "1.0.0"
+        mock_run.assert_not_called()
@@ -0,0 +1,68 @@
+# tests/test_node_worker.py
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+from a11y.errors.exceptions import ToolExecutionError
+from a11y.tools.node_worker import NodeWorkerClient
+
+# Answers "echo" jobs, fails everything else
+FAKE_WORKER = textwrap.dedent("""
+    import json, sys
+    print(json.dumps({"event": "ready", "pid": 0}), flush=True)
+    for line in sys.stdin:
+        job = json.loads(line)
+        if job["cmd"] == "echo":
+            print(json.dumps({"id": job["id"], "ok": True, "value": job["value"]}), flush=True)
+        else:
+            print(json.dumps({"id": job["id"], "ok": False, "error": "Unknown command"}), flush=True)
+""")
+
+
+class FakeToolchain:
+    def __init__(self, project_dir):
+        self.project_dir = project_dir
+
+    def ensure(self):
+        pass
+
+    def node_env(self):
+        return dict(os.environ)
+
+
+class EchoWorkerError(ToolExecutionError):
+    pass
+
+
+class EchoWorker(NodeWorkerClient):
+    name = "Echo worker"
+    error_class = EchoWorkerError
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.setups = []
+
+    async def _on_started(self):
+        self.setups.append((await self._request({"cmd": "echo", "value": "setup"}))["value"])
+
+
+@pytest.mark.asyncio
+async def test_subclass_gets_its_errors_and_one_setup_per_start(tmp_path):
+    script = tmp_path / "worker.py"
+    script.write_text(FAKE_WORKER)
+    worker = EchoWorker(script, node_binary=sys.executable, toolchain=FakeToolchain(tmp_path))
+    try:
+        assert (await worker._request({"cmd": "echo", "value": 1}))["value"] == 1
+        with pytest.raises(EchoWorkerError, match="Unknown command"):
+            await worker._request({"cmd": "other"})
+        await worker._request({"cmd": "echo", "value": 2})
+    finally:
+        await worker._close()
+
+    assert worker.setups == ["setup"]
+    assert not worker.is_running
+    with pytest.raises(EchoWorkerError, match="Echo worker is not running"):
+        await worker._send({"cmd": "echo"})
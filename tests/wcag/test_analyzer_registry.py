@@ -0,0 +1,79 @@
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from a11y.wcag.analyzer_registry import ANALYZERS, AnalyzerSpec, ToolchainState, load_analyzer, resolve_analyzers
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+HEAVY = ("crewai", "crewai_tools", "selenium", "bs4", "aiohttp", "playwright")
+
+
+def test_light_entry_points_skip_heavy_imports():
+    script = (
+        "import sys\n"
+        "import a11y, a11y.wcag, a11y.wcag.wcag_analyzers\n"
+        "from a11y.wcag.unified_result_processor import UnifiedResultProcessor\n"
+        f"print(','.join(name for name in {HEAVY!r} if name in sys.modules))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    loaded = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True
+    ).stdout.strip()
+    assert loaded == ""
+
+
+def test_load_analyzer_imports_on_first_use():
+    pytest.importorskip("bs4")
+    from a11y.wcag import wcag_analyzers
+
+    html_analyzer = load_analyzer("html")
+    assert html_analyzer.__name__ == "HTMLAnalyzer"
+    assert wcag_analyzers.HTMLAnalyzer is html_analyzer
+    assert set(wcag_analyzers.__all__) == {"BaseAnalyzer", *(spec.class_name for spec in ANALYZERS.values())}
+
+    with pytest.raises(ValueError, match="Unknown analyzer"):
+        load_analyzer("wave")
+
+
+def test_resolve_analyzers_reports_missing_dependencies(monkeypatch):
+    monkeypatch.setitem(ANALYZERS, "fake", AnalyzerSpec(
+        "fake", "html_analyzer", "HTMLAnalyzer",
+        python_modules=("json", "no_such_module"), executables=("no-such-binary",),
+    ))
+
+    available, missing = resolve_analyzers(["fake"])
+    assert available == []
+    assert missing == {"fake": ["no_such_module", "no-such-binary"]}
+    assert set(resolve_analyzers()[0]) | set(resolve_analyzers()[1]) == set(ANALYZERS)
+
+
+def test_node_packages_are_checked_without_installing():
+    spec = AnalyzerSpec("fake", "axe_analyzer", "AxeAnalyzer", node_packages=("axe-core",))
+    assert spec.missing_dependencies(ToolchainState({"packages": {"axe-core": {}}, "bins": {}})) == []
+    # Not installed yet: ensure() installs it on first use, if npm is there
+    assert spec.missing_dependencies(ToolchainState(None, can_install=True)) == []
+    assert spec.missing_dependencies(ToolchainState(None, can_install=False)) == ["axe-core"]
+    assert ANALYZERS["axe"].node_packages == ("axe-core",) and not ANALYZERS["axe"].executables
+
+
+def test_executables_come_from_the_toolchain_before_path():
+    spec = AnalyzerSpec("fake", "lighthouse_analyzer", "LighthouseAnalyzer", executables=("lighthouse",))
+    installed = ToolchainState({"packages": {}, "bins": {"lighthouse": "/t/node_modules/.bin/lighthouse"}})
+    assert spec.missing_dependencies(installed) == []
+    assert spec.missing_dependencies(ToolchainState(None, can_install=True)) == []
+    # Neither in the toolchain nor installable: only PATH is left
+    assert spec.missing_dependencies(ToolchainState({"packages": {}, "bins": {}})) == (
+        [] if shutil.which("lighthouse") else ["lighthouse"]
+    )
+
+
+def test_worker_and_pool_dependencies_are_declared():
+    # The pa11y worker require()s both packages, Lighthouse attaches to the Playwright pool
+    assert ANALYZERS["pa11y"].node_packages == ("pa11y", "puppeteer")
+    assert "playwright" in ANALYZERS["lighthouse"].python_modules
+    missing = ANALYZERS["pa11y"].missing_dependencies(ToolchainState({"packages": {"pa11y": {}}, "bins": {}}))
+    assert "puppeteer" in missing
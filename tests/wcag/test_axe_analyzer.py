@@ -0,0 +1,132 @@
+import json
+import logging
+import threading
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from a11y.errors.exceptions import CDPError
+from a11y.wcag.cdp_client import CDPConnection
+from a11y.wcag.conformance_profile import ConformanceProfile
+from a11y.wcag.wcag_analyzers import AxeAnalyzer
+
+AXE_SOURCE = "window.axe = {};"
+
+
+@pytest_asyncio.fixture
+async def devtools():
+    """A browser endpoint that answers the CDP calls AxeAnalyzer makes"""
+    calls = []
+
+    async def version(request):
+        return web.json_response({"webSocketDebuggerUrl": f"ws://{request.host}/devtools/browser/1"})
+
+    async def browser(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for message in ws:
+            data = json.loads(message.data)
+            method, params = data["method"], data["params"]
+            calls.append((method, params, data.get("sessionId")))
+            result = {}
+            if method == "Target.createTarget":
+                result = {"targetId": "T1"}
+            elif method == "Target.attachToTarget":
+                result = {"sessionId": "S1"}
+            elif method == "Page.navigate" and "unreachable" in params["url"]:
+                result = {"frameId": "F", "errorText": "net::ERR_NAME_NOT_RESOLVED"}
+            elif method == "Runtime.evaluate" and params["expression"].startswith("axe.run"):
+                result = {"result": {"type": "object", "value": {"violations": [{"id": "image-alt"}]}}}
+            elif method == "Runtime.evaluate" and "quiet_ms" in params["expression"]:
+                result = {"result": {"type": "object", "value": {"stable": True, "waited_ms": 312.5}}}
+            await ws.send_str(json.dumps({"id": data["id"], "result": result}))
+            if method == "Page.navigate" and "errorText" not in result:
+                await ws.send_str(json.dumps({"method": "Page.domContentEventFired", "params": {}, "sessionId": "S1"}))
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/json/version", version)
+    app.router.add_get("/devtools/browser/1", browser)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    connection = await CDPConnection.connect(site._server.sockets[0].getsockname()[1])
+    yield connection, calls
+    await connection.close()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_axe_is_injected_and_run_with_profile_tags(devtools):
+    connection, calls = devtools
+    analyzer = AxeAnalyzer(Path("."), logging.getLogger("test"), conformance=ConformanceProfile(level="A"))
+
+    results, readiness = await analyzer._run_axe_in_tab(connection, "https://example.com", AXE_SOURCE)
+
+    assert results == {"violations": [{"id": "image-alt"}]}
+    assert readiness == {"stable": True, "waited_ms": 312.5}
+    methods = [method for method, _, _ in calls]
+    assert methods == [
+        "Target.createTarget", "Target.attachToTarget", "Page.enable", "Page.navigate",
+        "Runtime.evaluate", "Runtime.evaluate", "Runtime.evaluate", "Target.closeTarget",
+    ]
+    probe, injection, run = calls[4][1], calls[5][1], calls[6][1]
+    assert probe["awaitPromise"] and "MutationObserver" in probe["expression"]
+    assert injection["expression"] == AXE_SOURCE
+    assert run["awaitPromise"] and '"values": ["wcag2a", "wcag21a", "best-practice"]' in run["expression"]
+    assert all(session == "S1" for method, _, session in calls if not method.startswith("Target."))
+
+
+@pytest.mark.asyncio
+async def test_failed_navigation_closes_the_tab(devtools):
+    connection, calls = devtools
+    analyzer = AxeAnalyzer(Path("."), logging.getLogger("test"))
+
+    with pytest.raises(CDPError, match="ERR_NAME_NOT_RESOLVED"):
+        await analyzer._run_axe_in_tab(connection, "https://unreachable.example", AXE_SOURCE)
+    assert calls[-1][0] == "Target.closeTarget"
+    assert connection.connected
+
+
+@pytest.mark.asyncio
+async def test_reduced_resource_profile_blocks_urls_before_navigation(devtools):
+    connection, calls = devtools
+    profile = ConformanceProfile(allow_rules=["image-alt"], resources="dom-only")
+    analyzer = AxeAnalyzer(Path("."), logging.getLogger("test"), conformance=profile)
+
+    await analyzer._run_axe_in_tab(connection, "https://example.com", AXE_SOURCE)
+
+    methods = [method for method, _, _ in calls]
+    assert methods.index("Network.setBlockedURLs") < methods.index("Page.navigate")
+    blocked = calls[methods.index("Network.setBlockedURLs")][1]["urls"]
+    assert "*.css" in blocked and "*.png" in blocked
+
+
+@pytest.mark.asyncio
+async def test_axe_script_is_resolved_off_the_event_loop(tmp_path, monkeypatch):
+    (tmp_path / "axe.min.js").write_text(AXE_SOURCE)
+    threads = []
+
+    class FakeToolchain:
+        def package_path(self, name):
+            # ensure() may run npm here
+            threads.append(threading.current_thread())
+            return tmp_path
+
+    class FakePool:
+        remote_debugging = True
+
+    async def run_axe(pool, url, source):
+        return {"source": source}, None
+
+    monkeypatch.setattr("a11y.wcag.axe_analyzer.get_toolchain", FakeToolchain)
+    monkeypatch.setattr(AxeAnalyzer, "_axe_sources", {})
+    analyzer = AxeAnalyzer(Path("."), logging.getLogger("test"), browser_pool=FakePool())
+    monkeypatch.setattr(analyzer, "_run_axe", run_axe)
+
+    result = await analyzer.analyze("https://example.com")
+    assert result["results"] == {"source": AXE_SOURCE}
+    assert threads and threads[0] is not threading.main_thread()
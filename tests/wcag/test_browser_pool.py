@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from a11y.errors.exceptions import BrowserPoolError
+from a11y.wcag.browser_pool import BrowserPool
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self):
+        return object()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.fail_contexts = False
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        if self.fail_contexts:
+            raise RuntimeError("Target closed")
+        return FakeContext(self)
+
+    async def close(self):
+        self.connected = False
+
+    def crash(self):
+        self.connected = False
+        self.handlers["disconnected"](self)
+
+
+class FakePool(BrowserPool):
+    def __init__(self, *args, memory_mb=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.memory_mb = memory_mb
+        self.browsers = []
+        self.fail_launches = 0
+
+    async def _launch(self, extra_args=None):
+        if self.fail_launches:
+            self.fail_launches -= 1
+            raise BrowserPoolError("Error launching browser: spawn failed")
+        browser = FakeBrowser()
+        browser.args = list(extra_args or [])
+        self.browsers.append(browser)
+        return browser
+
+    async def _browser_memory_mb(self, browser):
+        return self.memory_mb
+
+
+@pytest.mark.asyncio
+async def test_browsers_are_reused_across_checkouts():
+    async with FakePool(size=2, max_pages=100) as pool:
+        for _ in range(5):
+            async with pool.page():
+                pass
+        assert pool.launches == 2
+
+
+@pytest.mark.asyncio
+async def test_browser_recycled_after_max_pages():
+    async with FakePool(size=1, max_pages=3) as pool:
+        for _ in range(3):
+            async with pool.context() as context:
+                first = context.browser
+        assert not first.is_connected()
+        assert pool.launches == 2
+        async with pool.context() as context:
+            assert context.browser is pool.browsers[-1]
+
+
+@pytest.mark.asyncio
+async def test_browser_recycled_when_memory_grows():
+    async with FakePool(size=1, max_memory_mb=100, memory_mb=250) as pool:
+        async with pool.context():
+            pass
+        assert pool.launches == 2
+
+
+@pytest.mark.asyncio
+async def test_crashed_browser_is_restarted():
+    async with FakePool(size=1) as pool:
+        pool.browsers[0].crash()
+        async with pool.context() as context:
+            assert context.browser is pool.browsers[1]
+
+        # A browser that can no longer open contexts is replaced as well
+        pool.browsers[1].fail_contexts = True
+        async with pool.context() as context:
+            assert context.browser is pool.browsers[2]
+
+
+@pytest.mark.asyncio
+async def test_failed_relaunch_on_checkin_does_not_mask_the_callers_exception():
+    async with FakePool(size=1, max_pages=1) as pool:
+        pool.fail_launches = 1
+        with pytest.raises(ValueError, match="analyzer failed"):
+            async with pool.context():
+                raise ValueError("analyzer failed")
+
+        # The slot is relaunched lazily on the next checkout
+        async with pool.context() as context:
+            assert context.browser is pool.browsers[1]
+
+
+@pytest.mark.asyncio
+async def test_devtools_ports_are_lent_one_run_at_a_time():
+    async with FakePool(size=1, remote_debugging=True) as pool:
+        async with pool.devtools() as port:
+            assert pool.browsers[0].args == [f"--remote-debugging-port={port}"]
+            second = asyncio.ensure_future(pool.devtools().__aenter__())
+            await asyncio.sleep(0.05)
+            # Another tool waits for the port, plain contexts don't
+            assert not second.done()
+            async with pool.context():
+                pass
+        assert await second == port
+
+    async with FakePool(size=1) as pool:
+        with pytest.raises(BrowserPoolError):
+            async with pool.devtools():
+                pass
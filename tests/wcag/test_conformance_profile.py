@@ -0,0 +1,52 @@
+from a11y.wcag.conformance_profile import ConformanceProfile, as_profile
+from a11y.wcag.unified_result_processor import WCAGLevel
+
+
+def test_default_profile_matches_classic_axe_tags():
+    profile = ConformanceProfile()
+    assert sorted(profile.axe_tags()) == sorted(
+        ['wcag2a', 'wcag2aa', 'wcag21a', 'wcag21aa', 'wcag22aa', 'best-practice']
+    )
+    assert profile.to_axe() == {"runOnly": {"type": "tag", "values": profile.axe_tags()}, "rules": {}}
+    assert profile.pa11y_args() == ['--standard', 'WCAG2AA']
+    [only_audits] = profile.lighthouse_args()
+    audits = only_audits.removeprefix('--only-audits=').split(',')
+    assert {'color-contrast', 'target-size', 'heading-order'} <= set(audits)
+    assert 'identical-links-same-purpose' not in audits
+
+
+def test_level_a_without_best_practices():
+    profile = ConformanceProfile(level="a", best_practices=False)
+    assert profile.level is WCAGLevel.A
+    assert profile.axe_tags() == ['wcag2a', 'wcag21a']
+    assert profile.pa11y_args()[:2] == ['--standard', 'WCAG2A']
+    audits = profile.lighthouse_args()[0].removeprefix('--only-audits=').split(',')
+    assert 'image-alt' in audits
+    assert not {'color-contrast', 'target-size', 'heading-order'} & set(audits)
+
+
+def test_allow_and_deny_lists():
+    profile = ConformanceProfile(
+        allow_rules=['image-alt', 'color-contrast', 'region'],
+        deny_rules=['region', 'WCAG2AA.Principle1.Guideline1_4.1_4_3.G18.Fail']
+    )
+    assert profile.to_axe() == {
+        "runOnly": {"type": "rule", "values": ['image-alt', 'color-contrast']},
+        "rules": {"region": {"enabled": False}}
+    }
+    assert profile.pa11y_args() == [
+        '--standard', 'WCAG2AA', '--ignore', 'WCAG2AA.Principle1.Guideline1_4.1_4_3.G18.Fail'
+    ]
+    assert profile.lighthouse_args() == ['--only-audits=image-alt,color-contrast']
+
+
+def test_deny_only_skips_lighthouse_audits():
+    profile = as_profile({"level": "AAA", "deny_rules": ['color-contrast-enhanced']})
+    assert 'wcag2aaa' in profile.axe_tags()
+    assert profile.lighthouse_args() == ['--skip-audits=color-contrast-enhanced']
+
+
+def test_aaa_with_best_practices_keeps_the_category_filter():
+    assert ConformanceProfile(level="AAA").lighthouse_args() == []
+    denied = ConformanceProfile(level="AA", deny_rules=['color-contrast']).lighthouse_args()[0]
+    assert denied.startswith('--only-audits=') and 'color-contrast' not in denied.split('=')[1].split(',')
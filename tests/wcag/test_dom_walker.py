@@ -0,0 +1,61 @@
+import logging
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from a11y.wcag.dom_walker import walk_dom
+from a11y.wcag.wcag_analyzers import HTMLAnalyzer
+
+PAGE = """<!DOCTYPE html>
+<html lang=""><head><title>T</title><meta name="Viewport"><meta charset="utf-8"></head>
+<body>
+<header role="banner"></header>
+<h2 aria-label="x">Sub</h2><h2>Sub</h2>
+<nav aria-labelledby="n"><span id="n">Menu</span></nav>
+<form>
+  <label for="name">Name</label><input id="name" type="text">
+  <input id="mail" type="email" aria-describedby="hint">
+  <input type="password" aria-label="Password">
+  <input type="hidden" name="token">
+</form>
+</body></html>"""
+
+
+def run(html):
+    analyzer = HTMLAnalyzer(Path("."), logging.getLogger("test"))
+    stats = walk_dom(BeautifulSoup(html, "html.parser"))
+    analysis = analyzer._analyze_structure(stats)
+    return analysis, analyzer._check_for_issues(stats, analysis)
+
+
+def test_structure_counts_match_find_semantics():
+    analysis, _ = run(PAGE)
+    # soup.find('doctype') looks for an element, not the declaration
+    assert analysis["doctype"] is False
+    assert analysis["lang_attribute"] is True
+    assert analysis["head_elements"] == {"title": True, "meta_viewport": False, "meta_charset": True}
+    assert analysis["headings"] == {"h1": 0, "h2": 2, "h3": 0, "h4": 0, "h5": 0, "h6": 0}
+    assert analysis["landmarks"] == {"header": 1, "nav": 1, "main": 0, "footer": 0, "article": 0, "aside": 0}
+    assert analysis["aria"] == {
+        "role_attributes": 1, "aria_labelledby": 1, "aria_label": 2, "aria_describedby": 1
+    }
+
+
+def test_issues():
+    _, issues = run(PAGE)
+    assert [issue["type"] for issue in issues] == ["heading_hierarchy", "landmarks", "form_labels"]
+    assert issues[-1]["selector"] == "#mail"
+
+
+def test_label_index_covers_implicit_and_referenced_labels():
+    _, issues = run("""<html lang="en"><body><main><h1>Form</h1>
+    <label>Subscribe <input type="checkbox" id="wrapped"></label>
+    <label for="other">Other <input id="inside-for-label"></label>
+    <input id="other" type="search">
+    <span id="caption">Caption</span>
+    <textarea id="labelledby" aria-labelledby="missing caption"></textarea>
+    <select id="dangling" aria-labelledby="missing"></select>
+    <input id="blank" type="TEL" aria-label="  ">
+    <input type="submit" value="Send">
+    </main></body></html>""")
+    assert [issue["selector"] for issue in issues] == ["#inside-for-label", "#dangling", "#blank"]
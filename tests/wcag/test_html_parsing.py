@@ -0,0 +1,26 @@
+import pytest
+
+from a11y.wcag import html_parsing
+from a11y.wcag.html_parsing import available_parsers, parse_html, resolve_parser
+
+
+def test_auto_prefers_fast_backend(monkeypatch):
+    monkeypatch.setattr(html_parsing, "available_parsers", lambda: ["html.parser", "lxml"])
+    assert resolve_parser("auto") == "lxml"
+    monkeypatch.setattr(html_parsing, "available_parsers", lambda: ["html.parser", "html5lib"])
+    assert resolve_parser("auto") == "html.parser"
+
+
+def test_missing_backend_falls_back_to_stdlib(monkeypatch):
+    monkeypatch.setattr(html_parsing, "available_parsers", lambda: ["html.parser"])
+    assert resolve_parser("lxml") == "html.parser"
+    with pytest.raises(ValueError):
+        resolve_parser("selectolax")
+
+
+@pytest.mark.parametrize("backend", available_parsers())
+def test_backends_parse_the_same_structure(backend):
+    soup = parse_html('<html lang="de"><body><main><h1>A</h1><input id="x" type="text"></main></body></html>', backend)
+    assert soup.find("html")["lang"] == "de"
+    assert len(soup.find_all("h1")) == 1
+    assert soup.find("input")["id"] == "x"
@@ -0,0 +1,76 @@
+import logging
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from a11y.wcag.dom_walker import walk_dom
+from a11y.wcag.html_stream import CONTEXT_LIMIT, HTMLStream, stream_selector
+from a11y.wcag.selector_service import SelectorService
+from a11y.wcag.wcag_analyzers import HTMLAnalyzer
+
+from .test_dom_walker import PAGE
+
+FORM_PAGE = """<html lang="en"><body><main><h1>Form</h1>
+<label>Subscribe <input type="checkbox" id="wrapped"></label>
+<label for="other">Other <input id="inside-for-label"></label>
+<input id="other" type="search">
+<ul><li><input class="item"><li><input class="item"></ul>
+<textarea id="labelledby" aria-labelledby="missing caption"></textarea>
+<span id="caption">Caption</span>
+<input id="blank" type="TEL" aria-label="  ">
+</main></body></html>"""
+
+
+def stream(html, chunk_size=7):
+    parser = HTMLStream()
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+    return parser
+
+
+def run(html, streamed):
+    analyzer = HTMLAnalyzer(Path("."), logging.getLogger("test"))
+    if streamed:
+        return analyzer._analyze_stream(stream(html))
+    stats = walk_dom(BeautifulSoup(html, "html.parser"))
+    analysis = analyzer._analyze_structure(stats)
+    return analysis, analyzer._check_for_issues(stats, analysis)
+
+
+def test_stream_matches_tree_analysis():
+    for html in (PAGE, FORM_PAGE):
+        tree_analysis, tree_issues = run(html, streamed=False)
+        stream_analysis, stream_issues = run(html, streamed=True)
+        assert stream_analysis == tree_analysis
+        assert [issue["type"] for issue in stream_issues] == [issue["type"] for issue in tree_issues]
+
+
+def test_stream_reports_unique_selectors_and_start_tags():
+    _, issues = run(FORM_PAGE, streamed=True)
+    assert [issue["selector"] for issue in issues] == [
+        "#inside-for-label",
+        "ul > li:nth-of-type(1) > input:nth-of-type(1)",
+        "ul > li:nth-of-type(2) > input:nth-of-type(1)",
+        "#blank",
+    ]
+    assert issues[0]["context"] == '<input id="inside-for-label">'
+    soup = BeautifulSoup(FORM_PAGE, "lxml")
+    assert all(len(soup.select(issue["selector"])) == 1 for issue in issues)
+
+
+def test_stream_keeps_only_unresolved_fields_with_bounded_context():
+    html = '<form><label><input></label><input aria-label="x"><input title="' + "t" * 5000 + '"></form>'
+    stats = stream(html).finish()
+    assert len(stats.form_fields) == 1
+    assert len(str(stats.form_fields[0].element)) == CONTEXT_LIMIT + 3
+
+
+def test_stream_prefers_a_unique_id_like_the_selector_service():
+    # The class is the shorter unique selector, the id still wins
+    html = '<body><form><input id="newsletter-signup-email" class="x"></form></body>'
+    stats = stream(html).finish()
+    streamed = stream_selector(stats, stats.form_fields[0].element)
+
+    soup = BeautifulSoup(html, "html.parser")
+    assert streamed == "#newsletter-signup-email"
+    assert streamed == SelectorService(walk_dom(soup)).selector(soup.find("input"))
@@ -0,0 +1,63 @@
+import logging
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from a11y.wcag.http_client import HTTPClient, ValidatorStore
+from a11y.wcag.wcag_analyzers import HTMLAnalyzer
+
+PAGE = '<html lang="en"><body><main><h1>Form</h1><input id="name"></main></body></html>'
+
+
+@pytest_asyncio.fixture
+async def server():
+    seen = []
+
+    async def page(request):
+        seen.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=PAGE, content_type="text/html", headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/", seen
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_page_reuses_stored_result(server, tmp_path):
+    url, seen = server
+    async with HTTPClient(store=ValidatorStore(str(tmp_path))) as client:
+        analyzer = HTMLAnalyzer(Path("."), logging.getLogger("test"), http_client=client)
+        first = await analyzer.analyze(url)
+        second = await analyzer.analyze(url)
+
+    assert first["status"] == "success" and "not_modified" not in first
+    assert second["not_modified"] is True
+    assert second["issues"] == first["issues"]
+    assert seen[1]["If-None-Match"] == '"v1"'
+    assert "gzip" in seen[0]["Accept-Encoding"]
+    assert client.requests == 2 and client.not_modified == 1
+
+    # A new process finds the validators on disk
+    assert ValidatorStore(str(tmp_path)).load(url)["etag"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_missing_result_refetches_unconditionally(server, tmp_path):
+    url, seen = server
+    store = ValidatorStore(str(tmp_path))
+    store.save(url, {"etag": '"v1"', "last_modified": None, "result": None})
+    async with HTTPClient(store=store) as client:
+        result = await HTMLAnalyzer(Path("."), logging.getLogger("test"), http_client=client).analyze(url)
+
+    assert result["status"] == "success" and "not_modified" not in result
+    assert "If-None-Match" in seen[0] and "If-None-Match" not in seen[1]
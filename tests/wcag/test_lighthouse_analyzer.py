@@ -0,0 +1,80 @@
+import json
+import logging
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+from a11y.wcag.json_stream import JSONMemberExtractor
+from a11y.wcag.wcag_analyzers import LighthouseAnalyzer
+
+AUDITS = {"image-alt": {"score": 0, "details": {"items": [{"node": {"snippet": "<img src=\"a\\\"}\">"}}]}}}
+REPORT = {
+    "lighthouseVersion": "12.2.1",
+    "audits": AUDITS,
+    "categories": {"accessibility": {"score": 0.5}},
+    "fullPageScreenshot": {"screenshot": {"data": "A" * 2_000_000}},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_extractor_reads_only_the_requested_member(chunk_size):
+    text = json.dumps(REPORT, indent=2)
+    extractor = JSONMemberExtractor(["audits"])
+    consumed = 0
+    while not extractor.done:
+        extractor.feed(text[consumed:consumed + chunk_size])
+        consumed += chunk_size
+    assert extractor.values == {"audits": AUDITS}
+    # The screenshot after the audits is never scanned
+    assert consumed < len(text) // 2
+
+
+@pytest.mark.asyncio
+async def test_audits_are_streamed_from_stdout(tmp_path):
+    report = tmp_path / "report.json"
+    report.write_text(json.dumps(REPORT))
+    analyzer = LighthouseAnalyzer(Path("."), logging.getLogger("test"))
+
+    cat = [sys.executable, "-c", f"import shutil, sys; shutil.copyfileobj(open({str(report)!r}), sys.stdout)"]
+    returncode, audits, _ = await analyzer._run_lighthouse(cat)
+    assert returncode == 0 and audits == AUDITS
+
+    broken = [sys.executable, "-c", "print('{\"audits\": {\"image-alt\": ')"]
+    returncode, audits, _ = await analyzer._run_lighthouse(broken)
+    assert returncode == 0 and audits is None
+
+
+class FakeToolchain:
+    def __init__(self, project_dir):
+        self.project_dir = project_dir
+
+    def bin_path(self, name):
+        return str(self.project_dir / "node_modules" / ".bin" / name)
+
+
+class FakeDevToolsPool:
+    remote_debugging = True
+
+    @asynccontextmanager
+    async def devtools(self):
+        yield 9222
+
+
+@pytest.mark.asyncio
+async def test_lighthouse_runs_from_the_toolchain_against_the_pooled_browser(tmp_path, monkeypatch):
+    monkeypatch.setattr("a11y.wcag.base_analyzer.get_toolchain", lambda: FakeToolchain(tmp_path))
+    analyzer = LighthouseAnalyzer(Path("."), logging.getLogger("test"), browser_pool=FakeDevToolsPool())
+    commands = []
+
+    async def run_lighthouse(cmd):
+        commands.append(cmd)
+        return 0, AUDITS, b""
+    monkeypatch.setattr(analyzer, "_run_lighthouse", run_lighthouse)
+
+    result = await analyzer.analyze("https://a.example")
+    assert result["status"] == "success" and result["results"] == AUDITS
+    [cmd] = commands
+    assert cmd[0] == str(tmp_path / "node_modules" / ".bin" / "lighthouse")
+    assert cmd[1] == "https://a.example" and cmd[-1] == "--port=9222"
@@ -0,0 +1,138 @@
+import logging
+import os
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from a11y.errors.exceptions import Pa11yWorkerError
+from a11y.wcag.conformance_profile import ConformanceProfile
+from a11y.wcag.page_snapshot import PageSnapshot
+from a11y.wcag.pa11y_worker import Pa11yWorker
+from a11y.wcag.wcag_analyzers import Pa11yAnalyzer
+
+# Speaks the worker protocol: one issue per URL, an error for "broken" URLs,
+# no answer for "slow" ones; cancelled job ids go to $CANCEL_LOG
+FAKE_WORKER = textwrap.dedent("""
+    import json, os, sys
+    print(json.dumps({"event": "ready", "pid": 0}), flush=True)
+    for line in sys.stdin:
+        job = json.loads(line)
+        if job["cmd"] == "cancel":
+            with open(os.environ["CANCEL_LOG"], "a") as log:
+                log.write(f"{job['target']}\\n")
+            continue
+        if job["cmd"] == "run" and "slow" in job["url"]:
+            continue
+        if job["cmd"] == "configure":
+            reply = {"ok": True, "max_pages": job["max_pages"]}
+        elif "broken" in job["url"]:
+            reply = {"ok": False, "error": "net::ERR_NAME_NOT_RESOLVED"}
+        else:
+            issue = {"code": job["options"]["standard"] + ".Guideline1_1", "message": job["url"]}
+            reply = {"ok": True, "issues": [issue], "document_title": "T", "page_url": job["url"],
+                     "readiness": {"stable": True, "waited_ms": 300.0}}
+        print(json.dumps({"id": job["id"], **reply}), flush=True)
+""")
+
+
+class FakeToolchain:
+    def __init__(self, project_dir):
+        self.project_dir = project_dir
+        self.ensured = 0
+
+    def ensure(self):
+        self.ensured += 1
+
+    def node_env(self):
+        return dict(os.environ)
+
+    def bin_path(self, name):
+        return str(self.project_dir / "node_modules" / ".bin" / name)
+
+
+@pytest.fixture
+def worker(tmp_path):
+    script = tmp_path / "worker.py"
+    script.write_text(FAKE_WORKER)
+    return Pa11yWorker(max_pages=2, script_path=script, node_binary=sys.executable,
+                       toolchain=FakeToolchain(tmp_path))
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_in_one_process_with_per_url_results(worker):
+    analyzer = Pa11yAnalyzer(Path("."), logging.getLogger("test"),
+                             conformance=ConformanceProfile(level="A"), pa11y_worker=worker)
+    urls = ["https://a.example", "https://broken.example", "https://c.example"]
+    try:
+        results = await analyzer.analyze_batch(urls)
+        process = worker._process
+        single = await analyzer.analyze("https://d.example")
+        assert worker._process is process
+    finally:
+        await worker.close()
+
+    assert list(results) == urls
+    assert results["https://a.example"]["status"] == "success"
+    assert results["https://a.example"]["readiness"] == {"stable": True, "waited_ms": 300.0}
+    assert results["https://a.example"]["results"] == [
+        {"code": "WCAG2A.Guideline1_1", "message": "https://a.example"}
+    ]
+    assert results["https://broken.example"]["status"] == "error"
+    assert "ERR_NAME_NOT_RESOLVED" in results["https://broken.example"]["error"]
+    assert single["tool"] == "pa11y" and single["results"][0]["message"] == "https://d.example"
+    assert worker.toolchain.ensured == 1
+    assert not worker.is_running
+
+
+@pytest.mark.asyncio
+async def test_command_checks_the_snapshot_with_the_toolchain_pa11y(tmp_path, monkeypatch):
+    toolchain = FakeToolchain(tmp_path)
+    monkeypatch.setattr("a11y.wcag.base_analyzer.get_toolchain", lambda: toolchain)
+    snapshot = PageSnapshot(url="https://a.example", final_url="https://a.example", status=200,
+                            html="<html></html>", html_path=tmp_path / "snapshot.html")
+    analyzer = Pa11yAnalyzer(Path("."), logging.getLogger("test"), snapshot=snapshot)
+    commands = []
+
+    async def run_process(cmd):
+        commands.append(cmd)
+        return 0, b"", b""
+    monkeypatch.setattr(analyzer, "_run_process", run_process)
+
+    result = await analyzer.analyze("https://a.example")
+    assert result["status"] == "success"
+    assert commands[0][0] == str(tmp_path / "node_modules" / ".bin" / "pa11y")
+    assert commands[0][-1] == snapshot.file_url
+    # The snapshot DOM is already stable, no fixed delay on top
+    assert "--wait" not in commands[0]
+
+
+@pytest.mark.asyncio
+async def test_live_page_goes_through_a_worker_instead_of_a_fixed_wait(worker, monkeypatch):
+    monkeypatch.setattr("a11y.wcag.pa11y_analyzer.Pa11yWorker", lambda **kwargs: worker)
+    analyzer = Pa11yAnalyzer(Path("."), logging.getLogger("test"))
+
+    async def run_process(cmd):
+        raise AssertionError("live pages must not be checked by the pa11y command")
+    monkeypatch.setattr(analyzer, "_run_process", run_process)
+
+    result = await analyzer.analyze("https://a.example")
+    assert result["status"] == "success"
+    assert result["readiness"] == {"stable": True, "waited_ms": 300.0}
+    assert not worker.is_running
+
+
+@pytest.mark.asyncio
+async def test_timed_out_job_is_cancelled_in_the_worker(worker, tmp_path, monkeypatch):
+    cancel_log = tmp_path / "cancelled.txt"
+    monkeypatch.setenv("CANCEL_LOG", str(cancel_log))
+    try:
+        with pytest.raises(Pa11yWorkerError, match="timed out"):
+            await worker.run("https://slow.example", {"standard": "WCAG2AA"}, timeout=0.2)
+        # The worker stays usable and has received the cancel by now
+        await worker.run("https://a.example", {"standard": "WCAG2AA"})
+    finally:
+        await worker.close()
+
+    assert cancel_log.read_text().split() == ["2"]
@@ -0,0 +1,109 @@
+import json
+import logging
+from contextlib import asynccontextmanager
+
+import pytest
+
+from a11y.wcag.page_snapshot import PageSnapshot
+from a11y.wcag.wcag_analyzers import HTMLAnalyzer, Pa11yAnalyzer
+
+RENDERED = '<html lang="en"><head><title>T</title></head><body><main><h1>Hi</h1></main></body></html>'
+
+
+class FakeResponse:
+    status = 200
+
+
+class FakePage:
+    url = "https://example.com/start"
+    html = RENDERED
+
+    async def goto(self, url, wait_until, timeout):
+        return FakeResponse()
+
+    async def content(self):
+        return self.html
+
+    async def evaluate(self, script, args=None):
+        if args is None:
+            return {"stable": True, "waited_ms": 300.0}
+        return {"elements": [{"index": 0, "tag": "main", "id": None, "box": [0, 0, 10, 10], "styles": {}}],
+                "total": 2}
+
+
+class FakeContext:
+    def __init__(self, html):
+        self.html = html
+
+    async def new_page(self):
+        page = FakePage()
+        page.html = self.html
+        return page
+
+
+class FakePool:
+    def __init__(self, html=RENDERED):
+        self.options = None
+        self.html = html
+
+    @asynccontextmanager
+    async def context(self, **options):
+        self.options = options
+        yield FakeContext(self.html)
+        with open(options["record_har_path"], "w") as f:
+            f.write("{}")
+
+
+@pytest.mark.asyncio
+async def test_capture_saves_dom_with_base_href(tmp_path):
+    pool = FakePool()
+    snapshot = await PageSnapshot.capture(pool, "https://example.com", tmp_path)
+
+    assert snapshot.final_url == "https://example.com/start"
+    assert snapshot.status == 200
+    assert snapshot.truncated
+    assert snapshot.readiness == {"stable": True, "waited_ms": 300.0}
+    assert snapshot.har_path.exists()
+    saved = snapshot.html_path.read_text()
+    assert '<head><base href="https://example.com/start"><title>' in saved
+    assert snapshot.file_url.startswith("file://")
+    data = json.loads(snapshot.html_path.with_suffix(".json").read_text())
+    assert data["elements"][0]["tag"] == "main"
+
+
+@pytest.mark.asyncio
+async def test_repeated_captures_of_a_url_keep_their_own_files(tmp_path):
+    first, second = [await PageSnapshot.capture(FakePool(), "https://example.com", tmp_path) for _ in range(2)]
+    assert first.html_path != second.html_path
+    assert first.har_path != second.har_path
+    assert first.html_path.exists() and second.html_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_saved_dom_does_not_run_page_scripts_again(tmp_path):
+    # Already rendered: running the script again would replace <main>
+    rendered = ('<html><head><script src="/app.js"></script></head><body onload="init()"><main><h1>Hi</h1>'
+                '<button onclick="buy()">Buy</button></main>'
+                '<script>document.querySelector("main").innerHTML = "<img src=x>";</script></body></html>')
+    snapshot = await PageSnapshot.capture(FakePool(rendered), "https://example.com", tmp_path)
+
+    assert snapshot.html == rendered
+    assert snapshot.html_path.read_text() == (
+        '<html><head><base href="https://example.com/start"></head><body><main><h1>Hi</h1>'
+        '<button>Buy</button></main></body></html>'
+    )
+
+
+@pytest.mark.asyncio
+async def test_analyzers_consume_snapshot(tmp_path):
+    snapshot = await PageSnapshot.capture(FakePool(), "https://example.com", tmp_path)
+    logger = logging.getLogger("test")
+
+    # No network access: the HTML comes from the snapshot
+    result = await HTMLAnalyzer(tmp_path, logger, snapshot=snapshot).analyze("https://example.com")
+    assert result["status"] == "success"
+    assert result["analysis"]["headings"]["h1"] == 1
+    assert result["issues"] == []
+
+    assert Pa11yAnalyzer(tmp_path, logger, snapshot=snapshot)._target("https://example.com") == snapshot.file_url
+    assert Pa11yAnalyzer(tmp_path, logger)._target("https://example.com") == "https://example.com"
@@ -0,0 +1,105 @@
+import pytest
+
+from a11y.wcag.conformance_profile import ConformanceProfile, as_profile
+from a11y.wcag.resource_profiles import RESOURCE_PROFILES, route_resources
+
+
+def test_profile_actions():
+    dom_only, no_media, full = (RESOURCE_PROFILES[name] for name in ("dom-only", "no-media", "full"))
+
+    assert dom_only.action("stylesheet", "https://example.com/site.css") == "stub"
+    assert dom_only.action("font", "https://example.com/a.woff2") == "block"
+    assert no_media.action("stylesheet", "https://example.com/site.css") is None
+    assert no_media.action("image", "https://example.com/a.png") == "stub"
+    assert no_media.action("script", "https://www.google-analytics.com/analytics.js") == "block"
+    assert no_media.action("script", "https://example.com/app.js") is None
+    assert no_media.action("document", "https://example.com/") is None
+    assert full.action("media", "https://example.com/a.mp4") is None
+    assert not full.blocks_anything and full.url_patterns() == []
+
+    patterns = no_media.url_patterns()
+    assert "*.png" in patterns and "*.woff2?*" in patterns and "*.css" not in patterns
+    assert "*://*.doubleclick.net/*" in patterns
+    assert no_media.to_job()["url_patterns"] == patterns
+
+
+def test_asset_rules_raise_the_requested_profile():
+    # Default AA runs color-contrast, which needs the real page
+    assert ConformanceProfile(resources="dom-only").resource_profile("axe").name == "full"
+
+    # Level A keeps link-in-text-block, which needs stylesheets
+    level_a = ConformanceProfile(level="A", resources="dom-only")
+    assert level_a.resource_profile("axe").name == "no-media"
+    assert level_a.resource_profile("pa11y").name == "dom-only"
+    assert level_a.resource_profile().name == "no-media"
+
+    allow = as_profile({"allow_rules": ["image-alt", "label"], "resources": "dom-only"})
+    assert allow.resource_profile("axe").name == "dom-only"
+    # HTML_CodeSniffer still checks contrast at AA
+    assert allow.resource_profile("pa11y").name == "full"
+    assert allow.resource_profile().name == "full"
+
+    denied = ConformanceProfile(
+        resources="no-media",
+        deny_rules=["color-contrast", "WCAG2AA.Principle1.Guideline1_4.1_4_3"]
+    )
+    assert denied.resource_profile().name == "no-media"
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError, match="Unknown resource profile"):
+        ConformanceProfile(resources="images-only")
+
+
+class FakeRequest:
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = FakeRequest(resource_type, url)
+        self.outcome = None
+
+    async def fulfill(self, **response):
+        self.outcome = ("fulfill", response["content_type"])
+
+    async def abort(self, reason):
+        self.outcome = ("abort", reason)
+
+    async def continue_(self):
+        self.outcome = ("continue",)
+
+
+class FakeContext:
+    def __init__(self):
+        self.handler = None
+
+    async def route(self, pattern, handler):
+        self.handler = handler
+
+
+@pytest.mark.asyncio
+async def test_playwright_routes_follow_the_profile():
+    context = FakeContext()
+    await route_resources(context, RESOURCE_PROFILES["dom-only"])
+
+    outcomes = {}
+    for resource_type, url in [("image", "https://example.com/a.png"),
+                               ("stylesheet", "https://example.com/a.css"),
+                               ("media", "https://example.com/a.mp4"),
+                               ("document", "https://example.com/")]:
+        route = FakeRoute(resource_type, url)
+        await context.handler(route)
+        outcomes[resource_type] = route.outcome
+    assert outcomes == {
+        "image": ("fulfill", "image/gif"),
+        "stylesheet": ("fulfill", "text/css"),
+        "media": ("abort", "blockedbyclient"),
+        "document": ("continue",),
+    }
+
+    untouched = FakeContext()
+    await route_resources(untouched, RESOURCE_PROFILES["full"])
+    assert untouched.handler is None
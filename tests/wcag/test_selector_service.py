@@ -0,0 +1,50 @@
+from bs4 import BeautifulSoup
+
+from a11y.wcag.dom_walker import walk_dom
+from a11y.wcag.selector_service import SelectorService, css_escape
+
+PAGE = """<html><body>
+<main>
+  <form class="row"><input class="field" id="dup"><input class="field"></form>
+  <form class="row"><input class="field" id="dup"><input class="field unique"></form>
+  <section><input id="1st" class="field"></section>
+</main>
+</body></html>"""
+
+
+def selectors_for(html):
+    soup = BeautifulSoup(html, "html.parser")
+    service = SelectorService(walk_dom(soup))
+    inputs = soup.find_all("input")
+    return soup, service, [service.selector(element) for element in inputs]
+
+
+def test_selectors_are_unique_and_shortest():
+    soup, _, selectors = selectors_for(PAGE)
+    assert selectors == [
+        "main > form:nth-of-type(1) > input:nth-of-type(1)",
+        "main > form:nth-of-type(1) > input:nth-of-type(2)",
+        "main > form:nth-of-type(2) > input:nth-of-type(1)",
+        ".unique",
+        "#\\31 st",
+    ]
+    for element, selector in zip(soup.find_all("input"), selectors):
+        assert soup.select(selector) == [element]
+
+
+def test_selectors_are_memoized_per_element():
+    soup, service, selectors = selectors_for(PAGE)
+    first = soup.find("input")
+    assert service.selector(first) is selectors[0]
+    assert id(first.parent) in service._selectors
+
+
+def test_css_escape():
+    assert css_escape("plain-id_1") == "plain-id_1"
+    assert css_escape("a.b:c") == "a\\.b\\:c"
+    assert css_escape("-2x") == "-\\32 x"
+
+
+def test_unique_id_wins_over_shorter_tag():
+    soup, _, selectors = selectors_for('<main><input id="only-input" class="x"></main>')
+    assert selectors == ["#only-input"]
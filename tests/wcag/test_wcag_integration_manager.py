@@ -0,0 +1,227 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from a11y.wcag.analyzer_registry import ANALYZERS, AnalyzerSpec
+from a11y.wcag.http_client import HTTPClient, ValidatorStore
+from a11y.wcag.wcag_integration_manager import WCAGIntegrationManager
+
+
+class SlowAnalyzer:
+    def __init__(self, delay, message):
+        self.delay = delay
+        self.message = message
+        self.cancelled = False
+
+    async def analyze(self, url):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return {"status": "success", "issues": [{"message": self.message}]}
+
+
+class FailingAnalyzer:
+    async def analyze(self, url):
+        raise RuntimeError("tool missing")
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return WCAGIntegrationManager(output_dir=str(tmp_path / "results"), analyzer_timeout=0.5)
+
+
+@pytest.mark.asyncio
+async def test_analyzers_run_concurrently_and_stragglers_are_cancelled(manager):
+    straggler = SlowAnalyzer(5, "never")
+    analyzers = {
+        "first": SlowAnalyzer(0.2, "first"),
+        "straggler": straggler,
+        "broken": FailingAnalyzer(),
+        "second": SlowAnalyzer(0.2, "second"),
+    }
+
+    started = time.monotonic()
+    results = await manager._run_all_analyzers(analyzers, "https://example.com")
+    elapsed = time.monotonic() - started
+
+    assert [(r["tool"], r["message"]) for r in results] == [("first", "first"), ("second", "second")]
+    assert straggler.cancelled
+    assert elapsed < 1.5
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = WCAGIntegrationManager(output_dir=str(tmp_path / "results"), max_concurrent_analyzers=1)
+    analyzers = {name: SlowAnalyzer(0.2, name) for name in ("a", "b", "c")}
+
+    started = time.monotonic()
+    results = await manager._run_all_analyzers(analyzers, "https://example.com")
+
+    assert len(results) == 3
+    assert time.monotonic() - started >= 0.6
+
+
+@pytest_asyncio.fixture
+async def etag_server():
+    """URL of a page with a fixed ETag and the methods of all requests made to it"""
+    methods = []
+
+    async def page(request):
+        methods.append(request.method)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text="<html><body><h1>Hi</h1></body></html>", content_type="text/html",
+                            headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    yield f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/", methods
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_page_skips_snapshot_and_analyzers(etag_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    etag_server, methods = etag_server
+    captures = []
+
+    async def capture_snapshot(url, snapshot_dir):
+        captures.append(url)
+        return None
+
+    async with HTTPClient(store=ValidatorStore(str(tmp_path / "validators"))) as client:
+        manager = WCAGIntegrationManager(output_dir=str(tmp_path / "results"), http_client=client, analyzers=[])
+        monkeypatch.setattr(manager, "_capture_snapshot", capture_snapshot)
+        first = await manager.analyze_url(etag_server)
+        second = await manager.analyze_url(etag_server)
+
+        # A different rule selection has its own stored analysis
+        other = WCAGIntegrationManager(output_dir=str(tmp_path / "results"), http_client=client,
+                                       analyzers=[], conformance={"level": "A"})
+        monkeypatch.setattr(other, "_capture_snapshot", capture_snapshot)
+        third = await other.analyze_url(etag_server)
+
+    assert "not_modified" not in first
+    assert second["not_modified"] is True and second["summary"] == first["summary"]
+    assert "not_modified" not in third
+    assert captures == [etag_server, etag_server]
+    assert client.not_modified == 1
+    # The check before rendering never downloads the page itself
+    assert methods == ["HEAD"] * 3
+
+
+@pytest.mark.asyncio
+async def test_not_modified_without_stored_analysis_asks_once_more(etag_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    etag_server, methods = etag_server
+    store = ValidatorStore(str(tmp_path / "validators"))
+
+    async with HTTPClient(store=store) as client:
+        manager = WCAGIntegrationManager(output_dir=str(tmp_path / "results"), http_client=client, analyzers=[])
+        # Validators are known, but the analysis stored with them is gone
+        store.save(manager._analysis_key(etag_server), {"etag": '"v1"', "last_modified": None, "result": None})
+        stored, validators = await manager._revalidate(etag_server)
+
+    assert stored is None
+    assert validators["ETag"] == '"v1"'
+    assert methods == ["HEAD", "HEAD"]
+
+
+@pytest.mark.asyncio
+async def test_skipped_analyzers_are_reported_in_the_result(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(ANALYZERS, "fake", AnalyzerSpec(
+        "fake", "html_analyzer", "HTMLAnalyzer", python_modules=("no_such_module",),
+    ))
+    manager = WCAGIntegrationManager(output_dir=str(tmp_path / "results"), analyzers=["fake"])
+
+    assert manager.analyzer_names == []
+    result = await manager.process_results([], "https://example.com")
+    assert result["skipped_analyzers"] == {"fake": ["no_such_module"]}
+
+
+class FakePage:
+    url = "https://example.com/"
+
+    async def goto(self, url, wait_until, timeout):
+        return None
+
+    async def content(self):
+        return "<html><head></head><body><h1>Hi</h1></body></html>"
+
+    async def evaluate(self, script, args=None):
+        return {"stable": True} if args is None else {"elements": [], "total": 0}
+
+
+class FakeContext:
+    async def new_page(self):
+        return FakePage()
+
+
+class FakePool:
+    @asynccontextmanager
+    async def context(self, **options):
+        yield FakeContext()
+        with open(options["record_har_path"], "w") as f:
+            f.write("{}")
+
+
+async def analyze_with_snapshots(manager, runs):
+    """Runs analyze_url and returns the snapshot files seen while analyzers ran"""
+    capture = manager._capture_snapshot
+    seen = []
+
+    async def run_all_analyzers(analyzers, url):
+        seen.append([snapshot.html_path.exists(), snapshot.har_path.exists()])
+        return []
+
+    async def capture_snapshot(url, snapshot_dir):
+        nonlocal snapshot
+        snapshot = await capture(url, snapshot_dir)
+        return snapshot
+
+    snapshot = None
+    manager._capture_snapshot = capture_snapshot
+    manager._run_all_analyzers = run_all_analyzers
+    for _ in range(runs):
+        await manager.analyze_url("https://example.com/")
+    return seen, snapshot
+
+
+@pytest.mark.asyncio
+async def test_snapshots_are_removed_once_the_analyzers_finish(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    async with HTTPClient() as client:
+        manager = WCAGIntegrationManager(output_dir=str(tmp_path / "results"), browser_pool=FakePool(),
+                                         http_client=client, analyzers=[])
+        seen, snapshot = await analyze_with_snapshots(manager, runs=2)
+
+    assert seen == [[True, True], [True, True]]
+    assert not snapshot.html_path.parent.exists()
+    assert not (tmp_path / "results" / "snapshots").exists()
+
+
+@pytest.mark.asyncio
+async def test_kept_snapshots_are_capped(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    async with HTTPClient() as client:
+        manager = WCAGIntegrationManager(output_dir=str(tmp_path / "results"), browser_pool=FakePool(),
+                                         http_client=client, analyzers=[], keep_snapshots=2)
+        _, snapshot = await analyze_with_snapshots(manager, runs=3)
+
+    kept = list((tmp_path / "results" / "snapshots").iterdir())
+    assert len(kept) == 2
+    assert snapshot.html_path.parent in kept
+    assert snapshot.html_path.exists() and snapshot.har_path.exists()